@@ -2,10 +2,13 @@ from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 from flask_migrate import Migrate
+from jinja2 import FileSystemBytecodeCache
 import os
 
+from .replica import BIND_REPLICA, SesionEnrutada
+
 # Extensiones (una sola instancia global)
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": SesionEnrutada})
 login_manager = LoginManager()
 migrate = Migrate()
 
@@ -20,11 +23,70 @@ def create_app():
     app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///actas.db')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+    # Réplica de sólo lectura opcional (listados, búsqueda, exports, dashboard; ver replica.py).
+    # Sin DATABASE_URL_REPLICA todo va al primario.
+    if os.environ.get('DATABASE_URL_REPLICA'):
+        app.config['SQLALCHEMY_BINDS'] = {BIND_REPLICA: os.environ['DATABASE_URL_REPLICA']}
+
+    # Perfil SQLite aplicado a cada conexión (ver perfil_sqlite.py); {} lo desactiva
+    from .perfil_sqlite import PRAGMAS_DEFECTO
+    app.config['SQLITE_PRAGMAS'] = dict(PRAGMAS_DEFECTO)
+
     # Archivos subidos (firmas)
     app.config['UPLOAD_FOLDER'] = os.path.join(app.root_path, 'static', 'uploads', 'firmas')
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
     app.config['MAX_CONTENT_LENGTH'] = 4 * 1024 * 1024  # 4 MB
 
+    # Estáticos con fingerprint y caché inmutable (ver estaticos.py).
+    # FRONT_PROXY: '' (Flask envía los archivos) | 'nginx' (X-Accel-Redirect) | 'apache' (X-Sendfile)
+    app.config['STATIC_FINGERPRINT'] = os.environ.get('STATIC_FINGERPRINT', '1') != '0'
+    app.config['FRONT_PROXY'] = os.environ.get('FRONT_PROXY', '').lower()
+    app.config['X_ACCEL_FIRMAS'] = os.environ.get('X_ACCEL_FIRMAS', '/_firmas/')  # location interna de nginx
+    app.config['USE_X_SENDFILE'] = app.config['FRONT_PROXY'] == 'apache'
+
+    # Hash de contraseñas (formato werkzeug: "scrypt:N:r:p" | "pbkdf2:sha256:iteraciones").
+    # Los hashes existentes se actualizan solos en el siguiente login exitoso.
+    app.config['PASSWORD_HASH_METHOD'] = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt')
+
+    # Caché de usuarios del user_loader (por worker)
+    app.config['USER_CACHE_SIZE'] = int(os.environ.get('USER_CACHE_SIZE', 1024))
+    # segundos; es también lo que tarda este worker en ver un cambio de clave/rol hecho en otro
+    app.config['USER_CACHE_TTL'] = float(os.environ.get('USER_CACHE_TTL', 60))
+
+    # Caché de PDFs renderizados (clave = hash del contenido del acta) y días sin uso tras los que se borran
+    app.config['PDF_CACHE_FOLDER'] = os.environ.get('PDF_CACHE_FOLDER', os.path.join(app.instance_path, 'pdf_cache'))
+    app.config['PDF_CACHE_DIAS'] = int(os.environ.get('PDF_CACHE_DIAS', 30))
+
+    # Instrumentación (ver metricas.py): umbral del log de queries lentas y token de /metrics.
+    # Sin METRICS_TOKEN, /metrics exige sesión de superusuario.
+    app.config['SLOW_QUERY_MS'] = float(os.environ.get('SLOW_QUERY_MS', 200))
+    app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN')
+
+    # Auditoría (ver auditoria.py): entradas por INSERT, máximo de segundos que se acumulan, tope de la cola
+    # e intentos por lote si la BD falla (espera de 0,5 s que se duplica en cada intento)
+    app.config['AUDITORIA_LOTE'] = int(os.environ.get('AUDITORIA_LOTE', 200))
+    app.config['AUDITORIA_INTERVALO'] = float(os.environ.get('AUDITORIA_INTERVALO', 1.0))
+    app.config['AUDITORIA_MAX_COLA'] = int(os.environ.get('AUDITORIA_MAX_COLA', 10000))
+    app.config['AUDITORIA_REINTENTOS'] = int(os.environ.get('AUDITORIA_REINTENTOS', 5))
+
+    # Trabajos en segundo plano (ver trabajos.py): hilos por worker de la app (0 = sólo `flask trabajos worker`),
+    # segundos entre revisiones de la cola, segundos sin latido tras los que se da por muerto un trabajo
+    # en ejecución (late cada 30 s) y retención de resultados
+    app.config['TRABAJOS_HILOS'] = int(os.environ.get('TRABAJOS_HILOS', 1))
+    app.config['TRABAJOS_INTERVALO'] = float(os.environ.get('TRABAJOS_INTERVALO', 2.0))
+    app.config['TRABAJOS_TIMEOUT'] = int(os.environ.get('TRABAJOS_TIMEOUT', 300))
+    app.config['TRABAJOS_RETENCION_DIAS'] = int(os.environ.get('TRABAJOS_RETENCION_DIAS', 7))
+    app.config['TRABAJOS_FOLDER'] = os.environ.get('TRABAJOS_FOLDER', os.path.join(app.instance_path, 'trabajos'))
+
+    # Export .xlsx: hasta este número de filas se genera en la request; sobre eso va a la cola de trabajos
+    app.config['EXPORT_XLSX_SINCRONO_MAX'] = int(os.environ.get('EXPORT_XLSX_SINCRONO_MAX', 20000))
+
+    # Caché de bytecode de Jinja en disco, compartido por los workers (ver `flask precompilar-plantillas`).
+    # La clave incluye el checksum del fuente: una plantilla modificada se recompila sola.
+    app.config['JINJA_CACHE_FOLDER'] = os.environ.get('JINJA_CACHE_FOLDER', os.path.join(app.instance_path, 'jinja_cache'))
+    os.makedirs(app.config['JINJA_CACHE_FOLDER'], exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(app.config['JINJA_CACHE_FOLDER'])
+
     # Inicializar extensiones
     db.init_app(app)
     login_manager.init_app(app)
@@ -33,12 +95,34 @@ def create_app():
     # Importar modelos y rutas DESPUÉS de init_app, para evitar import circular
     with app.app_context():
         from . import models  # registra modelos
-        from .models import Usuario
+        from .models import cache_usuarios, cargar_usuario
         from .routes import bp as main_bp
+        from .comandos import registrar_comandos
+        from .perfil_sqlite import aplicar_perfil_sqlite
+        from .replica import configurar_replica
+        from .metricas import instrumentar_app, instrumentar_engine
+        from .estaticos import init_estaticos
+        from .auditoria import init_auditoria
+        from .trabajos import init_trabajos
+        from .condicional import init_condicional
         app.register_blueprint(main_bp)
+        registrar_comandos(app)
+        instrumentar_app(app)
+        init_estaticos(app)
+        init_condicional(app)
+        init_auditoria(app, db.engine)
+        init_trabajos(app)
+        for engine in db.engines.values():
+            aplicar_perfil_sqlite(app, engine)
+            instrumentar_engine(app, engine)
+        if BIND_REPLICA in db.engines:
+            configurar_replica(db.engines[BIND_REPLICA])
+
+        cache_usuarios.maxsize = app.config['USER_CACHE_SIZE']
+        cache_usuarios.ttl = app.config['USER_CACHE_TTL']
 
         @login_manager.user_loader
         def load_user(user_id):
-            return Usuario.query.get(int(user_id))
+            return cargar_usuario(int(user_id))
 
     return app
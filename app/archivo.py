@@ -0,0 +1,113 @@
+# app/archivo.py
+from datetime import datetime
+
+from . import db
+from .auditoria import registrar
+from .models import Acta, ActaArchivada, PeriodoRemunerativo, invalidar_cache_periodo
+
+LOTE_ARCHIVO = 1000  # actas movidas por transacción
+
+
+class ErrorArchivo(Exception):
+    pass
+
+
+def _periodo(anio: int, mes: int) -> PeriodoRemunerativo:
+    p = PeriodoRemunerativo.query.filter_by(anio=anio, mes=mes).first()
+    if p is None:
+        raise ErrorArchivo(f"No existe el período {anio}-{mes:02d}.")
+    return p
+
+
+def modelo_periodo(anio, mes):
+    """Acta o ActaArchivada según dónde viven las actas del período (Acta si no hay período)."""
+    if not (anio and mes):
+        return Acta
+    archivado = db.session.execute(
+        db.select(PeriodoRemunerativo.archivado_en)
+        .where(PeriodoRemunerativo.anio == anio, PeriodoRemunerativo.mes == mes)
+    ).scalar()
+    return ActaArchivada if archivado else Acta
+
+
+def consultas_actas(filtros: dict):
+    """
+    Queries de actas con los filtros del listado: con período, sólo la tabla donde vive;
+    sin período, actas y después el archivo.
+    """
+    if filtros.get("periodo_anio") and filtros.get("periodo_mes"):
+        return [modelo_periodo(filtros["periodo_anio"], filtros["periodo_mes"]).query_filtrada(**filtros)]
+    return [Acta.query_filtrada(**filtros), ActaArchivada.query_filtrada(**filtros)]
+
+
+def acta_o_404(acta_id: int):
+    """Acta vigente o, si ya se archivó, su copia en actas_archivo (mismo id)."""
+    return db.session.get(Acta, acta_id) or ActaArchivada.query.get_or_404(acta_id)
+
+
+def _mover(origen, destino, anio, mes, lote, progreso):
+    """
+    Copia las actas del período de `origen` a `destino` y las borra de `origen`, por lotes.
+    Cada lote es su propia transacción (INSERT ... SELECT + DELETE por id), así que un corte
+    deja el período repartido pero sin duplicados ni pérdidas; volver a correr lo termina.
+    En la auditoría el acta conserva tabla e id ("actas"); se registra el cambio de `archivada`.
+    """
+    archivada = destino is ActaArchivada.__table__
+    columnas = [c.name for c in origen.columns]
+    movidas = 0
+    while True:
+        ids = db.session.scalars(
+            db.select(origen.c.id)
+            .where(origen.c.periodo_anio == anio, origen.c.periodo_mes == mes)
+            .order_by(origen.c.id).limit(lote).with_for_update()
+        ).all()
+        if not ids:
+            break
+        db.session.execute(destino.insert().from_select(
+            columnas, db.select(*[origen.c[c] for c in columnas]).where(origen.c.id.in_(ids))
+        ))
+        db.session.execute(origen.delete().where(origen.c.id.in_(ids)))
+        registrar(db.session, Acta.__tablename__, ids, "update", {"archivada": [not archivada, archivada]})
+        db.session.commit()
+        movidas += len(ids)
+        if progreso:
+            progreso(movidas)
+    return movidas
+
+
+def archivar_periodo(anio: int, mes: int, lote: int = LOTE_ARCHIVO, progreso=None) -> int:
+    """
+    Mueve las actas de un período cerrado a actas_archivo y lo marca archivado.
+    Los conteos de resumen_actas no cambian (cuenta ambas tablas). Devuelve cuántas se movieron.
+    """
+    p = _periodo(anio, mes)
+    if p.estado != "cerrado":
+        raise ErrorArchivo(f"El período {anio}-{mes:02d} está abierto; ciérralo antes de archivarlo.")
+    if db.engine.dialect.name == "sqlite":
+        # SQLite da a la próxima acta max(actas.id) + 1: si después de mover lo que queda en actas
+        # no supera a todo lo archivado, esa acta nueva reutilizaría el id de una archivada
+        del_periodo = (Acta.periodo_anio == anio) & (Acta.periodo_mes == mes)
+        queda = db.session.scalar(db.select(db.func.max(Acta.id)).where(~del_periodo)) or 0
+        tope = max(db.session.scalar(db.select(db.func.max(Acta.id)).where(del_periodo)) or 0,
+                   db.session.scalar(db.select(db.func.max(ActaArchivada.id))) or 0)
+        if queda < tope:
+            raise ErrorArchivo(f"El período {anio}-{mes:02d} tiene actas más recientes que las vigentes; "
+                               "no se puede archivar aún.")
+    # primero se marca: mientras se mueve, el listado del período lee de actas_archivo, que sólo
+    # gana filas (como en desarchivar_periodo); un corte deja la marca y volver a correr termina
+    if p.archivado_en is None:
+        p.archivado_en = datetime.utcnow()
+        db.session.commit()
+        invalidar_cache_periodo()
+    return _mover(Acta.__table__, ActaArchivada.__table__, anio, mes, lote, progreso)
+
+
+def desarchivar_periodo(anio: int, mes: int, lote: int = LOTE_ARCHIVO, progreso=None) -> int:
+    """Devuelve las actas del período a la tabla actas (p. ej. para reabrirlo)."""
+    p = _periodo(anio, mes)
+    # primero se desmarca: mientras se mueve, el listado del período lee de actas
+    p.archivado_en = None
+    db.session.commit()
+    movidas = _mover(ActaArchivada.__table__, Acta.__table__, anio, mes, lote, progreso)
+    invalidar_cache_periodo()
+    return movidas
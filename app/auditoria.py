@@ -0,0 +1,224 @@
+# app/auditoria.py
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.exc import OperationalError
+
+from .models import Acta, Auditoria, PeriodoRemunerativo, Usuario
+from .replica import SesionEnrutada
+
+log = logging.getLogger(__name__)
+
+AUDITADOS = (Acta, PeriodoRemunerativo, Usuario)
+OCULTOS = {"password_hash"}  # se registra que cambió, no el valor
+CLAVE_PENDIENTES = "auditoria_pendiente"  # en session.info, hasta el commit
+_FIN = object()  # sentinel en la cola: el hilo escritor escribe lo anterior y termina
+
+
+# =========================
+# Captura (eventos de la sesión)
+# =========================
+def _cambios(obj, accion):
+    estado = sa_inspect(obj)
+    if accion != "update":
+        # sólo lo ya cargado en el objeto (sin queries en pleno flush)
+        return {
+            a.key: "***" if a.key in OCULTOS else estado.dict[a.key]
+            for a in estado.mapper.column_attrs if estado.dict.get(a.key) is not None
+        }
+    cambios = {}
+    for a in estado.mapper.column_attrs:
+        hist = estado.attrs[a.key].history
+        if not hist.has_changes():
+            continue
+        antes = hist.deleted[0] if hist.deleted else None
+        despues = hist.added[0] if hist.added else None
+        if antes != despues:
+            cambios[a.key] = ["***", "***"] if a.key in OCULTOS else [antes, despues]
+    return cambios
+
+
+def _contexto():
+    """(usuario_id, origen) de quien hace el cambio."""
+    if not has_request_context():
+        return None, "cli"
+    # el usuario ya cargado por Flask-Login; leer current_user aquí podría disparar una query en pleno flush
+    usuario = g.get("_login_user")
+    return getattr(usuario, "id", None), (request.endpoint or request.path)[:80]
+
+
+def _agregar(session, entradas):
+    # entradas: [(tabla, registro_id, accion, cambios)]; quedan en la sesión hasta el commit
+    usuario_id, origen = _contexto()
+    ahora = datetime.utcnow()
+    session.info.setdefault(CLAVE_PENDIENTES, []).extend(
+        dict(creado_en=ahora, usuario_id=usuario_id, origen=origen, tabla=tabla, registro_id=rid,
+             accion=accion, cambios=json.dumps(cambios, default=str, ensure_ascii=False))
+        for (tabla, rid, accion, cambios) in entradas
+    )
+
+
+def registrar(session, tabla, ids, accion, cambios):
+    """Para cambios hechos con UPDATE/DELETE masivos (no pasan por los eventos del ORM)."""
+    _agregar(session, [(tabla, i, accion, cambios) for i in ids])
+
+
+@event.listens_for(SesionEnrutada, "after_flush")
+def _capturar(session, _flush_context):
+    # en after_flush los objetos nuevos ya tienen id y el historial de atributos sigue disponible
+    entradas = []
+    for coleccion, accion in ((session.new, "insert"), (session.dirty, "update"), (session.deleted, "delete")):
+        for obj in coleccion:
+            if not isinstance(obj, AUDITADOS):
+                continue
+            cambios = _cambios(obj, accion)
+            if cambios:
+                entradas.append((obj.__table__.name, obj.id, accion, cambios))
+    if entradas:
+        _agregar(session, entradas)
+
+
+@event.listens_for(SesionEnrutada, "after_commit")
+def _encolar(session):
+    pendientes = session.info.pop(CLAVE_PENDIENTES, None)
+    if pendientes:
+        current_app.extensions["auditoria"].encolar(pendientes)
+
+
+@event.listens_for(SesionEnrutada, "after_rollback")
+def _descartar(session):
+    session.info.pop(CLAVE_PENDIENTES, None)
+
+
+# =========================
+# Escritura por lotes (fuera de la request)
+# =========================
+class EscritorAuditoria:
+    """
+    Cola en memoria + hilo que inserta por lotes: hasta `lote` entradas o lo acumulado en
+    `intervalo` segundos, en una sola transacción. El commit de la request no espera esa
+    escritura. Si la cola se llena, encolar bloquea (mejor lento que perder registros).
+    Un lote que falla por la BD (bloqueada, caída) se reintenta `reintentos` veces con espera
+    creciente; sólo entonces se descarta, con el error en el log.
+    Un proceso que termina vacía la cola antes de salir (atexit).
+    """
+
+    def __init__(self, engine, lote=200, intervalo=1.0, max_cola=10000, reintentos=5, espera=0.5):
+        self.engine = engine
+        self.lote = lote
+        self.intervalo = intervalo
+        self.max_cola = max_cola
+        self.reintentos = reintentos
+        self.espera = espera
+        self._cola = queue.Queue(max_cola)
+        self._hilo = None
+        self._pid = None
+        self._lock = threading.Lock()
+        atexit.register(self.vaciar)
+
+    def encolar(self, entradas):
+        self._asegurar_hilo()
+        for e in entradas:
+            self._cola.put(e)
+
+    def _asegurar_hilo(self):
+        if self._pid == os.getpid() and self._hilo.is_alive():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                # proceso hijo (fork de gunicorn): la cola heredada es del padre
+                self._cola = queue.Queue(self.max_cola)
+                self._pid = os.getpid()
+                self._hilo = None
+            if self._hilo is None or not self._hilo.is_alive():
+                self._hilo = threading.Thread(target=self._bucle, name="auditoria", daemon=True)
+                self._hilo.start()
+
+    def _bucle(self):
+        while True:
+            e = self._cola.get()
+            if e is _FIN:
+                return
+            lote = [e]
+            limite = time.monotonic() + self.intervalo
+            while len(lote) < self.lote:
+                restante = limite - time.monotonic()
+                if restante <= 0:
+                    break
+                try:
+                    e = self._cola.get(timeout=restante)
+                except queue.Empty:
+                    break
+                if e is _FIN:
+                    self._escribir(lote)
+                    return
+                lote.append(e)
+            self._escribir(lote)
+
+    def _escribir(self, lote):
+        espera = self.espera
+        for intento in range(1, self.reintentos + 1):
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(Auditoria.__table__.insert(), lote)
+                return True
+            except OperationalError as e:
+                # BD bloqueada o inaccesible: puede ser pasajero, se reintenta
+                error = e
+                if intento < self.reintentos:
+                    log.warning("Auditoría: falló la escritura de %d entradas (intento %d/%d): %s",
+                                len(lote), intento, self.reintentos, e.orig)
+                    time.sleep(espera)
+                    espera *= 2
+            except Exception as e:
+                # error de datos: reintentar no lo arregla
+                error = e
+                break
+        log.error("No se pudieron escribir %d entradas de auditoría; se descartan", len(lote), exc_info=error)
+        return False
+
+    def vaciar(self, timeout=None):
+        """
+        Escribe todo lo encolado antes de volver (salida del proceso, tests, CLI): detiene el
+        hilo con el sentinel (queda detrás de lo pendiente) y espera que termine; lo que quede
+        (hilo caído o timeout) se escribe en el hilo actual. Un encolar posterior lo relanza.
+        """
+        if self._pid != os.getpid():
+            return  # nada encolado en este proceso (o la cola es del padre)
+        with self._lock:
+            hilo = self._hilo
+            if hilo is not None and hilo.is_alive():
+                self._cola.put(_FIN)
+                hilo.join(timeout)
+        lote = []
+        while True:
+            try:
+                e = self._cola.get_nowait()
+            except queue.Empty:
+                break
+            if e is _FIN:
+                continue
+            lote.append(e)
+            if len(lote) >= self.lote:
+                self._escribir(lote)
+                lote = []
+        if lote:
+            self._escribir(lote)
+
+
+def init_auditoria(app, engine):
+    app.extensions["auditoria"] = EscritorAuditoria(
+        engine,
+        lote=app.config["AUDITORIA_LOTE"],
+        intervalo=app.config["AUDITORIA_INTERVALO"],
+        max_cola=app.config["AUDITORIA_MAX_COLA"],
+        reintentos=app.config["AUDITORIA_REINTENTOS"],
+    )
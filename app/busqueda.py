@@ -0,0 +1,98 @@
+# app/busqueda.py
+import re
+
+from sqlalchemy import DDL, event, or_, text
+
+from . import db
+from .models import Acta, ActaArchivada
+
+# Columnas indexadas (mismo orden en la tabla FTS y en los triggers)
+COLUMNAS_FTS = ["nombres", "apellidos", "rut", "correlativo", "cargo", "observaciones"]
+
+_cols = ", ".join(COLUMNAS_FTS)
+_new = ", ".join(f"new.{c}" for c in COLUMNAS_FTS)
+_old = ", ".join(f"old.{c}" for c in COLUMNAS_FTS)
+
+
+def ddl_fts(tabla: str):
+    """
+    Tabla FTS5 "external content" de `tabla` (<tabla>_fts): guarda sólo el índice, el texto se lee
+    de la tabla. Los triggers la mantienen al día también ante INSERT/UPDATE masivos (sin pasar por el ORM).
+    """
+    fts = f"{tabla}_fts"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({_cols}, content='{tabla}', "
+        "content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {tabla} BEGIN "
+        f"INSERT INTO {fts}(rowid, {_cols}) VALUES (new.id, {_new}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {tabla} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {_cols}) VALUES ('delete', old.id, {_old}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {_cols} ON {tabla} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {_cols}) VALUES ('delete', old.id, {_old}); "
+        f"INSERT INTO {fts}(rowid, {_cols}) VALUES (new.id, {_new}); END",
+    ]
+
+
+# db.create_all() (desarrollo) también crea los índices; en BDs existentes lo hacen las migraciones
+for _modelo in (Acta, ActaArchivada):
+    for _sql in ddl_fts(_modelo.__table__.name):
+        event.listen(_modelo.__table__, "after_create", DDL(_sql).execute_if(dialect="sqlite"))
+
+
+_RE_RUT = re.compile(r"^[\d.\-kK\s]+$")
+
+
+def expresion_fts(texto: str) -> str:
+    """'ana pér' -> '"ana"* "pér"*' (AND de prefijos; sin operadores FTS del usuario)."""
+    return " ".join(f'"{t}"*' for t in re.findall(r"\w+", texto or ""))
+
+
+def _recientes(filtro, cesfam, limite):
+    # misma búsqueda en actas y en el archivo; se mezclan por fecha de creación
+    actas = []
+    for modelo in (Acta, ActaArchivada):
+        q = modelo.query.filter(filtro(modelo))
+        if cesfam:
+            q = q.filter(modelo.cesfam == cesfam)
+        actas += q.order_by(modelo.creado_en.desc()).limit(limite).all()
+    return sorted(actas, key=lambda a: a.creado_en, reverse=True)[:limite]
+
+
+def buscar_actas(texto: str, cesfam=None, limite: int = 50):
+    """
+    Actas que calzan con `texto`: primero las vigentes y después las archivadas, cada grupo por
+    relevancia (bm25).
+    En SQLite usa actas_fts / actas_archivo_fts; en otros motores cae a ILIKE (sin ranking).
+    """
+    expr = expresion_fts(texto)
+    if not expr:
+        return []
+
+    # Parece un RUT (sólo dígitos, puntos, guion, K): seek en rut_normalizado, sin FTS
+    if _RE_RUT.match(texto) and sum(ch.isdigit() for ch in texto) >= 4:
+        return _recientes(lambda m: Acta.filtro_rut(m.rut_normalizado, texto), cesfam, limite)
+
+    if db.engine.dialect.name != "sqlite":
+        patron = "%" + re.sub(r"([\\%_])", r"\\\1", texto) + "%"  # % y _ del usuario son literales
+        return _recientes(lambda m: or_(*[getattr(m, c).ilike(patron, escape="\\") for c in COLUMNAS_FTS]),
+                          cesfam, limite)
+
+    # bm25 depende de las estadísticas de cada índice (IDF, largo medio), así que los puntajes de
+    # actas_fts y actas_archivo_fts no se comparan: cada fuente se ordena por su propio rango y las
+    # vigentes van antes que las archivadas.
+    resultado = []
+    for modelo in (Acta, ActaArchivada):
+        faltan = limite - len(resultado)
+        if faltan <= 0:
+            break
+        t = modelo.__table__.name
+        sql = (
+            f"SELECT {t}.id FROM {t}_fts JOIN {t} ON {t}.id = {t}_fts.rowid WHERE {t}_fts MATCH :expr"
+            + (f" AND {t}.cesfam = :cesfam" if cesfam else "")
+            + f" ORDER BY bm25({t}_fts) LIMIT :limite"
+        )
+        ids = db.session.scalars(text(sql), {"expr": expr, "cesfam": cesfam, "limite": faltan}).all()
+        if ids:
+            por_id = {a.id: a for a in modelo.query.filter(modelo.id.in_(ids))}
+            resultado += [por_id[i] for i in ids if i in por_id]
+    return resultado
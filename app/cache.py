@@ -0,0 +1,69 @@
+# app/cache.py
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Caché LRU acotado, con expiración por TTL, para usar dentro de un proceso (worker).
+    - maxsize: al superarlo se descarta la entrada menos usada.
+    - ttl: segundos de vida de cada entrada.
+    - Contadores hits/misses/evictions para medir si el caché sirve.
+    Thread-safe (un lock simple; las operaciones son O(1)).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._datos = OrderedDict()  # clave -> (expira_en, valor)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, clave, default=None):
+        ahora = time.monotonic()
+        with self._lock:
+            item = self._datos.get(clave)
+            if item is None or item[0] <= ahora:
+                if item is not None:
+                    del self._datos[clave]
+                self.misses += 1
+                return default
+            self._datos.move_to_end(clave)
+            self.hits += 1
+            return item[1]
+
+    def set(self, clave, valor) -> None:
+        with self._lock:
+            self._datos[clave] = (time.monotonic() + self.ttl, valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.maxsize:
+                self._datos.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, clave) -> None:
+        with self._lock:
+            self._datos.pop(clave, None)
+
+    def peek(self, clave, default=None):
+        """Lee sin contar hit/miss ni tocar el orden LRU (ni mirar el TTL)."""
+        item = self._datos.get(clave)
+        return default if item is None else item[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._datos.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._datos),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / total, 4) if total else None,
+        }
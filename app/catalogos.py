@@ -0,0 +1,147 @@
+# app/catalogos.py
+from flask import url_for
+from sqlalchemy import event
+
+from . import db
+from .cache import TTLCache
+from .forms import TIPO_CONTRATO_CHOICES, ESTABLECIMIENTO_CHOICES, NACIONALIDAD_CHOICES, AFP_CHOICES
+from .models import Catalogo, CatalogoOpcion
+from .replica import SesionEnrutada
+
+# Opciones de siempre: se usan mientras el catálogo no exista en la BD (versión 0)
+DEFECTOS = {
+    "establecimientos": ESTABLECIMIENTO_CHOICES,
+    "afp": AFP_CHOICES,
+    "nacionalidades": NACIONALIDAD_CHOICES,
+    "tipos_contrato": TIPO_CONTRATO_CHOICES,
+}
+
+# Campo de RegistrarActaForm -> catálogo
+CAMPOS_FORM = {
+    "lugar_trabajo": "establecimientos",
+    "afp": "afp",
+    "nacionalidad": "nacionalidades",
+    "tipo_contrato": "tipos_contrato",
+}
+
+PLACEHOLDER = ("", "-- Seleccione --")
+
+# Cada CATALOGO_TTL segundos un worker relee las versiones (una query chica) y recarga
+# sólo los catálogos que cambiaron. Los cambios hechos en el propio worker se ven al instante.
+CATALOGO_TTL = 30
+_versiones = TTLCache(maxsize=1, ttl=CATALOGO_TTL)  # "todas" -> {nombre: version}
+_opciones = {}  # nombre -> (version, [(valor, etiqueta), ...])
+CLAVE_CAMBIO = "catalogos_cambiados"  # en session.info, hasta el commit
+
+
+def invalidar_catalogos() -> None:
+    _versiones.clear()
+    _opciones.clear()
+
+
+@event.listens_for(SesionEnrutada, "after_commit")
+def _invalidar_al_confirmar(session):
+    # sólo después del commit: antes, otra request del worker recargaría la versión vieja
+    if session.info.pop(CLAVE_CAMBIO, False):
+        invalidar_catalogos()
+
+
+@event.listens_for(SesionEnrutada, "after_rollback")
+def _descartar_cambio(session):
+    session.info.pop(CLAVE_CAMBIO, None)
+
+
+def versiones() -> dict:
+    v = _versiones.get("todas")
+    if v is None:
+        v = dict(db.session.execute(db.select(Catalogo.nombre, Catalogo.version)).all())
+        _versiones.set("todas", v)
+    return v
+
+
+def version(nombre: str) -> int:
+    return versiones().get(nombre, 0)
+
+
+def opciones(nombre: str):
+    """[(valor, etiqueta)] activas del catálogo, en orden y sin placeholder."""
+    if nombre not in DEFECTOS:
+        raise KeyError(nombre)
+    v = version(nombre)
+    en_cache = _opciones.get(nombre)
+    if en_cache is not None and en_cache[0] == v:
+        return en_cache[1]
+    if v == 0:
+        lista = [(valor, etiqueta) for (valor, etiqueta) in DEFECTOS[nombre] if valor]
+    else:
+        lista = [tuple(f) for f in db.session.execute(
+            db.select(CatalogoOpcion.valor, CatalogoOpcion.etiqueta)
+            .where(CatalogoOpcion.catalogo == nombre, CatalogoOpcion.activo.is_(True))
+            .order_by(CatalogoOpcion.orden, CatalogoOpcion.id)
+        )]
+    _opciones[nombre] = (v, lista)
+    return lista
+
+
+def valores(nombre: str):
+    return [valor for (valor, _e) in opciones(nombre)]
+
+
+def choices(nombre: str):
+    """Choices para SelectField: con placeholder si la lista original lo tenía."""
+    lista = opciones(nombre)
+    return [PLACEHOLDER] + lista if DEFECTOS[nombre][0][0] == "" else list(lista)
+
+
+def cargar_choices(form) -> None:
+    """Choices completos desde el catálogo (para validar el POST)."""
+    for campo, nombre in CAMPOS_FORM.items():
+        getattr(form, campo).choices = choices(nombre)
+
+
+def reducir_choices(form) -> None:
+    """
+    Antes de renderizar: cada select lleva sólo el placeholder y la opción elegida, más
+    data-catalogo con la URL versionada del JSON; el navegador trae (y cachea) la lista completa.
+    """
+    for campo, nombre in CAMPOS_FORM.items():
+        f = getattr(form, campo)
+        f.choices = [c for c in f.choices if c[0] in ("", f.data)] or f.choices[:1]
+        f.render_kw = dict(f.render_kw or {}, **{
+            "data-catalogo": url_for("main.catalogo_json", nombre=nombre, v=version(nombre)),
+        })
+
+
+def guardar_opcion(nombre: str, valor: str, etiqueta: str = None, activo: bool = True, orden: int = None):
+    """
+    Crea o actualiza una opción y sube la versión del catálogo (el commit es del llamador; la
+    caché del worker se invalida recién cuando ese commit se confirma).
+    Si el catálogo no existía, primero se copian sus opciones por defecto.
+    """
+    if nombre not in DEFECTOS:
+        raise KeyError(nombre)
+    cat = db.session.get(Catalogo, nombre)
+    if cat is None:
+        cat = Catalogo(nombre=nombre, version=0)
+        db.session.add(cat)
+        for i, (v, e) in enumerate(x for x in DEFECTOS[nombre] if x[0]):
+            db.session.add(CatalogoOpcion(catalogo=nombre, valor=v, etiqueta=e, orden=(i + 1) * 10))
+        db.session.flush()
+
+    op = db.session.execute(
+        db.select(CatalogoOpcion).where(CatalogoOpcion.catalogo == nombre, CatalogoOpcion.valor == valor)
+    ).scalar_one_or_none()
+    if op is None:
+        ultimo = db.session.execute(
+            db.select(db.func.max(CatalogoOpcion.orden)).where(CatalogoOpcion.catalogo == nombre)
+        ).scalar() or 0
+        op = CatalogoOpcion(catalogo=nombre, valor=valor, etiqueta=etiqueta or valor, orden=ultimo + 10)
+        db.session.add(op)
+    elif etiqueta:
+        op.etiqueta = etiqueta
+    op.activo = activo
+    if orden is not None:
+        op.orden = orden
+    cat.version += 1
+    db.session.info[CLAVE_CAMBIO] = True
+    return op
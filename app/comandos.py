@@ -0,0 +1,192 @@
+# app/comandos.py
+import sqlite3
+import time
+
+import click
+
+from . import db
+
+
+def registrar_comandos(app):
+    """Comandos `flask ...` de mantención."""
+
+    @app.cli.command("recalcular-resumen")
+    def recalcular_resumen_cmd():
+        """Reconstruye resumen_actas (dashboard) contando desde actas y actas_archivo."""
+        from .models import ResumenActas, recalcular_resumen
+        recalcular_resumen(db.session.connection())
+        db.session.commit()
+        click.echo(f"resumen_actas: {ResumenActas.query.count()} filas.")
+
+    @app.cli.command("sincronizar-replica")
+    def sincronizar_replica_cmd():
+        """Copia la BD primaria SQLite sobre la réplica (DATABASE_URL_REPLICA), para pruebas locales."""
+        from .replica import BIND_REPLICA
+        replica = db.engines.get(BIND_REPLICA)
+        if replica is None:
+            raise click.ClickException("No hay réplica configurada (DATABASE_URL_REPLICA).")
+        if db.engine.dialect.name != "sqlite" or replica.dialect.name != "sqlite":
+            raise click.ClickException("Sólo para SQLite; en otros motores usa la replicación del servidor.")
+        replica.dispose()
+        # backup en línea de sqlite3: copia consistente aunque el primario esté en uso
+        origen = db.engine.raw_connection()
+        destino = sqlite3.connect(replica.url.database)
+        try:
+            origen.driver_connection.backup(destino)
+        finally:
+            destino.close()
+            origen.close()
+        click.echo(f"Réplica actualizada: {replica.url.database}")
+
+    @app.cli.command("seed")
+    @click.option("--escala", default="10k", show_default=True, help="10k | 100k | 1M | número de actas")
+    @click.option("--semilla", default=0, show_default=True, help="misma semilla => mismos datos")
+    def seed_cmd(escala, semilla):
+        """Llena la BD con usuarios, períodos y actas sintéticos (benchmarks / pruebas de carga)."""
+        from .seed import CLAVE_SEED, parsear_escala, sembrar
+        try:
+            n = parsear_escala(escala)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--escala")
+        with click.progressbar(length=n, label="Actas") as barra:
+            usuarios, periodos, actas = sembrar(n, semilla, progreso=lambda total: barra.update(total - barra.pos))
+        click.echo(f"Usuarios seed: {usuarios} (clave '{CLAVE_SEED}'), períodos: {periodos}, actas: {actas}.")
+
+    @app.cli.command("precompilar-plantillas")
+    def precompilar_plantillas_cmd():
+        """Compila todas las plantillas al caché de bytecode (correr en el deploy, antes de levantar workers)."""
+        env = app.jinja_env
+        nombres = [n for n in env.list_templates() if n.endswith(".html")]
+        for nombre in nombres:
+            env.get_template(nombre)
+        click.echo(f"{len(nombres)} plantillas compiladas en {app.config['JINJA_CACHE_FOLDER']}")
+
+    @app.cli.command("comprimir-estaticos")
+    def comprimir_estaticos_cmd():
+        """Genera las variantes .gz/.br de los estáticos (paso de build; las sirve init_estaticos)."""
+        from .estaticos import brotli, comprimir_estaticos
+        creados = comprimir_estaticos(app.static_folder)
+        click.echo(f"{len(creados)} archivos comprimidos" + ("" if brotli else " (sin brotli instalado: sólo .gz)"))
+
+    def _anio_mes(_ctx, _param, valor):
+        try:
+            anio, mes = (int(x) for x in valor.split("-", 1))
+            if not 1 <= mes <= 12:
+                raise ValueError
+        except ValueError:
+            raise click.BadParameter("usa AAAA-MM")
+        return anio, mes
+
+    @app.cli.command("archivar-periodo")
+    @click.argument("periodo", callback=_anio_mes)
+    @click.option("--lote", default=1000, show_default=True, help="actas movidas por transacción")
+    def archivar_periodo_cmd(periodo, lote):
+        """Mueve las actas de un período cerrado (AAAA-MM) a actas_archivo."""
+        from .archivo import ErrorArchivo, archivar_periodo
+        try:
+            n = archivar_periodo(*periodo, lote=lote, progreso=lambda total: click.echo(f"  {total} actas..."))
+        except ErrorArchivo as e:
+            raise click.ClickException(str(e))
+        click.echo(f"Período {periodo[0]}-{periodo[1]:02d} archivado: {n} actas movidas.")
+
+    @app.cli.command("desarchivar-periodo")
+    @click.argument("periodo", callback=_anio_mes)
+    @click.option("--lote", default=1000, show_default=True, help="actas movidas por transacción")
+    def desarchivar_periodo_cmd(periodo, lote):
+        """Devuelve las actas de un período archivado (AAAA-MM) a la tabla actas."""
+        from .archivo import ErrorArchivo, desarchivar_periodo
+        try:
+            n = desarchivar_periodo(*periodo, lote=lote)
+        except ErrorArchivo as e:
+            raise click.ClickException(str(e))
+        click.echo(f"Período {periodo[0]}-{periodo[1]:02d} desarchivado: {n} actas devueltas.")
+
+    @app.cli.group("trabajos")
+    def trabajos_cmd():
+        """Trabajos en segundo plano (exports, PDFs, importaciones)."""
+
+    @trabajos_cmd.command("worker")
+    @click.option("--hilos", default=1, show_default=True, help="trabajos en paralelo")
+    def trabajos_worker(hilos):
+        """Procesa la cola hasta Ctrl+C (para correr junto a la app con TRABAJOS_HILOS=0)."""
+        import threading
+        from .trabajos import bucle_worker
+        detener = threading.Event()
+        hilos_ = [
+            threading.Thread(target=bucle_worker, name=f"trabajos-{i}", daemon=True,
+                             args=(app, app.config["TRABAJOS_INTERVALO"], detener), kwargs={"limpiar": i == 0})
+            for i in range(hilos)
+        ]
+        for h in hilos_:
+            h.start()
+        click.echo(f"Worker de trabajos con {hilos} hilo(s); Ctrl+C para salir.")
+        try:
+            while any(h.is_alive() for h in hilos_):
+                time.sleep(1)
+        except KeyboardInterrupt:
+            detener.set()
+            click.echo("Terminando (los trabajos en curso se reintentan al volver).")
+
+    @trabajos_cmd.command("listar")
+    @click.option("--estado", type=click.Choice(["pendiente", "ejecutando", "listo", "error"]))
+    def trabajos_listar(estado):
+        from .models import Trabajo
+        q = Trabajo.query.order_by(Trabajo.id.desc())
+        if estado:
+            q = q.filter_by(estado=estado)
+        for t in q.limit(50):
+            click.echo(f"#{t.id} {t.tipo:<14} {t.estado:<10} {t.progreso}/{t.total or '?'}  {t.mensaje or ''}")
+
+    @trabajos_cmd.command("limpiar")
+    @click.option("--dias", type=int, help="por defecto TRABAJOS_RETENCION_DIAS")
+    def trabajos_limpiar(dias):
+        """Borra trabajos terminados (y sus archivos) más viejos que --dias."""
+        from .trabajos import limpiar_trabajos, recuperar_interrumpidos
+        r = recuperar_interrumpidos(app.config["TRABAJOS_TIMEOUT"])
+        n = limpiar_trabajos(dias if dias is not None else app.config["TRABAJOS_RETENCION_DIAS"])
+        click.echo(f"{n} trabajos borrados; {r} interrumpidos recuperados.")
+
+    @app.cli.command("limpiar-pdf")
+    @click.option("--dias", type=int, help="por defecto PDF_CACHE_DIAS")
+    def limpiar_pdf(dias):
+        """Borra los PDF del caché que no se sirven hace más de --dias días."""
+        from .pdf import limpiar_cache_pdf
+        n = limpiar_cache_pdf(dias if dias is not None else app.config["PDF_CACHE_DIAS"])
+        click.echo(f"{n} PDF borrados del caché.")
+
+    from .catalogos import DEFECTOS
+    nombre_catalogo = click.argument("nombre", type=click.Choice(list(DEFECTOS)))
+
+    @app.cli.group("catalogo")
+    def catalogo_cmd():
+        """Opciones de los selects (establecimientos, afp, nacionalidades, tipos_contrato)."""
+
+    @catalogo_cmd.command("listar")
+    @nombre_catalogo
+    def catalogo_listar(nombre):
+        from .catalogos import opciones, version
+        click.echo(f"{nombre} (versión {version(nombre)})")
+        for valor, etiqueta in opciones(nombre):
+            click.echo(f"  {valor}" + (f"  [{etiqueta}]" if etiqueta != valor else ""))
+
+    @catalogo_cmd.command("agregar")
+    @nombre_catalogo
+    @click.argument("valor")
+    @click.option("--etiqueta", help="texto visible (por defecto, el valor)")
+    @click.option("--orden", type=int, help="posición (por defecto, al final)")
+    def catalogo_agregar(nombre, valor, etiqueta, orden):
+        """Agrega (o reactiva/renombra) una opción."""
+        from .catalogos import guardar_opcion
+        guardar_opcion(nombre, valor, etiqueta=etiqueta, orden=orden)
+        db.session.commit()
+        click.echo(f"{nombre}: '{valor}' activa.")
+
+    @catalogo_cmd.command("desactivar")
+    @nombre_catalogo
+    @click.argument("valor")
+    def catalogo_desactivar(nombre, valor):
+        """Oculta una opción (las actas existentes conservan su valor)."""
+        from .catalogos import guardar_opcion
+        guardar_opcion(nombre, valor, activo=False)
+        db.session.commit()
+        click.echo(f"{nombre}: '{valor}' desactivada.")
@@ -0,0 +1,81 @@
+# app/condicional.py
+import hashlib
+import json
+import os
+
+from flask import abort, current_app, make_response, request, session
+from flask_login import current_user
+from sqlalchemy import func
+from werkzeug.http import is_resource_modified
+
+from . import db
+from .models import Acta, ActaArchivada
+
+
+def version_despliegue(app) -> str:
+    """Hash de las plantillas y del manifiesto de estáticos: un deploy con cambios invalida todos los ETag."""
+    h = hashlib.sha256()
+    carpeta = os.path.join(app.root_path, app.template_folder)
+    for raiz, _dirs, archivos in sorted(os.walk(carpeta)):
+        for nombre in sorted(archivos):
+            with open(os.path.join(raiz, nombre), "rb") as f:
+                h.update(nombre.encode() + b"\0" + f.read())
+    h.update(json.dumps(app.extensions.get("manifiesto_estaticos", {}), sort_keys=True).encode())
+    return h.hexdigest()[:16]
+
+
+def etag_de(*partes) -> str:
+    """ETag de una vista: sus datos + versión del despliegue + quién la ve (el HTML cambia por rol)."""
+    crudo = json.dumps(
+        [current_app.extensions["version_despliegue"], current_user.get_id(), current_user.rol, *partes],
+        default=str,
+    )
+    return hashlib.sha256(crudo.encode()).hexdigest()[:32]
+
+
+def respuesta_condicional(etag, ultima_modificacion, renderizar):
+    """
+    304 sin llamar a `renderizar` si el cliente ya tiene esta versión; si no, la respuesta
+    completa con ETag (y Last-Modified si se indica).
+    Con mensajes flash pendientes no hay camino condicional: un 304 no los mostraría, y una
+    página con el mensaje no debe quedar como versión válida en el caché del navegador. La
+    plantilla los muestra (y consume), así que la siguiente visita ya puede ser un 304.
+    """
+    if session.get("_flashes"):
+        resp = make_response(renderizar())
+        resp.headers["Cache-Control"] = "no-store"
+        return resp
+    if not is_resource_modified(request.environ, etag=etag, last_modified=ultima_modificacion):
+        resp = current_app.response_class(status=304)
+    else:
+        resp = make_response(renderizar())
+    resp.set_etag(etag)
+    if ultima_modificacion is not None:
+        resp.last_modified = ultima_modificacion
+    resp.headers["Cache-Control"] = "private, no-cache"  # el navegador guarda, pero siempre revalida
+    return resp
+
+
+def version_acta_o_404(acta_id: int):
+    """(modelo, usuario_id, última modificación) del acta, sin cargar la fila completa."""
+    for modelo in (Acta, ActaArchivada):
+        fila = db.session.execute(
+            db.select(modelo.usuario_id, func.coalesce(modelo.modificado_en, modelo.creado_en))
+            .where(modelo.id == acta_id)
+        ).first()
+        if fila is not None:
+            return modelo, fila[0], fila[1]
+    abort(404)
+
+
+def version_listado(q, modelo):
+    """(cantidad, última modificación, id máximo) del conjunto filtrado: cambia con altas, bajas y ediciones."""
+    return tuple(q.with_entities(
+        func.count(modelo.id),
+        func.max(func.coalesce(modelo.modificado_en, modelo.creado_en)),
+        func.max(modelo.id),
+    ).one())
+
+
+def init_condicional(app):
+    app.extensions["version_despliegue"] = version_despliegue(app)
@@ -0,0 +1,124 @@
+# app/estaticos.py
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+
+from flask import request, send_from_directory
+
+try:
+    import brotli  # opcional: sin él sólo se generan/sirven variantes .gz
+except ImportError:
+    brotli = None
+
+UN_ANIO = 365 * 24 * 3600
+CACHE_INMUTABLE = f"public, max-age={UN_ANIO}, immutable"
+
+# Sin fingerprint ni compresión: las firmas se sirven aparte (ver enviar_firma)
+EXCLUIR = ("uploads/",)
+COMPRIMIBLES = (".css", ".js", ".svg", ".txt", ".json", ".html", ".map")
+
+# style.3fa2b1c4d5e6.css -> ("style", "3fa2b1c4d5e6", ".css")
+_RE_FINGERPRINT = re.compile(r"^(?P<base>.+)\.(?P<hash>[0-9a-f]{12})(?P<ext>\.[^./]+)$")
+
+
+def _archivos_estaticos(carpeta):
+    for raiz, _dirs, archivos in os.walk(carpeta):
+        for nombre in archivos:
+            relativa = os.path.relpath(os.path.join(raiz, nombre), carpeta).replace(os.sep, "/")
+            if relativa.startswith(EXCLUIR) or relativa.endswith((".gz", ".br")):
+                continue
+            yield relativa
+
+
+def con_fingerprint(relativa, digest):
+    base, ext = os.path.splitext(relativa)
+    return f"{base}.{digest[:12]}{ext}"
+
+
+def construir_manifiesto(carpeta):
+    """{'style.css': 'style.3fa2b1c4d5e6.css', ...} con el SHA-256 del contenido actual."""
+    manifiesto = {}
+    for relativa in _archivos_estaticos(carpeta):
+        with open(os.path.join(carpeta, relativa), "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        manifiesto[relativa] = con_fingerprint(relativa, digest)
+    return manifiesto
+
+
+def comprimir_estaticos(carpeta):
+    """Genera .gz (y .br si está instalado brotli) junto a cada archivo comprimible. Devuelve los creados."""
+    creados = []
+    for relativa in _archivos_estaticos(carpeta):
+        if not relativa.endswith(COMPRIMIBLES):
+            continue
+        ruta = os.path.join(carpeta, relativa)
+        with open(ruta, "rb") as f:
+            datos = f.read()
+        variantes = [(".gz", gzip.compress(datos, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            variantes.append((".br", brotli.compress(datos, quality=11)))
+        for sufijo, comprimido in variantes:
+            if len(comprimido) >= len(datos):
+                continue  # no vale la pena
+            with open(ruta + sufijo, "wb") as f:
+                f.write(comprimido)
+            creados.append(relativa + sufijo)
+    return creados
+
+
+def _variante_vigente(original, variante):
+    # una variante más vieja que el original (se editó sin volver a comprimir) no se usa
+    try:
+        return os.path.getmtime(variante) >= os.path.getmtime(original)
+    except OSError:
+        return False
+
+
+def _servir(carpeta, relativa, max_age):
+    """Sirve `relativa` o su variante precomprimida según Accept-Encoding."""
+    aceptadas = request.accept_encodings
+    ruta = os.path.join(carpeta, relativa)
+    for sufijo, codificacion in ((".br", "br"), (".gz", "gzip")):
+        if aceptadas[codificacion] and _variante_vigente(ruta, ruta + sufijo):
+            resp = send_from_directory(carpeta, relativa + sufijo, max_age=max_age)
+            resp.mimetype = mimetypes.guess_type(relativa)[0] or "application/octet-stream"
+            resp.headers["Content-Encoding"] = codificacion
+            break
+    else:
+        resp = send_from_directory(carpeta, relativa, max_age=max_age)
+    resp.vary.add("Accept-Encoding")
+    return resp
+
+
+def init_estaticos(app):
+    """
+    - url_for('static', filename='style.css') -> /static/style.<hash>.css
+    - Las URLs con fingerprint vigente se sirven con Cache-Control immutable (1 año).
+    - Si existe la variante .br/.gz (ver `flask comprimir-estaticos`) y el cliente la acepta, se sirve esa.
+    El manifiesto se arma al iniciar (hash de cada archivo); un deploy con cambios genera URLs nuevas.
+    """
+    carpeta = app.static_folder
+    manifiesto = construir_manifiesto(carpeta) if app.config["STATIC_FINGERPRINT"] else {}
+    inverso = {v: k for k, v in manifiesto.items()}
+    app.extensions["manifiesto_estaticos"] = manifiesto
+
+    @app.url_defaults
+    def _fingerprint(endpoint, values):
+        if endpoint == "static" and values.get("filename") in manifiesto:
+            values["filename"] = manifiesto[values["filename"]]
+
+    def static(filename):
+        original = inverso.get(filename)
+        if original is not None:
+            resp = _servir(carpeta, original, max_age=UN_ANIO)
+            resp.headers["Cache-Control"] = CACHE_INMUTABLE
+            return resp
+        m = _RE_FINGERPRINT.match(filename)
+        if m and f"{m['base']}{m['ext']}" in manifiesto:
+            # URL de un deploy anterior: se entrega el contenido actual, sin caché largo
+            return _servir(carpeta, f"{m['base']}{m['ext']}", max_age=None)
+        return _servir(carpeta, filename, max_age=None)
+
+    app.view_functions["static"] = static
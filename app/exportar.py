@@ -0,0 +1,171 @@
+# app/exportar.py
+import csv
+import io
+import os
+import tempfile
+from datetime import date, datetime
+
+import xlsxwriter
+
+from . import db
+
+
+# =========================
+# Columnas exportadas (atributo del modelo, encabezado)
+# =========================
+COLUMNAS_EXPORT = [
+    ("id", "ID"),
+    ("correlativo", "Correlativo"),
+    ("periodo_anio", "Año período"),
+    ("periodo_mes", "Mes período"),
+    ("cesfam", "CESFAM"),
+    ("rut", "RUT"),
+    ("nombres", "Nombres"),
+    ("apellidos", "Apellidos"),
+    ("tipo_contrato", "Tipo contrato"),
+    ("rut_titular_reemplazo", "RUT titular reemplazo"),
+    ("nombre_titular_reemplazo", "Nombre titular reemplazo"),
+    ("convenio", "Convenio"),
+    ("responsable", "Responsable"),
+    ("cargo", "Cargo"),
+    ("categoria", "Categoría"),
+    ("jornada", "Jornada"),
+    ("lugar_trabajo", "Establecimiento"),
+    ("salud", "Salud"),
+    ("plan_isapre", "Plan Isapre"),
+    ("afp", "AFP"),
+    ("fecha_acta", "Fecha acta"),
+    ("fecha_inicio_contratacion", "Inicio contratación"),
+    ("fecha_termino_contratacion", "Término contratación"),
+    ("fecha_envio_fisico", "Envío físico"),
+    ("estado", "Estado"),
+    ("motivo", "Motivo"),
+    ("observaciones", "Observaciones"),
+    ("creado_en", "Creado en"),
+]
+
+LOTE_FILAS = 1000  # filas por fetch del cursor de servidor
+CHUNK_BYTES = 64 * 1024
+
+
+def _modelo(q):
+    # Acta o ActaArchivada (mismas columnas)
+    return q.column_descriptions[0]["entity"]
+
+
+def iterar_filas_export(*consultas):
+    """
+    Itera tuplas planas (no objetos ORM) de las actas de las queries (una tras otra),
+    leyendo por lotes de LOTE_FILAS (yield_per). En PostgreSQL stream_results abre un cursor
+    de servidor; en SQLite no cambia nada (el cursor ya avanza fila a fila) y lo que acota
+    la memoria es yield_per.
+    """
+    for q in consultas:
+        modelo = _modelo(q)
+        columnas = [getattr(modelo, attr) for attr, _ in COLUMNAS_EXPORT]
+        stmt = (
+            q.with_entities(*columnas)
+            .order_by(modelo.id)
+            .statement
+            .execution_options(stream_results=True, yield_per=LOTE_FILAS)
+        )
+        for fila in db.session.execute(stmt):
+            yield tuple(fila)
+
+
+def iterar_csv(*consultas, lote=LOTE_FILAS):
+    """
+    Genera el CSV de las queries por bloques de texto.
+    - El encabezado sale de inmediato (primer byte sin esperar a la BD).
+    - Cada lote es una query corta keyset por id (id > último, LIMIT lote):
+      con filtros de CESFAM/período la recorre ix_acta_cesfam_periodo, que ya
+      viene ordenado por id dentro de cada (cesfam, año, mes).
+    - BOM UTF-8 para que Excel abra bien los acentos.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow([titulo for _attr, titulo in COLUMNAS_EXPORT])
+    yield "\ufeff" + buf.getvalue()
+
+    for q in consultas:
+        modelo = _modelo(q)
+        columnas = [getattr(modelo, attr) for attr, _ in COLUMNAS_EXPORT]
+        ultimo_id = 0
+        while True:
+            filas = (
+                q.with_entities(*columnas)
+                .filter(modelo.id > ultimo_id)
+                .order_by(modelo.id)
+                .limit(lote)
+                .all()
+            )
+            if not filas:
+                break
+            buf.seek(0)
+            buf.truncate(0)
+            writer.writerows(["" if v is None else v for v in fila] for fila in filas)
+            yield buf.getvalue()
+            ultimo_id = filas[-1][0]  # "id" es la primera columna
+            if len(filas) < lote:
+                break
+
+
+def escribir_xlsx(filas, destino):
+    """
+    Escribe las filas en `destino` usando el modo constant_memory de XlsxWriter:
+    cada fila se vuelca a disco al pasar a la siguiente, así que el proceso
+    nunca guarda la hoja completa en memoria.
+    Devuelve la cantidad de filas escritas.
+    """
+    wb = xlsxwriter.Workbook(destino, {"constant_memory": True, "tmpdir": tempfile.gettempdir()})
+    ws = wb.add_worksheet("Actas")
+    fmt_header = wb.add_format({"bold": True})
+    fmt_fecha = wb.add_format({"num_format": "dd-mm-yyyy"})
+    fmt_fecha_hora = wb.add_format({"num_format": "dd-mm-yyyy hh:mm"})
+
+    for col, (_attr, titulo) in enumerate(COLUMNAS_EXPORT):
+        ws.write_string(0, col, titulo, fmt_header)
+    ws.freeze_panes(1, 0)
+
+    n = 0
+    for n, fila in enumerate(filas, start=1):
+        for col, valor in enumerate(fila):
+            if valor is None:
+                continue
+            if isinstance(valor, datetime):
+                ws.write_datetime(n, col, valor, fmt_fecha_hora)
+            elif isinstance(valor, date):
+                ws.write_datetime(n, col, datetime(valor.year, valor.month, valor.day), fmt_fecha)
+            else:
+                ws.write(n, col, valor)
+
+    wb.close()
+    return n
+
+
+def exportar_xlsx(*consultas):
+    """
+    Genera el .xlsx de las queries en un archivo temporal y devuelve su ruta.
+    Quien lo sirve es responsable de borrarlo (ver stream_y_borrar).
+    """
+    fd, ruta = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        escribir_xlsx(iterar_filas_export(*consultas), ruta)
+    except Exception:
+        os.remove(ruta)
+        raise
+    return ruta
+
+
+def stream_y_borrar(ruta):
+    """Entrega el archivo por bloques y lo borra al terminar (o si se corta la descarga)."""
+    try:
+        with open(ruta, "rb") as f:
+            while True:
+                bloque = f.read(CHUNK_BYTES)
+                if not bloque:
+                    break
+                yield bloque
+    finally:
+        os.remove(ruta)
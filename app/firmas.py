@@ -0,0 +1,120 @@
+# app/firmas.py
+import hashlib
+import mimetypes
+import os
+import tempfile
+from io import BytesIO
+
+from flask import current_app, make_response, send_file
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from .cache import TTLCache
+
+FIRMA_MAX_PX = (600, 300)   # tamaño máximo tras normalizar (ancho, alto)
+CHUNK_BYTES = 64 * 1024
+
+# sha256 del archivo subido -> sha256 de la firma normalizada.
+# El mismo encargado sube el mismo archivo para cada acta: en un hit no se decodifica de nuevo.
+_normalizadas = TTLCache(maxsize=512, ttl=24 * 3600)
+
+
+def _leer_con_hash(stream):
+    """Copia el upload a un temporal (en RAM hasta 1 MB) calculando su SHA-256 en el camino."""
+    h = hashlib.sha256()
+    tmp = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    while True:
+        bloque = stream.read(CHUNK_BYTES)
+        if not bloque:
+            break
+        h.update(bloque)
+        tmp.write(bloque)
+    tmp.seek(0)
+    return tmp, h.hexdigest()
+
+
+def normalizar(fp) -> bytes:
+    """
+    Re-codifica la imagen a PNG en escala de grises, acotada a FIRMA_MAX_PX.
+    Para JPEG usa draft() y decodifica directo a escala reducida (fotos de celular).
+    """
+    try:
+        img = Image.open(fp)
+        img.draft("L", (FIRMA_MAX_PX[0] * 2, FIRMA_MAX_PX[1] * 2))
+        img = ImageOps.exif_transpose(img)
+        if img.mode in ("RGBA", "LA", "P"):
+            # fondo transparente -> blanco, antes de pasar a grises
+            img = img.convert("RGBA")
+            fondo = Image.new("RGBA", img.size, (255, 255, 255, 255))
+            img = Image.alpha_composite(fondo, img)
+        img = img.convert("L")
+        img.thumbnail(FIRMA_MAX_PX)
+    except Image.DecompressionBombError as e:
+        # más de 2 x Image.MAX_IMAGE_PIXELS: se rechaza antes de decodificar
+        raise ValueError("La imagen de firma es demasiado grande.") from e
+    except (UnidentifiedImageError, OSError) as e:
+        raise ValueError("El archivo de firma no es una imagen válida.") from e
+
+    out = BytesIO()
+    img.save(out, format="PNG", optimize=True)
+    return out.getvalue()
+
+
+def ruta_relativa(digest: str) -> str:
+    # direccionado por contenido: static/uploads/firmas/ab/abcdef....png
+    return f"static/uploads/firmas/{digest[:2]}/{digest}.png"
+
+
+def guardar_firma(file_storage):
+    """
+    Guarda la firma subida y devuelve (firma_path relativo, sha256 de la imagen guardada).
+    Firmas idénticas comparten un único archivo.
+    """
+    tmp, digest_subida = _leer_con_hash(file_storage.stream)
+    try:
+        digest = _normalizadas.get(digest_subida)
+        if digest and os.path.exists(os.path.join(current_app.root_path, ruta_relativa(digest))):
+            return ruta_relativa(digest), digest
+
+        contenido = normalizar(tmp)
+    finally:
+        tmp.close()
+
+    digest = hashlib.sha256(contenido).hexdigest()
+    relativa = ruta_relativa(digest)
+    destino = os.path.join(current_app.root_path, relativa)
+    if not os.path.exists(destino):
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        parcial = f"{destino}.{os.getpid()}.tmp"
+        with open(parcial, "wb") as f:
+            f.write(contenido)
+        os.replace(parcial, destino)  # atómico: dos uploads iguales a la vez no chocan
+    _normalizadas.set(digest_subida, digest)
+    return relativa, digest
+
+
+def enviar_firma(relativa):
+    """
+    Respuesta con la imagen de una firma (relativa = Acta.firma_path).
+    Con FRONT_PROXY='nginx' sólo se manda X-Accel-Redirect y nginx entrega el archivo
+    (location interna X_ACCEL_FIRMAS apuntando a UPLOAD_FOLDER); con 'apache' send_file
+    usa X-Sendfile (USE_X_SENDFILE). El nombre es el hash del contenido: caché inmutable.
+    """
+    carpeta = current_app.config["UPLOAD_FOLDER"]
+    prefijo = "static/uploads/firmas/"
+    if not relativa.startswith(prefijo):
+        raise FileNotFoundError(relativa)
+    dentro = relativa[len(prefijo):]
+    ruta = os.path.join(carpeta, dentro)
+    # las nuevas son PNG, pero las subidas antes de normalizar conservan su formato (.jpg, .gif...)
+    mimetype = mimetypes.guess_type(dentro)[0] or "application/octet-stream"
+
+    if current_app.config["FRONT_PROXY"] == "nginx":
+        resp = make_response("")
+        resp.headers["X-Accel-Redirect"] = current_app.config["X_ACCEL_FIRMAS"].rstrip("/") + "/" + dentro
+        resp.mimetype = mimetype
+    else:
+        if not os.path.isfile(ruta):
+            raise FileNotFoundError(relativa)
+        resp = send_file(ruta, mimetype=mimetype, conditional=True)
+    resp.headers["Cache-Control"] = "private, max-age=31536000, immutable"
+    return resp
@@ -16,6 +16,67 @@ def year_range(min_year=2000, max_year=2100):
 
 YEAR_NOW = date.today().year  # año actual para fecha de nacimiento
 
+# --- Listas de opciones compartidas (form, filtros del listado, importación masiva) ---
+TIPO_CONTRATO_CHOICES = [
+    ('Plazo Fijo', 'Plazo Fijo'),
+    ('Plazo Fijo (Convenio)', 'Plazo Fijo (Convenio)'),
+    ('Reemplazo', 'Reemplazo'),
+    ('Reemplazo (Convenio)', 'Reemplazo (Convenio)')
+]
+
+ESTABLECIMIENTO_CHOICES = [
+    ('', '-- Seleccione --'),
+    ('CESFAM Santa Cecilia', 'CESFAM Santa Cecilia'),
+    ('CESFAM San Juan', 'CESFAM San Juan'),
+    ('CESFAM Sergio Aguilar', 'CESFAM Sergio Aguilar'),
+    ('CESFAM Tierras Blancas', 'CESFAM Tierras Blancas'),
+    ('CESFAM Tongoy', 'CESFAM Tongoy'),
+    ('CESFAM Pan de Azúcar', 'CESFAM Pan de Azúcar'),
+    ('CESFAM El Sauce', 'CESFAM El Sauce'),
+    ('CESFAM Lila Cortés Godoy', 'CESFAM Lila Cortés Godoy'),
+    ('CECOSF Punta Mira', 'CECOSF Punta Mira'),
+    ('PSR Guanaqueros', 'PSR Guanaqueros'),
+    ('Departamento de Salud Coquimbo', 'Departamento de Salud Coquimbo'),
+]
+
+ESTADO_CIVIL_CHOICES = [
+    ('Soltero/a', 'Soltero/a'),
+    ('Casado/a', 'Casado/a'),
+    ('Viudo/a', 'Viudo/a'),
+    ('Divorciado/a', 'Divorciado/a')
+]
+
+NACIONALIDAD_CHOICES = [
+    ('', '-- Seleccione --'),
+    ('Chilena','Chilena'),
+    ('Peruana','Peruana'),
+    ('Boliviana','Boliviana'),
+    ('Colombiana','Colombiana'),
+    ('Española','Española'),
+    ('Argentina','Argentina'),
+    ('Brasileña','Brasileña'),
+    ('Ecuatoriana','Ecuatoriana'),
+    ('Venezolana','Venezolana'),
+    ('Uruguaya','Uruguaya'),
+    ('Paraguaya','Paraguaya'),
+]
+
+SALUD_CHOICES = [
+    ('FONASA', 'FONASA'),
+    ('ISAPRE', 'ISAPRE')
+]
+
+AFP_CHOICES = [
+    ('', '-- Seleccione --'),
+    ('AFP Capital', 'AFP Capital'),
+    ('AFP Cuprum', 'AFP Cuprum'),
+    ('AFP Habitat', 'AFP Habitat'),
+    ('AFP Modelo', 'AFP Modelo'),
+    ('AFP PlanVital', 'AFP PlanVital'),
+    ('AFP Provida', 'AFP Provida'),
+    ('AFP Uno', 'AFP Uno'),
+]
+
 
 class LoginForm(FlaskForm):
     username = StringField('Nombre de usuario', validators=[DataRequired()])
@@ -50,38 +111,15 @@ class RegistrarActaForm(FlaskForm):
     direccion = StringField('Dirección', validators=[DataRequired()])
     telefono = TelField('Teléfono', validators=[DataRequired()])
     email = EmailField('Email', validators=[DataRequired()])
-    estado_civil = SelectField('Estado Civil', choices=[
-        ('Soltero/a', 'Soltero/a'),
-        ('Casado/a', 'Casado/a'),
-        ('Viudo/a', 'Viudo/a'),
-        ('Divorciado/a', 'Divorciado/a')
-    ], validators=[DataRequired()])
+    estado_civil = SelectField('Estado Civil', choices=ESTADO_CIVIL_CHOICES, validators=[DataRequired()])
 
     # Nacionalidad
-    nacionalidad = SelectField('Nacionalidad', choices=[
-        ('', '-- Seleccione --'),
-        ('Chilena','Chilena'),
-        ('Peruana','Peruana'),
-        ('Boliviana','Boliviana'),
-        ('Colombiana','Colombiana'),
-        ('Española','Española'),
-        ('Argentina','Argentina'),
-        ('Brasileña','Brasileña'),
-        ('Ecuatoriana','Ecuatoriana'),
-        ('Venezolana','Venezolana'),
-        ('Uruguaya','Uruguaya'),
-        ('Paraguaya','Paraguaya'),
-    ], validators=[DataRequired()])
+    nacionalidad = SelectField('Nacionalidad', choices=NACIONALIDAD_CHOICES, validators=[DataRequired()])
 
     lugar_nacimiento = StringField('Lugar de Nacimiento', validators=[DataRequired()])
 
     # Contrato
-    tipo_contrato = SelectField('Tipo de Contrato', choices=[
-        ('Plazo Fijo', 'Plazo Fijo'),
-        ('Plazo Fijo (Convenio)', 'Plazo Fijo (Convenio)'),
-        ('Reemplazo', 'Reemplazo'),
-        ('Reemplazo (Convenio)', 'Reemplazo (Convenio)')
-    ], validators=[DataRequired()])
+    tipo_contrato = SelectField('Tipo de Contrato', choices=TIPO_CONTRATO_CHOICES, validators=[DataRequired()])
     motivo = StringField('Motivo', validators=[Optional()])
     rut_reemplazo = StringField('RUT Titular a Reemplazar', validators=[Optional()])
     nombre_reemplazo = StringField('Nombre Titular a Reemplazar', validators=[Optional()])
@@ -98,41 +136,16 @@ class RegistrarActaForm(FlaskForm):
     jornada = StringField('Jornada', validators=[DataRequired()])
 
     # Establecimiento (único)
-    lugar_trabajo = SelectField('Establecimiento', choices=[
-        ('', '-- Seleccione --'),
-        ('CESFAM Santa Cecilia', 'CESFAM Santa Cecilia'),
-        ('CESFAM San Juan', 'CESFAM San Juan'),
-        ('CESFAM Sergio Aguilar', 'CESFAM Sergio Aguilar'),
-        ('CESFAM Tierras Blancas', 'CESFAM Tierras Blancas'),
-        ('CESFAM Tongoy', 'CESFAM Tongoy'),
-        ('CESFAM Pan de Azúcar', 'CESFAM Pan de Azúcar'),
-        ('CESFAM El Sauce', 'CESFAM El Sauce'),
-        ('CESFAM Lila Cortés Godoy', 'CESFAM Lila Cortés Godoy'),
-        ('CECOSF Punta Mira', 'CECOSF Punta Mira'),
-        ('PSR Guanaqueros', 'PSR Guanaqueros'),
-        ('Departamento de Salud Coquimbo', 'Departamento de Salud Coquimbo'),
-    ], validators=[DataRequired()])
+    lugar_trabajo = SelectField('Establecimiento', choices=ESTABLECIMIENTO_CHOICES, validators=[DataRequired()])
 
     horario_jornada = TextAreaField('Horario Jornada', validators=[Optional()])
     cargo = StringField('Cargo', validators=[DataRequired()])
 
     # Salud / AFP
-    salud = SelectField('Salud', choices=[
-        ('FONASA', 'FONASA'),
-        ('ISAPRE', 'ISAPRE')
-    ], validators=[DataRequired()])
+    salud = SelectField('Salud', choices=SALUD_CHOICES, validators=[DataRequired()])
     plan_isapre = StringField('Plan Isapre', validators=[Optional()])
 
-    afp = SelectField('AFP', choices=[
-        ('', '-- Seleccione --'),
-        ('AFP Capital', 'AFP Capital'),
-        ('AFP Cuprum', 'AFP Cuprum'),
-        ('AFP Habitat', 'AFP Habitat'),
-        ('AFP Modelo', 'AFP Modelo'),
-        ('AFP PlanVital', 'AFP PlanVital'),
-        ('AFP Provida', 'AFP Provida'),
-        ('AFP Uno', 'AFP Uno'),
-    ], validators=[DataRequired()])
+    afp = SelectField('AFP', choices=AFP_CHOICES, validators=[DataRequired()])
 
     categoria = StringField('Categoría', validators=[DataRequired()])
 
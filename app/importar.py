@@ -0,0 +1,223 @@
+# app/importar.py
+import numpy as np
+import pandas as pd
+
+from . import db
+from .auditoria import registrar
+from .catalogos import CAMPOS_FORM, valores
+from .exportar import COLUMNAS_EXPORT
+from .forms import (
+    YEAR_NOW, TIPO_CONTRATO_CHOICES, ESTABLECIMIENTO_CHOICES, ESTADO_CIVIL_CHOICES,
+    NACIONALIDAD_CHOICES, SALUD_CHOICES, AFP_CHOICES,
+)
+from .models import Acta, ajustar_resumen, normalizar_rut
+
+LOTE_INSERT = 1000  # filas por INSERT multi-fila
+
+# Columnas obligatorias (las mismas que exige RegistrarActaForm con DataRequired)
+OBLIGATORIAS = [
+    "correlativo", "fecha_acta", "nombres", "apellidos", "rut", "fecha_nacimiento",
+    "direccion", "telefono", "email", "estado_civil", "nacionalidad", "lugar_nacimiento",
+    "tipo_contrato", "fecha_inicio_contratacion", "fecha_termino_contratacion", "jornada",
+    "lugar_trabajo", "cargo", "salud", "afp", "categoria", "nombre_encargado", "cargo_encargado",
+]
+OPCIONALES = [
+    "rut_titular_reemplazo", "nombre_titular_reemplazo", "convenio", "responsable",
+    "plan_isapre", "horario_jornada", "motivo", "observaciones", "cesfam",
+]
+
+# Fechas y su rango de año (mismos límites que year_range en el form)
+FECHAS = {
+    "fecha_acta": (2000, 2100),
+    "fecha_inicio_contratacion": (2000, 2100),
+    "fecha_termino_contratacion": (2000, 2100),
+    "fecha_nacimiento": (1900, YEAR_NOW),
+}
+FORMATOS_FECHA = ("%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y")
+
+# Selects del form: el valor debe estar en la lista
+OPCIONES = {
+    "tipo_contrato": TIPO_CONTRATO_CHOICES,
+    "lugar_trabajo": ESTABLECIMIENTO_CHOICES,
+    "estado_civil": ESTADO_CIVIL_CHOICES,
+    "nacionalidad": NACIONALIDAD_CHOICES,
+    "salud": SALUD_CHOICES,
+    "afp": AFP_CHOICES,
+}
+
+# Encabezados aceptados además del nombre del campo: los del export, y los del form
+ALIAS = {titulo.lower(): attr for attr, titulo in COLUMNAS_EXPORT}
+ALIAS.update({
+    "n° correlativo": "correlativo", "numero_correlativo": "correlativo",
+    "fecha_contratacion": "fecha_acta", "fecha_inicio": "fecha_inicio_contratacion",
+    "fecha_termino": "fecha_termino_contratacion", "establecimiento": "lugar_trabajo",
+    "rut_reemplazo": "rut_titular_reemplazo", "nombre_reemplazo": "nombre_titular_reemplazo",
+})
+
+
+# =========================
+# Lectura
+# =========================
+def leer_planilla(archivo, nombre: str) -> pd.DataFrame:
+    """Lee .xlsx/.xls/.csv como texto (conserva ceros a la izquierda en RUT, teléfono, correlativo)."""
+    ext = nombre.rsplit(".", 1)[-1].lower()
+    if ext in ("xlsx", "xls"):
+        df = pd.read_excel(archivo, dtype=str)
+    elif ext == "csv":
+        df = pd.read_csv(archivo, dtype=str, sep=None, engine="python", encoding="utf-8-sig")
+    else:
+        raise ValueError("Formato no soportado. Usa .xlsx o .csv.")
+
+    df.columns = [ALIAS.get(str(c).strip().lower(), str(c).strip().lower()) for c in df.columns]
+    df = df.reindex(columns=OBLIGATORIAS + OPCIONALES).astype(object)
+    # celdas vacías / sólo espacios -> NaN
+    return df.apply(lambda s: s.str.strip()).replace("", np.nan)
+
+
+# =========================
+# Validación vectorizada
+# =========================
+def dv_rut(cuerpos: pd.Series) -> pd.Series:
+    """Dígito verificador (módulo 11) de una serie de cuerpos de RUT (sólo dígitos, <= 9)."""
+    padded = cuerpos.str.zfill(9)
+    digitos = np.frombuffer("".join(padded).encode("ascii"), dtype=np.uint8).reshape(-1, 9) - ord("0")
+    pesos = np.array([4, 3, 2, 7, 6, 5, 4, 3, 2])  # 2..7 cíclico desde la derecha
+    resto = 11 - (digitos.astype(np.int64) @ pesos) % 11
+    dv = np.where(resto == 11, "0", np.where(resto == 10, "K", resto.astype(str)))
+    return pd.Series(dv, index=cuerpos.index)
+
+
+def rut_valido(ruts: pd.Series) -> pd.Series:
+    """True si el RUT (con o sin puntos/guion) tiene formato y dígito verificador correctos."""
+    limpio = ruts.fillna("").str.upper().str.replace(r"[^0-9K]", "", regex=True)
+    cuerpo, dv = limpio.str[:-1], limpio.str[-1:]
+    formato = cuerpo.str.fullmatch(r"\d{1,9}") & dv.str.fullmatch(r"[0-9K]")
+    calculado = dv_rut(cuerpo.where(formato, "0"))
+    return formato & (calculado == dv)
+
+
+def parsear_fechas(serie: pd.Series) -> pd.Series:
+    """Prueba cada formato en orden (ISO primero, sin ambigüedad día/mes); NaT si ninguno calza."""
+    texto = serie.str.replace(r"\s00:00:00$", "", regex=True)  # celdas fecha de Excel leídas como str
+    resultado = pd.Series(pd.NaT, index=serie.index, dtype="datetime64[ns]")
+    for fmt in FORMATOS_FECHA:
+        faltan = resultado.isna() & texto.notna()
+        if not faltan.any():
+            break
+        resultado[faltan] = pd.to_datetime(texto[faltan], format=fmt, errors="coerce")
+    return resultado
+
+
+def validar(df: pd.DataFrame):
+    """
+    Aplica todas las reglas columna a columna (sin iterar filas).
+    Devuelve (df con fechas ya parseadas, lista de errores por fila).
+    """
+    errores = pd.DataFrame(index=df.index)
+
+    for col in OBLIGATORIAS:
+        errores[f"Falta {col}"] = df[col].isna()
+
+    errores["RUT inválido"] = df["rut"].notna() & ~rut_valido(df["rut"])
+    errores["RUT titular reemplazo inválido"] = (
+        df["rut_titular_reemplazo"].notna() & ~rut_valido(df["rut_titular_reemplazo"])
+    )
+
+    for col, (desde, hasta) in FECHAS.items():
+        fechas = parsear_fechas(df[col])
+        errores[f"{col}: formato de fecha inválido"] = df[col].notna() & fechas.isna()
+        errores[f"{col}: el año debe estar entre {desde} y {hasta}"] = (
+            fechas.notna() & ~fechas.dt.year.between(desde, hasta)
+        )
+        df[col] = fechas.dt.date
+
+    for col, choices in OPCIONES.items():
+        # establecimiento, AFP, nacionalidad y tipo de contrato: los del catálogo vigente
+        validos = valores(CAMPOS_FORM[col]) if col in CAMPOS_FORM else [v for (v, _l) in choices if v]
+        errores[f"{col}: valor no permitido"] = df[col].notna() & ~df[col].isin(validos)
+
+    # Mismas reglas condicionales que la UI
+    es_convenio = df["tipo_contrato"].fillna("").str.contains("Convenio", regex=False)
+    errores["Falta responsable (contrato en convenio)"] = es_convenio & df["responsable"].isna()
+
+    # Sólo se arman mensajes para las filas con algún error
+    malas = errores.any(axis=1)
+    reporte = [
+        # fila + 2: encabezado en la fila 1 de la planilla
+        {"fila": int(i) + 2, "rut": df.at[i, "rut"], "errores": list(errores.columns[errores.loc[i]])}
+        for i in errores.index[malas]
+    ]
+    return df[~malas], reporte
+
+
+# =========================
+# Traslapes (advertencias, no bloquean)
+# =========================
+def advertencias_traslape(validas: pd.DataFrame):
+    """
+    Contratos que se cruzan, para el mismo RUT y para el mismo titular reemplazado:
+    - dentro de la planilla: vectorizado (orden por RUT+inicio, cummax del término previo)
+    - contra la BD: un seek indexado por fila (Acta.avisos_traslape)
+    Se debe llamar antes de insertar (si no, cada fila se encuentra a sí misma).
+    """
+    avisos = {}
+
+    for col, etiqueta in (("rut", "RUT"), ("rut_titular_reemplazo", "titular reemplazado")):
+        d = pd.DataFrame({
+            "rut": validas[col].map(normalizar_rut),
+            "ini": pd.to_datetime(validas["fecha_inicio_contratacion"]),
+            "fin": pd.to_datetime(validas["fecha_termino_contratacion"]),
+        }).dropna(subset=["rut", "ini"]).sort_values(["rut", "ini"])
+        fin_previo = d.groupby("rut")["fin"].cummax().groupby(d["rut"]).shift()
+        for i in d.index[d["ini"] <= fin_previo]:
+            avisos.setdefault(i, []).append(f"Se cruza con otra fila de la planilla con el mismo {etiqueta}.")
+
+    for fila in validas.itertuples():
+        for aviso in Acta.avisos_traslape(fila.rut, fila.rut_titular_reemplazo,
+                                          fila.fecha_inicio_contratacion, fila.fecha_termino_contratacion):
+            avisos.setdefault(fila.Index, []).append(aviso)
+
+    return [
+        {"fila": int(i) + 2, "rut": validas.at[i, "rut"], "errores": mensajes}
+        for i, mensajes in sorted(avisos.items())
+    ]
+
+
+# =========================
+# Inserción por lotes
+# =========================
+def importar_actas(df: pd.DataFrame, usuario, periodo_anio: int, periodo_mes: int):
+    """
+    Valida la planilla completa e inserta las filas válidas en INSERTs multi-fila
+    de LOTE_INSERT registros, todo en una sola transacción.
+    Devuelve (cantidad insertada, reporte de errores por fila, advertencias de traslape por fila).
+    """
+    validas, reporte = validar(df)
+    advertencias = advertencias_traslape(validas)
+
+    registros = validas.astype(object).where(validas.notna(), None).to_dict("records")
+    for r in registros:
+        if (r["salud"] or "").upper() != "ISAPRE":
+            r["plan_isapre"] = None
+        r["cesfam"] = r["cesfam"] or r["lugar_trabajo"]
+        # el INSERT masivo no pasa por @validates: se normaliza aquí
+        r["rut_normalizado"] = normalizar_rut(r["rut"])
+        r["rut_titular_reemplazo_normalizado"] = normalizar_rut(r["rut_titular_reemplazo"])
+        r.update(periodo_anio=periodo_anio, periodo_mes=periodo_mes, usuario_id=usuario.id, estado="borrador")
+
+    # el INSERT masivo no pasa por los eventos del ORM: se audita aparte (RETURNING da los ids en orden)
+    insertar = db.insert(Acta).returning(Acta.id, sort_by_parameter_order=True)
+    for i in range(0, len(registros), LOTE_INSERT):
+        lote = registros[i:i + LOTE_INSERT]
+        ids = db.session.scalars(insertar, lote).all()
+        for acta_id, r in zip(ids, lote):
+            registrar(db.session, "actas", [acta_id], "insert", {k: v for k, v in r.items() if v is not None})
+
+    # el INSERT masivo no dispara eventos ORM: el resumen del dashboard se ajusta aquí
+    deltas = {}
+    for r in registros:
+        clave = (r["cesfam"], periodo_anio, periodo_mes, "borrador")
+        deltas[clave] = deltas.get(clave, 0) + 1
+    ajustar_resumen(db.session.connection(), deltas)
+    db.session.commit()
+    return len(registros), reporte, advertencias
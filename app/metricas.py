@@ -0,0 +1,144 @@
+# app/metricas.py
+import logging
+import threading
+import time
+from bisect import bisect_left
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+log = logging.getLogger(__name__)
+
+# Límites superiores de los buckets (Prometheus agrega +Inf)
+BUCKETS_SEGUNDOS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+BUCKETS_QUERIES = (1, 2, 5, 10, 20, 50, 100, 200)
+
+
+class Histograma:
+    """Histograma acumulado por etiqueta (endpoint), formato Prometheus. Por worker."""
+
+    def __init__(self, nombre, ayuda, buckets):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.buckets = tuple(buckets)
+        self._series = {}  # etiqueta -> [conteos por bucket..., +Inf], suma
+        self._lock = threading.Lock()
+
+    def observar(self, etiqueta, valor):
+        i = bisect_left(self.buckets, valor)
+        with self._lock:
+            serie = self._series.get(etiqueta)
+            if serie is None:
+                serie = self._series[etiqueta] = [[0] * (len(self.buckets) + 1), 0.0]
+            serie[0][i] += 1
+            serie[1] += valor
+
+    def exponer(self):
+        lineas = [f"# HELP {self.nombre} {self.ayuda}", f"# TYPE {self.nombre} histogram"]
+        with self._lock:
+            series = {k: (list(v[0]), v[1]) for k, v in self._series.items()}
+        for etiqueta, (conteos, suma) in sorted(series.items()):
+            acumulado = 0
+            for limite, n in zip(self.buckets + ("+Inf",), conteos):
+                acumulado += n
+                lineas.append(f'{self.nombre}_bucket{{endpoint="{etiqueta}",le="{limite}"}} {acumulado}')
+            lineas.append(f'{self.nombre}_sum{{endpoint="{etiqueta}"}} {suma:.6f}')
+            lineas.append(f'{self.nombre}_count{{endpoint="{etiqueta}"}} {acumulado}')
+        return lineas
+
+
+class Contador:
+    """Contador por tupla de etiquetas."""
+
+    def __init__(self, nombre, ayuda, etiquetas):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.etiquetas = tuple(etiquetas)
+        self._valores = {}
+        self._lock = threading.Lock()
+
+    def incrementar(self, *valores):
+        with self._lock:
+            self._valores[valores] = self._valores.get(valores, 0) + 1
+
+    def exponer(self):
+        lineas = [f"# HELP {self.nombre} {self.ayuda}", f"# TYPE {self.nombre} counter"]
+        with self._lock:
+            valores = dict(self._valores)
+        for clave, n in sorted(valores.items()):
+            etiquetas = ",".join(f'{k}="{v}"' for k, v in zip(self.etiquetas, clave))
+            lineas.append(f"{self.nombre}{{{etiquetas}}} {n}")
+        return lineas
+
+
+# =========================
+# Métricas del worker
+# =========================
+latencia = Histograma("http_request_duration_seconds", "Latencia total de la request (incluye streaming).",
+                      BUCKETS_SEGUNDOS)
+tiempo_bd = Histograma("db_time_seconds", "Tiempo en la BD por request.", BUCKETS_SEGUNDOS)
+queries = Histograma("db_queries_per_request", "Sentencias SQL por request.", BUCKETS_QUERIES)
+requests_total = Contador("http_requests_total", "Requests atendidas.", ("endpoint", "status"))
+queries_lentas = Contador("db_slow_queries_total", "Sentencias sobre SLOW_QUERY_MS.", ("endpoint",))
+
+METRICAS = (latencia, tiempo_bd, queries, requests_total, queries_lentas)
+
+
+def exponer_metricas():
+    """Texto para /metrics (formato de exposición de Prometheus 0.0.4)."""
+    lineas = []
+    for m in METRICAS:
+        lineas.extend(m.exponer())
+    return "\n".join(lineas) + "\n"
+
+
+def _endpoint():
+    return request.endpoint or "sin_endpoint"
+
+
+# =========================
+# Hooks
+# =========================
+def instrumentar_engine(app, engine):
+    """Cuenta y cronometra cada sentencia del engine; loguea las lentas con su ruta."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _antes(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("t_inicio_query", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _despues(conn, cursor, statement, parameters, context, executemany):
+        duracion = time.perf_counter() - conn.info["t_inicio_query"].pop()
+        en_request = has_request_context()
+        if en_request:
+            g.metricas_queries = g.get("metricas_queries", 0) + 1
+            g.metricas_bd = g.get("metricas_bd", 0.0) + duracion
+        if duracion * 1000 >= app.config["SLOW_QUERY_MS"]:
+            ruta = _endpoint() if en_request else "fuera_de_request"
+            queries_lentas.incrementar(ruta)
+            log.warning("Query lenta (%.1f ms) en %s: %s", duracion * 1000, ruta, " ".join(statement.split()))
+
+
+def instrumentar_app(app):
+    """Hooks de request: latencia total, queries y tiempo de BD por endpoint."""
+
+    @app.before_request
+    def _inicio_request():
+        g.metricas_inicio = time.perf_counter()
+
+    @app.after_request
+    def _status_request(response):
+        g.metricas_status = response.status_code
+        return response
+
+    # teardown (y no after_request): con stream_with_context corre al terminar el streaming
+    @app.teardown_request
+    def _fin_request(_exc):
+        inicio = g.pop("metricas_inicio", None)
+        if inicio is None:
+            return
+        ruta = _endpoint()
+        latencia.observar(ruta, time.perf_counter() - inicio)
+        tiempo_bd.observar(ruta, g.pop("metricas_bd", 0.0))
+        queries.observar(ruta, g.pop("metricas_queries", 0))
+        requests_total.incrementar(ruta, g.pop("metricas_status", 500))
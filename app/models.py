@@ -1,14 +1,32 @@
 # app/models.py
+import json
+import time
 from datetime import datetime, date
+from functools import lru_cache
+from flask import current_app
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
-from sqlalchemy import CheckConstraint
+from sqlalchemy import CheckConstraint, event, func, inspect as sa_inspect, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import make_transient_to_detached, validates
 from . import db  # usa la instancia creada en app/__init__.py
+from .cache import TTLCache
+from .replica import usando_replica
 
 
 # =========================
 # USUARIOS
 # =========================
+@lru_cache(maxsize=8)
+def _metodo_hash_efectivo(metodo: str) -> str:
+    # "scrypt" -> "scrypt:32768:8:1", "pbkdf2" -> "pbkdf2:sha256:1000000" (prefijo del hash guardado)
+    return generate_password_hash("", method=metodo).split("$", 1)[0]
+
+
+def metodo_hash_configurado() -> str:
+    return current_app.config.get("PASSWORD_HASH_METHOD") or "scrypt"
+
+
 class Usuario(UserMixin, db.Model):
     __tablename__ = "usuarios"
 
@@ -23,15 +41,74 @@ class Usuario(UserMixin, db.Model):
     actualizado_en = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     def set_password(self, password: str) -> None:
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password, method=metodo_hash_configurado())
 
     def check_password(self, password: str) -> bool:
         return check_password_hash(self.password_hash, password)
 
+    def necesita_rehash(self) -> bool:
+        """True si el hash guardado usa otro método/costo que PASSWORD_HASH_METHOD."""
+        actual = (self.password_hash or "").split("$", 1)[0]
+        return actual != _metodo_hash_efectivo(metodo_hash_configurado())
+
+    def _snapshot(self) -> "Usuario":
+        # copia "detached" con todas las columnas cargadas, apta para merge(load=False)
+        copia = Usuario(**{c.key: getattr(self, c.key) for c in Usuario.__table__.columns})
+        make_transient_to_detached(copia)
+        return copia
+
+
+# Caché por worker para el user_loader de Flask-Login: {id: snapshot de Usuario}
+# (maxsize/ttl se ajustan en create_app desde USER_CACHE_SIZE / USER_CACHE_TTL)
+cache_usuarios = TTLCache(maxsize=1024, ttl=60)
+
+
+def cargar_usuario(user_id: int):
+    """
+    user_loader con caché: en un hit no hay query; el snapshot se une a la sesión
+    actual con merge(load=False), así current_user sigue siendo un objeto persistente.
+    Los cambios hechos en este worker invalidan al instante (_invalidar_usuario); los de
+    otros workers se ven al vencer USER_CACHE_TTL (bajarlo si la revocación debe ser más rápida).
+    """
+    snap = cache_usuarios.get(user_id)
+    if snap is not None:
+        return db.session.merge(snap, load=False)
+    usuario = db.session.get(Usuario, user_id)
+    if usuario is not None:
+        cache_usuarios.set(user_id, usuario._snapshot())
+    return usuario
+
+
+@event.listens_for(Usuario, "after_update")
+@event.listens_for(Usuario, "after_delete")
+def _invalidar_usuario(_mapper, _conn, target):
+    # cambio de clave/rol/cesfam en este proceso -> fuera del caché
+    cache_usuarios.pop(target.id)
+
+
+@event.listens_for(Usuario, "load")
+def _verificar_usuario(target, _ctx):
+    # cualquier lectura fresca con otro actualizado_en (cambio hecho en otro worker) invalida
+    snap = cache_usuarios.peek(target.id)
+    if snap is not None and snap.actualizado_en != target.actualizado_en:
+        cache_usuarios.pop(target.id)
+
 
 # =========================
 # PERÍODOS REMUNERATIVOS
 # =========================
+# Caché por proceso de periodo_vigente_para_fecha: {(réplica?, fecha): (expira_en, (periodo, es_siguiente))}
+# - Se invalida al crear/cambiar períodos (invalidar_cache_periodo).
+# - El TTL sólo cubre a los otros workers, que no ven esa invalidación.
+# - Separado por bind: lo leído de una réplica atrasada no se sirve a vistas que leen del primario.
+PERIODO_CACHE_TTL = 60  # segundos
+_cache_periodo = {}
+
+
+def invalidar_cache_periodo() -> None:
+    _cache_periodo.clear()
+
+
 class PeriodoRemunerativo(db.Model):
     __tablename__ = "periodos_remunerativos"
 
@@ -42,6 +119,7 @@ class PeriodoRemunerativo(db.Model):
     fecha_corte = db.Column(db.Date, nullable=False)   # fecha límite para el mes vigente
     activo = db.Column(db.Boolean, default=True, nullable=False)
     estado = db.Column(db.String(10), default="abierto", nullable=False)  # "abierto" | "cerrado"
+    archivado_en = db.Column(db.DateTime)  # sus actas ya están en actas_archivo (ver archivo.py)
 
     creado_en = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     actualizado_en = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -66,7 +144,31 @@ class PeriodoRemunerativo(db.Model):
         - Si no hay periodo -> (None, False)
         - Si el vigente está 'cerrado' o ya pasó la fecha_corte -> sugiere el mes siguiente.
         - Si sigue dentro de la ventana -> devuelve el vigente.
+        Resultado cacheado por fecha (ver _cache_periodo); el periodo devuelto es
+        siempre un objeto suelto (no ligado a la sesión), sólo para lectura.
         """
+        ahora = time.monotonic()
+        clave = (usando_replica(), fecha_hoy)
+        en_cache = _cache_periodo.get(clave)
+        if en_cache and en_cache[0] > ahora:
+            return en_cache[1]
+
+        resultado = PeriodoRemunerativo._calcular_vigente(fecha_hoy)
+        if len(_cache_periodo) > 62:  # fechas viejas: no crecer sin límite
+            _cache_periodo.clear()
+        _cache_periodo[clave] = (ahora + PERIODO_CACHE_TTL, resultado)
+        return resultado
+
+    def _copia_suelta(self):
+        # copia transitoria: sobrevive al cierre/commit de la sesión que la cargó
+        return PeriodoRemunerativo(
+            id=self.id, anio=self.anio, mes=self.mes,
+            fecha_inicio=self.fecha_inicio, fecha_corte=self.fecha_corte,
+            activo=self.activo, estado=self.estado,
+        )
+
+    @staticmethod
+    def _calcular_vigente(fecha_hoy: date):
         periodo = (
             PeriodoRemunerativo.query.filter_by(activo=True)
             .order_by(PeriodoRemunerativo.anio.desc(), PeriodoRemunerativo.mes.desc())
@@ -92,26 +194,43 @@ class PeriodoRemunerativo(db.Model):
             )
 
         # Sigue vigente
-        return periodo, False
+        return periodo._copia_suelta(), False
 
 
 # =========================
 # ACTAS
 # =========================
+def normalizar_rut(rut):
+    """'12.345.678-5' / '12345678-5' / '123456785' -> '123456785' (dígitos + DV, sin ceros a la izquierda)."""
+    if not rut:
+        return None
+    limpio = "".join(ch for ch in str(rut).upper() if ch.isdigit() or ch == "K").lstrip("0")
+    return limpio if len(limpio) >= 2 else None
+
+
+def rango_prefijo(prefijo: str):
+    """Cotas [desde, hasta) para buscar por prefijo con un seek de índice (sin LIKE)."""
+    return prefijo, prefijo[:-1] + chr(ord(prefijo[-1]) + 1)
+
+
 class Acta(db.Model):
     __tablename__ = "actas"
 
+    archivada = False  # ver ActaArchivada
+
     id = db.Column(db.Integer, primary_key=True)
 
     # Identificación funcionario
     nombres = db.Column(db.String(120), nullable=False)
     apellidos = db.Column(db.String(120), nullable=False)
     rut = db.Column(db.String(20), nullable=False, index=True)
+    rut_normalizado = db.Column(db.String(12))  # ver normalizar_rut (se llena solo); índice en __table_args__
 
     # Tipo de contrato y condicionales
     # Valores esperados: 'Plazo Fijo', 'Reemplazo', 'Plazo Fijo (Convenio)', 'Reemplazo (Convenio)'
     tipo_contrato = db.Column(db.String(40), nullable=False)
     rut_titular_reemplazo = db.Column(db.String(20))
+    rut_titular_reemplazo_normalizado = db.Column(db.String(12))
     nombre_titular_reemplazo = db.Column(db.String(120))
     convenio = db.Column(db.String(120))
     responsable = db.Column(db.String(120))  # obligatorio si es "(Convenio)"
@@ -182,5 +301,391 @@ class Acta(db.Model):
     __table_args__ = (
         # índice compuesto útil para filtro por período y CESFAM
         db.Index("ix_acta_cesfam_periodo", "cesfam", "periodo_anio", "periodo_mes"),
+        # paginación keyset del listado: (creado_en, id) global y por CESFAM
+        db.Index("ix_acta_creado_id", "creado_en", "id"),
+        db.Index("ix_acta_cesfam_creado_id", "cesfam", "creado_en", "id"),
+        # listado filtrado por período (con o sin CESFAM): igualdad + orden keyset sin ordenar aparte
+        db.Index("ix_acta_periodo_creado_id", "periodo_anio", "periodo_mes", "creado_en", "id"),
+        db.Index("ix_acta_cesfam_periodo_creado_id", "cesfam", "periodo_anio", "periodo_mes", "creado_en", "id"),
+        # por persona / titular reemplazado: igualdad y prefijo de RUT, y detección de
+        # traslapes buscando por fecha_termino >= inicio nuevo (sólo contratos recientes)
+        db.Index("ix_acta_rut_norm_termino", "rut_normalizado",
+                 "fecha_termino_contratacion", "fecha_inicio_contratacion"),
+        db.Index("ix_acta_rut_titular_norm_termino", "rut_titular_reemplazo_normalizado",
+                 "fecha_termino_contratacion", "fecha_inicio_contratacion"),
     )
-    
\ No newline at end of file
+
+    @staticmethod
+    def traslapes(columna, rut, inicio, termino, excluir_id=None, limite=10):
+        """
+        Actas con el mismo RUT (normalizado) en `columna` cuyo contrato se cruza con [inicio, termino].
+        El seek es rut = X AND fecha_termino >= inicio: sólo recorre contratos que terminan
+        después del inicio nuevo, no toda la historia de la persona.
+        """
+        rut = normalizar_rut(rut)
+        if not rut or not inicio:
+            return []
+        # UNION en vez de OR: así cada rama es un seek de rango en el índice compuesto
+        q = Acta.query.filter(columna == rut, Acta.fecha_termino_contratacion >= inicio).union_all(
+            Acta.query.filter(columna == rut, Acta.fecha_termino_contratacion.is_(None))
+        )
+        if termino:
+            q = q.filter(db.or_(Acta.fecha_inicio_contratacion <= termino, Acta.fecha_inicio_contratacion.is_(None)))
+        if excluir_id:
+            q = q.filter(Acta.id != excluir_id)
+        return q.order_by(Acta.fecha_inicio_contratacion).limit(limite).all()
+
+    @staticmethod
+    def avisos_traslape(rut, rut_titular, inicio, termino, excluir_id=None):
+        """Mensajes de advertencia (no bloquean) para el mismo funcionario y el mismo titular reemplazado."""
+        avisos = []
+        for a in Acta.traslapes(Acta.rut_normalizado, rut, inicio, termino, excluir_id):
+            avisos.append(
+                f"El RUT {rut} ya tiene el acta #{a.id} ({a.tipo_contrato}, {a.cesfam}) del "
+                f"{a.fecha_inicio_contratacion} al {a.fecha_termino_contratacion}, que se cruza con estas fechas."
+            )
+        for a in Acta.traslapes(Acta.rut_titular_reemplazo_normalizado, rut_titular, inicio, termino, excluir_id):
+            avisos.append(
+                f"El titular {rut_titular} ya está siendo reemplazado en el acta #{a.id} ({a.nombres} {a.apellidos}) "
+                f"del {a.fecha_inicio_contratacion} al {a.fecha_termino_contratacion}."
+            )
+        return avisos
+
+    @validates("rut", "rut_titular_reemplazo")
+    def _normalizar_ruts(self, key, valor):
+        setattr(self, f"{key}_normalizado", normalizar_rut(valor))
+        return valor
+
+    @staticmethod
+    def filtro_rut(columna, texto):
+        """
+        Condición por RUT sobre una columna normalizada:
+        - con guion ('12.345.678-5') -> igualdad exacta
+        - sin guion ('12345')        -> prefijo (rango sobre el índice)
+        """
+        rut = normalizar_rut(texto)
+        if not rut:
+            return None
+        if "-" in texto:
+            return columna == rut
+        desde, hasta = rango_prefijo(rut)
+        return (columna >= desde) & (columna < hasta)
+
+    @classmethod
+    def query_filtrada(cls, cesfam=None, periodo_anio=None, periodo_mes=None, estado=None, tipo_contrato=None, rut=None):
+        """
+        Query base de actas con los filtros del listado (todos opcionales).
+        Período (con o sin CESFAM) + orden keyset quedan cubiertos por ix_acta_[cesfam_]periodo_creado_id.
+        (También sirve para ActaArchivada: mismas columnas.)
+        """
+        q = cls.query
+        if rut:
+            cond = Acta.filtro_rut(cls.rut_normalizado, rut)
+            if cond is not None:
+                q = q.filter(cond)
+        if cesfam:
+            q = q.filter(cls.cesfam == cesfam)
+        if periodo_anio:
+            q = q.filter(cls.periodo_anio == periodo_anio)
+        if periodo_mes:
+            q = q.filter(cls.periodo_mes == periodo_mes)
+        if estado:
+            q = q.filter(cls.estado == estado)
+        if tipo_contrato:
+            q = q.filter(cls.tipo_contrato == tipo_contrato)
+        return q
+
+    @classmethod
+    def pagina_keyset(cls, q, despues_de=None, limite=50):
+        """
+        Devuelve (actas, siguiente_cursor) ordenando por (creado_en, id) desc.
+        - despues_de: tupla (creado_en, id) de la última fila de la página anterior.
+        - Se pide una fila extra para saber si hay página siguiente.
+        Cada página cuesta lo mismo que la primera (no hay OFFSET).
+        """
+        if despues_de:
+            q = q.filter(tuple_(cls.creado_en, cls.id) < tuple_(*despues_de))
+        filas = q.order_by(cls.creado_en.desc(), cls.id.desc()).limit(limite + 1).all()
+        if len(filas) <= limite:
+            return filas, None
+        filas = filas[:limite]
+        ultima = filas[-1]
+        return filas, (ultima.creado_en, ultima.id)
+
+    @staticmethod
+    def registrar_envio_fisico_masivo(criterio, fecha: date, usuario_id: int) -> int:
+        """
+        Marca como enviadas (fecha_envio_fisico, usuario_envio_fisico, estado) todas las actas
+        que cumplen `criterio` y siguen pendientes, con un solo UPDATE. No toca las ya enviadas
+        ni las cerradas. resumen_actas se ajusta en la misma transacción (commit del llamador).
+        Devuelve cuántas actas se marcaron.
+        """
+        condicion = db.and_(
+            criterio,
+            Acta.fecha_envio_fisico.is_(None),
+            db.or_(Acta.estado.is_(None), Acta.estado != "cerrado"),
+        )
+        # Conteo previo por (cesfam, período, estado) para el resumen; FOR UPDATE en PostgreSQL
+        # (en SQLite la transacción de escritura ya serializa)
+        filas = db.session.execute(
+            db.select(Acta.id, Acta.cesfam, Acta.periodo_anio, Acta.periodo_mes, Acta.estado)
+            .where(condicion).with_for_update()
+        ).all()
+        if not filas:
+            return 0
+
+        res = db.session.execute(
+            db.update(Acta).where(condicion)
+            .values(fecha_envio_fisico=fecha, usuario_envio_fisico=usuario_id, estado="enviado")
+            .execution_options(synchronize_session=False)
+        )
+        if res.rowcount != len(filas):
+            db.session.rollback()
+            raise RuntimeError("Las actas cambiaron mientras se registraba el envío; intenta de nuevo.")
+
+        deltas = {}
+        for _id, cesfam, anio, mes, estado in filas:
+            vieja = _clave_resumen(cesfam, anio, mes, estado)
+            nueva = _clave_resumen(cesfam, anio, mes, "enviado")
+            if vieja != nueva:
+                deltas[vieja] = deltas.get(vieja, 0) - 1
+                deltas[nueva] = deltas.get(nueva, 0) + 1
+        ajustar_resumen(db.session.connection(), deltas)
+
+        # el UPDATE masivo no pasa por los eventos del ORM: se audita aparte
+        from .auditoria import registrar
+        registrar(db.session, "actas", [f[0] for f in filas], "update", {
+            "fecha_envio_fisico": fecha, "usuario_envio_fisico": usuario_id, "estado": "enviado",
+        })
+        return res.rowcount
+
+
+# =========================
+# ARCHIVO (períodos cerrados)
+# =========================
+class ActaArchivada(db.Model):
+    """
+    Actas de períodos cerrados y archivados (ver archivo.py): mismas columnas e ids que actas,
+    sólo lectura. Sacarlas de actas mantiene chicos la tabla y los índices del trabajo diario.
+    """
+    __table__ = db.Table(
+        "actas_archivo", db.metadata,
+        *[c._copy() for c in Acta.__table__.columns],
+        db.Index("ix_acta_archivo_periodo_cesfam", "periodo_anio", "periodo_mes", "cesfam"),
+        db.Index("ix_acta_archivo_creado_id", "creado_en", "id"),
+        db.Index("ix_acta_archivo_periodo_creado_id", "periodo_anio", "periodo_mes", "creado_en", "id"),
+        db.Index("ix_acta_archivo_cesfam_periodo_creado_id", "cesfam", "periodo_anio", "periodo_mes", "creado_en", "id"),
+        db.Index("ix_acta_archivo_rut_norm", "rut_normalizado"),
+    )
+
+    archivada = True
+    # sin FK en la tabla de archivo: join explícito, sólo lectura
+    usuario = db.relationship("Usuario", primaryjoin="foreign(ActaArchivada.usuario_id) == Usuario.id", viewonly=True)
+
+    query_filtrada = classmethod(Acta.query_filtrada.__func__)
+    pagina_keyset = classmethod(Acta.pagina_keyset.__func__)
+
+
+# =========================
+# RESUMEN (dashboard)
+# =========================
+class ResumenActas(db.Model):
+    """
+    Conteo de actas por (período, CESFAM, estado), mantenido incrementalmente:
+    - eventos ORM de Acta (insert / cambio de estado, CESFAM o período / delete)
+    - ajustar_resumen() explícito en los caminos masivos (importación, updates en bloque)
+    El dashboard lee unas pocas filas de aquí en vez de hacer COUNT sobre actas.
+    """
+    __tablename__ = "resumen_actas"
+
+    periodo_anio = db.Column(db.Integer, primary_key=True)
+    periodo_mes = db.Column(db.Integer, primary_key=True)
+    cesfam = db.Column(db.String(120), primary_key=True)
+    estado = db.Column(db.String(20), primary_key=True)
+    total = db.Column(db.Integer, nullable=False, default=0)
+
+
+def _clave_resumen(cesfam, periodo_anio, periodo_mes, estado):
+    return (cesfam, periodo_anio, periodo_mes, estado or "borrador")
+
+
+def ajustar_resumen(conn, deltas: dict) -> None:
+    """
+    Suma cada delta a su fila {(cesfam, anio, mes, estado): +n/-n} con un upsert.
+    Debe correr en la misma transacción que el cambio en actas.
+    """
+    tabla = ResumenActas.__table__
+    for (cesfam, anio, mes, estado), delta in deltas.items():
+        if not delta:
+            continue
+        valores = dict(cesfam=cesfam, periodo_anio=anio, periodo_mes=mes, estado=estado, total=delta)
+        if conn.dialect.name in ("sqlite", "postgresql"):
+            dialecto = sqlite if conn.dialect.name == "sqlite" else postgresql
+            stmt = dialecto.insert(tabla).values(**valores)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[c.name for c in tabla.primary_key],
+                set_={"total": tabla.c.total + stmt.excluded.total},
+            )
+            conn.execute(stmt)
+        else:
+            filtro = (
+                (tabla.c.cesfam == cesfam) & (tabla.c.periodo_anio == anio)
+                & (tabla.c.periodo_mes == mes) & (tabla.c.estado == estado)
+            )
+            if conn.execute(tabla.update().where(filtro).values(total=tabla.c.total + delta)).rowcount == 0:
+                conn.execute(tabla.insert().values(**valores))
+
+
+def recalcular_resumen(conn) -> None:
+    """Reconstruye resumen_actas completo desde actas y actas_archivo (backfill / reparación)."""
+    tabla = ResumenActas.__table__
+    # actas + actas_archivo: archivar no cambia los conteos del dashboard
+    todas = db.union_all(*[
+        db.select(m.cesfam, m.periodo_anio, m.periodo_mes, func.coalesce(m.estado, "borrador").label("estado"))
+        for m in (Acta, ActaArchivada)
+    ]).subquery()
+    conn.execute(tabla.delete())
+    conn.execute(tabla.insert().from_select(
+        ["cesfam", "periodo_anio", "periodo_mes", "estado", "total"],
+        db.select(todas.c.cesfam, todas.c.periodo_anio, todas.c.periodo_mes, todas.c.estado, func.count())
+        .group_by(todas.c.cesfam, todas.c.periodo_anio, todas.c.periodo_mes, todas.c.estado),
+    ))
+
+
+def _cargar_anterior(_target, _valor, _anterior, _iniciador):
+    pass
+
+
+# La clave del resumen carga su valor anterior al asignarse aunque el acta venga expirada (p. ej.
+# tras un commit); si no, el historial queda vacío y _resumen_update no sabría de qué fila restar.
+for _attr in (Acta.cesfam, Acta.periodo_anio, Acta.periodo_mes, Acta.estado):
+    event.listen(_attr, "set", _cargar_anterior, active_history=True)
+
+
+@event.listens_for(Acta, "after_insert")
+def _resumen_insert(_mapper, conn, target):
+    clave = _clave_resumen(target.cesfam, target.periodo_anio, target.periodo_mes, target.estado)
+    ajustar_resumen(conn, {clave: 1})
+
+
+@event.listens_for(Acta, "after_update")
+def _resumen_update(_mapper, conn, target):
+    estado_obj = sa_inspect(target)
+
+    def antes(attr):
+        hist = estado_obj.attrs[attr].history
+        return hist.deleted[0] if hist.deleted else getattr(target, attr)
+
+    vieja = _clave_resumen(antes("cesfam"), antes("periodo_anio"), antes("periodo_mes"), antes("estado"))
+    nueva = _clave_resumen(target.cesfam, target.periodo_anio, target.periodo_mes, target.estado)
+    if vieja != nueva:
+        ajustar_resumen(conn, {vieja: -1, nueva: 1})
+
+
+@event.listens_for(Acta, "after_delete")
+def _resumen_delete(_mapper, conn, target):
+    clave = _clave_resumen(target.cesfam, target.periodo_anio, target.periodo_mes, target.estado)
+    ajustar_resumen(conn, {clave: -1})
+
+
+# =========================
+# CATÁLOGOS (opciones de los selects)
+# =========================
+class Catalogo(db.Model):
+    """
+    Un catálogo de opciones ('establecimientos', 'afp', 'nacionalidades', 'tipos_contrato').
+    `version` sube con cada cambio de sus opciones: invalida los cachés de los workers
+    y el ETag del endpoint JSON (ver catalogos.py).
+    """
+    __tablename__ = "catalogos"
+
+    nombre = db.Column(db.String(40), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=1)
+    actualizado_en = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    opciones = db.relationship("CatalogoOpcion", backref="catalogo_rel", order_by="CatalogoOpcion.orden")
+
+
+class CatalogoOpcion(db.Model):
+    __tablename__ = "catalogo_opciones"
+
+    id = db.Column(db.Integer, primary_key=True)
+    catalogo = db.Column(db.String(40), db.ForeignKey("catalogos.nombre"), nullable=False)
+    valor = db.Column(db.String(120), nullable=False)
+    etiqueta = db.Column(db.String(120), nullable=False)
+    orden = db.Column(db.Integer, nullable=False, default=0)
+    activo = db.Column(db.Boolean, nullable=False, default=True)
+
+    __table_args__ = (
+        db.UniqueConstraint("catalogo", "valor", name="uq_catalogo_valor"),
+        db.Index("ix_catalogo_opciones_catalogo_orden", "catalogo", "orden"),
+    )
+
+
+# =========================
+# AUDITORÍA (sólo inserción; ver auditoria.py)
+# =========================
+class Auditoria(db.Model):
+    """Un cambio sobre actas, períodos o usuarios: quién, cuándo, desde dónde y qué campos."""
+    __tablename__ = "auditoria"
+
+    id = db.Column(db.Integer, primary_key=True)
+    creado_en = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    usuario_id = db.Column(db.Integer)           # sin FK: el registro sobrevive al usuario
+    origen = db.Column(db.String(80))            # endpoint de la request o "cli"
+    tabla = db.Column(db.String(40), nullable=False)
+    registro_id = db.Column(db.Integer, nullable=False)
+    accion = db.Column(db.String(10), nullable=False)  # 'insert' | 'update' | 'delete'
+    cambios = db.Column(db.Text)                 # JSON: {campo: valor} (insert) o {campo: [antes, después]}
+
+    __table_args__ = (
+        db.Index("ix_auditoria_tabla_registro", "tabla", "registro_id", "id"),
+        db.Index("ix_auditoria_creado_en", "creado_en"),
+    )
+
+
+# =========================
+# TRABAJOS EN SEGUNDO PLANO (ver trabajos.py)
+# =========================
+class Trabajo(db.Model):
+    """
+    Tarea larga (export, lote de PDFs, importación) encolada en la BD.
+    estado: 'pendiente' -> 'ejecutando' -> 'listo' | 'error'
+    """
+    __tablename__ = "trabajos"
+
+    id = db.Column(db.Integer, primary_key=True)
+    tipo = db.Column(db.String(30), nullable=False)
+    estado = db.Column(db.String(12), nullable=False, default="pendiente")
+    parametros = db.Column(db.Text)                # JSON
+    usuario_id = db.Column(db.Integer, db.ForeignKey("usuarios.id"), nullable=False)
+
+    creado_en = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    iniciado_en = db.Column(db.DateTime)
+    terminado_en = db.Column(db.DateTime)
+    latido_en = db.Column(db.DateTime)             # el worker lo renueva mientras corre (ver trabajos.py)
+    worker = db.Column(db.String(80))              # host:pid:hilo que lo tomó
+    intentos = db.Column(db.Integer, nullable=False, default=0)
+
+    progreso = db.Column(db.Integer, nullable=False, default=0)
+    total = db.Column(db.Integer)
+    mensaje = db.Column(db.Text)                   # error o resumen legible
+    resultado = db.Column(db.Text)                 # JSON con datos del resultado
+    archivo = db.Column(db.String(255))            # ruta del archivo descargable (TRABAJOS_FOLDER)
+    nombre_descarga = db.Column(db.String(120))
+
+    __table_args__ = (
+        # la cola: el más antiguo pendiente
+        db.Index("ix_trabajos_estado_id", "estado", "id"),
+        db.Index("ix_trabajos_usuario_id", "usuario_id", "id"),
+    )
+
+    def a_dict(self) -> dict:
+        return {
+            "id": self.id, "tipo": self.tipo, "estado": self.estado,
+            "creado_en": self.creado_en.isoformat() if self.creado_en else None,
+            "terminado_en": self.terminado_en.isoformat() if self.terminado_en else None,
+            "progreso": self.progreso, "total": self.total, "mensaje": self.mensaje,
+            "resultado": json.loads(self.resultado) if self.resultado else None,
+            "descargable": bool(self.archivo) and self.estado == "listo",
+        }
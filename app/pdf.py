@@ -0,0 +1,204 @@
+# app/pdf.py
+import hashlib
+import json
+import os
+import time
+from datetime import date, datetime
+from io import BytesIO
+from xml.sax.saxutils import escape
+
+from flask import current_app
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import LETTER
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.units import cm
+from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from . import db
+from .auditoria import registrar
+from .models import Acta
+
+# Subir si cambia el diseño del PDF: invalida todo el caché de una vez
+VERSION_PLANTILLA = 1
+
+# firma_hash se deriva del propio PDF, no puede ser parte de la clave
+_EXCLUIDAS_DE_CLAVE = {"firma_hash"}
+
+# Un PDF servido renueva su mtime (= último uso, ver limpiar_cache_pdf) a lo más una vez por este lapso
+RENOVAR_USO_CADA = 86400  # segundos
+
+
+# =========================
+# Clave de caché
+# =========================
+def _serializar(valor):
+    if isinstance(valor, (date, datetime)):
+        return valor.isoformat()
+    return valor
+
+
+def clave_cache(acta: Acta) -> str:
+    """SHA-256 del contenido del acta (incluye modificado_en) + versión de plantilla."""
+    contenido = {
+        c.name: _serializar(getattr(acta, c.name))
+        for c in Acta.__table__.columns
+        if c.name not in _EXCLUIDAS_DE_CLAVE
+    }
+    contenido["_v"] = VERSION_PLANTILLA
+    crudo = json.dumps(contenido, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(crudo).hexdigest()
+
+
+def ruta_cache(clave: str) -> str:
+    # dos niveles (ab/abcdef...pdf) para no llenar un solo directorio
+    carpeta = current_app.config["PDF_CACHE_FOLDER"]
+    return os.path.join(carpeta, clave[:2], f"{clave}.pdf")
+
+
+# =========================
+# Render
+# =========================
+def _fmt(valor):
+    """Texto de un valor para un Paragraph: Paragraph interpreta marcado, así que se escapa < & >."""
+    if valor is None or valor == "":
+        return "—"
+    if isinstance(valor, datetime):
+        return valor.strftime("%d-%m-%Y %H:%M")
+    if isinstance(valor, date):
+        return valor.strftime("%d-%m-%Y")
+    return escape(str(valor))
+
+
+def render_pdf(acta: Acta) -> bytes:
+    """Dibuja el acta con reportlab. invariant=1 → mismos datos, mismos bytes."""
+    buf = BytesIO()
+    doc = SimpleDocTemplate(
+        buf, pagesize=LETTER,
+        leftMargin=2 * cm, rightMargin=2 * cm, topMargin=1.5 * cm, bottomMargin=1.5 * cm,
+        title=f"Acta {acta.correlativo or acta.id}", invariant=1,
+    )
+    estilos = getSampleStyleSheet()
+    celda = estilos["BodyText"]
+    story = []
+
+    logo = os.path.join(current_app.static_folder, "logo.png")
+    if os.path.exists(logo):
+        story.append(Image(logo, width=3 * cm, height=3 * cm, kind="proportional", hAlign="LEFT"))
+    story.append(Paragraph("ACTA DE CONTRATACIÓN", estilos["Title"]))
+    story.append(Spacer(1, 0.3 * cm))
+
+    filas = [
+        ("N° Correlativo", acta.correlativo), ("Fecha de acta", acta.fecha_acta),
+        ("Nombres", acta.nombres), ("Apellidos", acta.apellidos),
+        ("RUT", acta.rut), ("Fecha nacimiento", acta.fecha_nacimiento),
+        ("Dirección", acta.direccion), ("Teléfono", acta.telefono),
+        ("Email", acta.email), ("Estado civil", acta.estado_civil),
+        ("Nacionalidad", acta.nacionalidad), ("Lugar nacimiento", acta.lugar_nacimiento),
+        ("Tipo de contrato", acta.tipo_contrato),
+        ("Período remunerativo", f"{acta.periodo_mes:02d}/{acta.periodo_anio}"),
+        ("RUT titular reemplazo", acta.rut_titular_reemplazo), ("Nombre titular reemplazo", acta.nombre_titular_reemplazo),
+        ("Inicio contratación", acta.fecha_inicio_contratacion), ("Término contratación", acta.fecha_termino_contratacion),
+        ("Cargo", acta.cargo), ("Categoría", acta.categoria),
+        ("Jornada", acta.jornada), ("Establecimiento", acta.lugar_trabajo),
+        ("Salud", acta.salud), ("Plan Isapre", acta.plan_isapre),
+        ("AFP", acta.afp), ("Convenio", acta.convenio),
+        ("Responsable", acta.responsable), ("Motivo", acta.motivo),
+    ]
+    # dos pares (etiqueta, valor) por fila, como el formulario
+    data = []
+    for i in range(0, len(filas), 2):
+        fila = []
+        for etiqueta, valor in filas[i:i + 2]:
+            fila += [Paragraph(f"<b>{etiqueta}</b>", celda), Paragraph(_fmt(valor), celda)]
+        data.append(fila)
+    for etiqueta, valor in (("Horario jornada", acta.horario_jornada), ("Observaciones", acta.observaciones)):
+        data.append([Paragraph(f"<b>{etiqueta}</b>", celda), Paragraph(_fmt(valor), celda), "", ""])
+
+    tabla = Table(data, colWidths=[3.5 * cm, 5 * cm, 3.5 * cm, 5 * cm])
+    tabla.setStyle(TableStyle([
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("SPAN", (1, len(data) - 2), (3, len(data) - 2)),
+        ("SPAN", (1, len(data) - 1), (3, len(data) - 1)),
+    ]))
+    story.append(tabla)
+    story.append(Spacer(1, 1 * cm))
+
+    if acta.firma_path:
+        firma = os.path.join(current_app.root_path, acta.firma_path)
+        if os.path.exists(firma):
+            story.append(Image(firma, width=5 * cm, height=2.5 * cm, kind="proportional"))
+    story.append(Paragraph(_fmt(acta.nombre_encargado), estilos["Normal"]))
+    story.append(Paragraph(_fmt(acta.cargo_encargado), estilos["Normal"]))
+    story.append(Spacer(1, 0.8 * cm))
+    story.append(Paragraph(
+        f"El postulante Sr. (a) {escape(acta.nombres or '')} {escape(acta.apellidos or '')} cumplirá funciones en el establecimiento, "
+        "una vez emitida la Autorización de Ingreso por el Encargado de la Unidad de Gestión de Personas "
+        "del Departamento de Salud.",
+        estilos["BodyText"],
+    ))
+
+    doc.build(story)
+    return buf.getvalue()
+
+
+# =========================
+# Caché en disco
+# =========================
+def obtener_pdf(acta: Acta) -> str:
+    """
+    Devuelve la ruta del PDF cacheado del acta, renderizándolo sólo si no existe.
+    Al renderizar, registra el SHA-256 del PDF en firma_hash (sin tocar modificado_en,
+    que es parte de la clave), salvo en actas firmadas con imagen.
+    """
+    clave = clave_cache(acta)
+    ruta = ruta_cache(clave)
+    try:
+        usado = os.stat(ruta).st_mtime
+    except FileNotFoundError:
+        usado = None
+    if usado is not None:
+        if time.time() - usado > RENOVAR_USO_CADA:
+            os.utime(ruta)
+        return ruta
+
+    contenido = render_pdf(acta)
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    tmp = f"{ruta}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(contenido)
+    os.replace(tmp, ruta)  # atómico: otro worker nunca ve un PDF a medias
+
+    digest = hashlib.sha256(contenido).hexdigest()
+    # con firma de imagen, firma_hash ya es el hash de esa imagen (ver firmas.py)
+    if acta.firma_tipo != "imagen" and acta.firma_hash != digest:
+        anterior = acta.firma_hash  # el UPDATE sincroniza el objeto de la sesión
+        res = db.session.execute(
+            db.update(Acta)
+            .where(Acta.id == acta.id)
+            .values(firma_hash=digest, modificado_en=Acta.modificado_en)  # evita el onupdate
+        )
+        if res.rowcount:  # 0 si el acta está archivada: actas_archivo es de sólo lectura
+            registrar(db.session, "actas", [acta.id], "update", {"firma_hash": [anterior, digest]})
+        db.session.commit()
+    return ruta
+
+
+def limpiar_cache_pdf(dias: int) -> int:
+    """
+    Borra los PDF del caché sin uso hace más de `dias` días (y temporales abandonados).
+    Una versión vieja de un acta nunca se vuelve a pedir: sin esto la carpeta sólo crece.
+    Devuelve cuántos archivos borró.
+    """
+    limite = time.time() - dias * 86400
+    borrados = 0
+    for raiz, _dirs, archivos in os.walk(current_app.config["PDF_CACHE_FOLDER"]):
+        for nombre in archivos:
+            ruta = os.path.join(raiz, nombre)
+            try:
+                if os.stat(ruta).st_mtime < limite:
+                    os.remove(ruta)
+                    borrados += 1
+            except FileNotFoundError:  # otro worker lo borró primero
+                pass
+    return borrados
@@ -0,0 +1,35 @@
+# app/perfil_sqlite.py
+from sqlalchemy import event
+
+# Perfil de producción para SQLite (se aplica a cada conexión nueva).
+# - WAL: lectores no se bloquean detrás de escritores (y viceversa)
+# - busy_timeout: el escritor espera el lock en vez de fallar con "database is locked"
+# - synchronous=NORMAL: seguro con WAL; evita un fsync por commit
+# - mmap_size / cache_size: lecturas desde memoria (cache_size negativo = KiB)
+PRAGMAS_DEFECTO = {
+    "journal_mode": "WAL",
+    "busy_timeout": 5000,          # ms
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,      # 64 MiB
+}
+
+
+def aplicar_perfil_sqlite(app, engine):
+    """
+    Registra el listener "connect" en `engine` si es SQLite.
+    Los PRAGMAs salen de app.config['SQLITE_PRAGMAS'] al momento de conectar
+    ({} desactiva el perfil).
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _pragmas(dbapi_conn, _record):
+        pragmas = app.config.get("SQLITE_PRAGMAS") or {}
+        cur = dbapi_conn.cursor()
+        try:
+            for nombre, valor in pragmas.items():
+                cur.execute(f"PRAGMA {nombre}={valor}")
+        finally:
+            cur.close()
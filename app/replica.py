@@ -0,0 +1,62 @@
+# app/replica.py
+from functools import wraps
+
+import sqlalchemy as sa
+from flask import g, has_request_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+# Clave del bind de sólo lectura en SQLALCHEMY_BINDS
+BIND_REPLICA = "replica"
+
+
+def usando_replica() -> bool:
+    """True si la request actual pidió leer desde la réplica (ver @lectura_replica)."""
+    return has_request_context() and g.get("usar_replica", False)
+
+
+def lectura_replica(vista):
+    """
+    Marca una vista como de sólo lectura: sus SELECT van a la réplica si está configurada.
+    Va debajo de @login_required, así el usuario (current_user) se carga siempre del primario.
+    Como usa `g`, también cubre los generadores envueltos en stream_with_context.
+    """
+    @wraps(vista)
+    def envoltura(*args, **kwargs):
+        g.usar_replica = True
+        return vista(*args, **kwargs)
+    return envoltura
+
+
+class SesionEnrutada(Session):
+    """
+    Session de Flask-SQLAlchemy que manda los SELECT a la réplica cuando la request
+    lo pidió. Escrituras, flush y todo lo demás siguen en el primario, de modo que una
+    vista sin @lectura_replica (ej. ver_acta después de registrar) lee lo recién escrito.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (
+            bind is None
+            and not self._flushing
+            and isinstance(clause, sa.Select)
+            and usando_replica()
+        ):
+            engine = self._db.engines.get(BIND_REPLICA)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def configurar_replica(engine):
+    """En SQLite la réplica se abre con query_only: cualquier escritura enrutada por error falla."""
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def _solo_lectura(dbapi_conn, _record):
+        cur = dbapi_conn.cursor()
+        try:
+            cur.execute("PRAGMA query_only=ON")
+        finally:
+            cur.close()
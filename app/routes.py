@@ -1,10 +1,20 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, request, abort, current_app
+from flask import Blueprint, render_template, redirect, url_for, flash, request, abort, current_app, Response, stream_with_context, send_file, jsonify, g
 from flask_login import login_user, logout_user, login_required, current_user
 from datetime import datetime, date
-from werkzeug.utils import secure_filename
 import os
-
-from .models import db, Usuario, Acta, PeriodoRemunerativo
+import uuid
+
+from .models import db, Usuario, Acta, PeriodoRemunerativo, ResumenActas, Trabajo, invalidar_cache_periodo, cache_usuarios
+from .archivo import acta_o_404, consultas_actas, modelo_periodo
+from .busqueda import buscar_actas
+from .condicional import etag_de, respuesta_condicional, version_acta_o_404, version_listado
+from . import catalogos, trabajos
+from .exportar import exportar_xlsx, iterar_csv, stream_y_borrar
+from .firmas import enviar_firma, guardar_firma
+from .importar import leer_planilla, importar_actas
+from .metricas import exponer_metricas
+from .pdf import obtener_pdf
+from .replica import lectura_replica
 from .forms import LoginForm, RegistrarActaForm
 
 # =========================
@@ -21,6 +31,63 @@ def require_superuser():
         abort(403)
 
 
+def parsear_periodo(texto):
+    """'AAAA-MM' -> (año, mes); None si el mes no es 1-12 o el año no está entre 2000 y 2100 (como year_range)."""
+    try:
+        anio, mes = (int(x) for x in texto.split("-", 1))
+    except (AttributeError, ValueError):
+        return None
+    if not (2000 <= anio <= 2100 and 1 <= mes <= 12):
+        return None
+    return anio, mes
+
+
+def filtros_actas_desde_request():
+    """
+    Lee los filtros del listado desde request.args.
+    - periodo: 'YYYY-MM' (formato de <input type="month">)
+    - rut: exacto si trae guion, si no prefijo (sobre rut_normalizado)
+    - Administrativos quedan siempre limitados a su CESFAM.
+    """
+    filtros = {
+        "cesfam": (request.args.get("cesfam") or "").strip() or None,
+        "estado": (request.args.get("estado") or "").strip() or None,
+        "tipo_contrato": (request.args.get("tipo_contrato") or "").strip() or None,
+        "rut": (request.args.get("rut") or "").strip() or None,
+        "periodo_anio": None,
+        "periodo_mes": None,
+    }
+    periodo = (request.args.get("periodo") or "").strip()
+    if periodo:
+        valido = parsear_periodo(periodo)
+        if valido:
+            filtros["periodo_anio"], filtros["periodo_mes"] = valido
+        else:
+            flash("Período de filtro inválido (usa AAAA-MM, entre 2000 y 2100).", "warning")
+    if getattr(current_user, "rol", "administrativo") != "superusuario":
+        filtros["cesfam"] = current_user.cesfam
+    return filtros
+
+
+def encode_cursor(valor):
+    """(creado_en, id) -> 'AAAA-MM-DDTHH:MM:SS.ffffff_ID' para la URL."""
+    if not valor:
+        return None
+    creado_en, acta_id = valor
+    return f"{creado_en.isoformat()}_{acta_id}"
+
+
+def decode_cursor(texto):
+    """Inverso de encode_cursor; cursor inválido -> primera página."""
+    if not texto:
+        return None
+    try:
+        creado, acta_id = texto.rsplit("_", 1)
+        return datetime.fromisoformat(creado), int(acta_id)
+    except ValueError:
+        return None
+
+
 # =========================
 # Inicio / Autenticación
 # =========================
@@ -41,6 +108,10 @@ def login():
     if form.validate_on_submit():
         usuario = Usuario.query.filter_by(username=form.username.data).first()
         if usuario and usuario.check_password(form.password.data):
+            # Si cambió PASSWORD_HASH_METHOD, se actualiza el hash con la clave recién verificada
+            if usuario.necesita_rehash():
+                usuario.set_password(form.password.data)
+                db.session.commit()
             login_user(usuario)
             return redirect(url_for('main.listar_actas'))
         flash('Nombre de usuario o contraseña incorrectos', 'danger')
@@ -93,6 +164,7 @@ def periodos_nuevo():
     )
     db.session.add(p)
     db.session.commit()
+    invalidar_cache_periodo()
     flash("Período creado.", "success")
     return redirect(url_for("main.periodos_list"))
 
@@ -103,34 +175,289 @@ def periodos_estado(pid):
     require_superuser()
     p = PeriodoRemunerativo.query.get_or_404(pid)
     nuevo = request.form.get("estado")
+    if nuevo == "abierto" and p.archivado_en:
+        flash("El período está archivado; desarchívalo antes de reabrirlo (flask desarchivar-periodo).", "warning")
+        return redirect(url_for("main.periodos_list"))
     if nuevo in ("abierto", "cerrado"):
         p.estado = nuevo
         db.session.commit()
+        invalidar_cache_periodo()
         flash(f"Período marcado como {nuevo}.", "success")
     return redirect(url_for("main.periodos_list"))
 
 
+@bp.route("/dashboard")
+@login_required
+@lectura_replica
+def dashboard():
+    require_superuser()
+    # Período a mostrar: ?periodo=AAAA-MM o el vigente
+    valido = parsear_periodo(request.args.get("periodo"))
+    if valido:
+        anio, mes = valido
+    else:
+        periodo, _ = PeriodoRemunerativo.periodo_vigente_para_fecha(date.today())
+        anio, mes = (periodo.anio, periodo.mes) if periodo else (date.today().year, date.today().month)
+
+    filas = ResumenActas.query.filter_by(periodo_anio=anio, periodo_mes=mes).all()
+    estados = ("borrador", "enviado", "cerrado")
+    tabla = {}
+    for f in filas:
+        if f.total:
+            tabla.setdefault(f.cesfam, dict.fromkeys(estados, 0))[f.estado] = f.total
+    totales = {e: sum(t.get(e, 0) for t in tabla.values()) for e in estados}
+    return render_template("dashboard.html", tabla=dict(sorted(tabla.items())), estados=estados,
+                           totales=totales, periodo=f"{anio}-{mes:02d}")
+
+
+@bp.route("/admin/cache")
+@login_required
+def admin_cache():
+    # Contadores de los cachés del worker que atiende la request
+    require_superuser()
+    return jsonify({"usuarios": cache_usuarios.stats()})
+
+
+@bp.route("/catalogos/<nombre>.json")
+@login_required
+def catalogo_json(nombre):
+    # Opciones de un select. Con ?v=<versión vigente> (URL que arma reducir_choices) el navegador
+    # la guarda sin revalidar; sin v, revalida con ETag (304 si no cambió).
+    if nombre not in catalogos.DEFECTOS:
+        abort(404)
+    version = catalogos.version(nombre)
+    resp = jsonify(catalogo=nombre, version=version,
+                   opciones=[{"valor": v, "etiqueta": e} for (v, e) in catalogos.opciones(nombre)])
+    resp.set_etag(f"catalogo-{nombre}-{version}")
+    if request.args.get("v") == str(version):
+        resp.headers["Cache-Control"] = "private, max-age=31536000, immutable"
+    else:
+        resp.headers["Cache-Control"] = "private, no-cache"
+    return resp.make_conditional(request)
+
+
+@bp.route("/metrics")
+def metrics():
+    # Formato Prometheus; contadores del worker que atiende la request.
+    # Con METRICS_TOKEN: "Authorization: Bearer <token>" (para el scraper); si no, superusuario.
+    token = current_app.config.get("METRICS_TOKEN")
+    if token:
+        if request.headers.get("Authorization") != f"Bearer {token}":
+            abort(401)
+    elif not current_user.is_authenticated or current_user.rol != "superusuario":
+        abort(403)
+    return Response(exponer_metricas(), mimetype="text/plain; version=0.0.4")
+
+
 # =========================
 # Actas
 # =========================
 @bp.route('/actas')
 @login_required
+@lectura_replica
 def listar_actas():
-    q = Acta.query
+    filtros = filtros_actas_desde_request()
+    try:
+        por_pagina = min(max(int(request.args.get("por_pagina", 50)), 1), 200)
+    except ValueError:
+        por_pagina = 50
+
+    # Un período archivado se lee de actas_archivo (ver archivo.py)
+    modelo = modelo_periodo(filtros["periodo_anio"], filtros["periodo_mes"])
+    q = modelo.query_filtrada(**filtros)
+
+    # GET condicional: si el conjunto filtrado no cambió (cantidad, última modificación, id máximo),
+    # 304 sin traer las filas ni renderizar
+    etag = etag_de("listado", request.full_path, *version_listado(q, modelo), catalogos.versiones())
+
+    def renderizar():
+        actas, siguiente = modelo.pagina_keyset(q, decode_cursor(request.args.get("cursor")), por_pagina)
+        # Parámetros de filtro a conservar en los enlaces de paginación
+        args = {k: v for k, v in request.args.items() if k != "cursor" and v}
+        return render_template('listar_actas.html',
+                               actas=actas,
+                               filtros=filtros,
+                               args=args,
+                               siguiente_cursor=encode_cursor(siguiente),
+                               es_primera=not request.args.get("cursor"),
+                               estados=("borrador", "enviado", "cerrado"),
+                               tipos_contrato=catalogos.valores("tipos_contrato"),
+                               cesfams=catalogos.valores("establecimientos"))
+
+    return respuesta_condicional(etag, None, renderizar)
+
+
+@bp.route('/actas/buscar')
+@login_required
+@lectura_replica
+def buscar_actas_view():
+    # Misma regla de alcance que listar_actas: administrativos sólo ven su CESFAM
+    texto = (request.args.get("q") or "").strip()
+    cesfam = None
     if getattr(current_user, "rol", "administrativo") != "superusuario":
-        q = q.filter_by(cesfam=current_user.cesfam)
-    actas = q.order_by(Acta.creado_en.desc()).limit(100).all()
-    return render_template('listar_actas.html', actas=actas)
+        cesfam = current_user.cesfam
+    actas = buscar_actas(texto, cesfam=cesfam) if texto else []
+    return render_template('buscar_actas.html', actas=actas, q=texto)
+
+
+@bp.route('/actas/exportar.xlsx')
+@login_required
+@lectura_replica
+def exportar_actas_xlsx():
+    # Export de remuneraciones: siempre acotado a un período (AAAA-MM)
+    filtros = filtros_actas_desde_request()
+    if not (filtros["periodo_anio"] and filtros["periodo_mes"]):
+        flash("Selecciona un período para exportar.", "warning")
+        return redirect(url_for('main.listar_actas', **request.args))
+
+    # Un .xlsx es un ZIP que XlsxWriter cierra al final: no hay primer byte hasta tener el archivo
+    # completo. Sobre EXPORT_XLSX_SINCRONO_MAX filas se genera en la cola de trabajos, no en la request.
+    consultas = consultas_actas(filtros)
+    if sum(q.order_by(None).count() for q in consultas) > current_app.config["EXPORT_XLSX_SINCRONO_MAX"]:
+        g.usar_replica = False  # el trabajo recién creado se relee del primario
+        t = trabajos.encolar("exportar_xlsx", filtros, current_user.id)
+        flash(f"El export es grande: quedó como trabajo #{t.id}; descárgalo desde aquí cuando termine.", "success")
+        return redirect(url_for('main.trabajos_list'))
+
+    ruta = exportar_xlsx(*consultas)
+    nombre = f"actas_{filtros['periodo_anio']}_{filtros['periodo_mes']:02d}.xlsx"
+    return Response(
+        stream_y_borrar(ruta),
+        mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        headers={
+            "Content-Disposition": f"attachment; filename={nombre}",
+            "Content-Length": str(os.path.getsize(ruta)),
+        },
+    )
+
+
+@bp.route('/actas/exportar.csv')
+@login_required
+@lectura_replica
+def exportar_actas_csv():
+    # Mismos filtros del listado (CESFAM, período, estado, tipo); sin límite de filas
+    filtros = filtros_actas_desde_request()
+    nombre = "actas.csv"
+    if filtros["periodo_anio"] and filtros["periodo_mes"]:
+        nombre = f"actas_{filtros['periodo_anio']}_{filtros['periodo_mes']:02d}.csv"
+    return Response(
+        stream_with_context(iterar_csv(*consultas_actas(filtros))),
+        mimetype="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f"attachment; filename={nombre}"},
+    )
+
+
+# =========================
+# Trabajos en segundo plano (ver trabajos.py)
+# =========================
+@bp.route('/trabajos')
+@login_required
+def trabajos_list():
+    q = Trabajo.query.order_by(Trabajo.id.desc())
+    if current_user.rol != 'superusuario':
+        q = q.filter_by(usuario_id=current_user.id)
+    return render_template('trabajos.html', trabajos=q.limit(50).all())
+
+
+@bp.route('/trabajos/<tipo>', methods=['POST'])
+@login_required
+def trabajos_crear(tipo):
+    # Exports y PDFs: mismos filtros del listado (en la query string, como los exports directos)
+    if tipo in ("exportar_xlsx", "exportar_csv", "pdfs_periodo"):
+        parametros = filtros_actas_desde_request()
+        if tipo != "exportar_csv" and not (parametros["periodo_anio"] and parametros["periodo_mes"]):
+            flash("Selecciona un período.", "warning")
+            return redirect(url_for('main.listar_actas', **request.args))
+    elif tipo == "importar":
+        require_superuser()
+        archivo = request.files.get('archivo')
+        ext = (getattr(archivo, "filename", "") or "").rsplit(".", 1)[-1].lower()
+        if ext not in ("xlsx", "xls", "csv"):
+            flash("Selecciona una planilla (.xlsx o .csv).", "warning")
+            return redirect(url_for('main.importar_actas_view'))
+        periodo, _pasa_siguiente = PeriodoRemunerativo.periodo_vigente_para_fecha(date.today())
+        if not periodo:
+            flash("No existe período remunerativo activo configurado.", "warning")
+            return redirect(url_for("main.periodos_list"))
+        # la planilla queda en TRABAJOS_FOLDER hasta que el trabajo la lee (y la borra)
+        carpeta = current_app.config["TRABAJOS_FOLDER"]
+        os.makedirs(carpeta, exist_ok=True)
+        ruta = os.path.join(carpeta, f"entrada_{uuid.uuid4().hex}.{ext}")
+        archivo.save(ruta)
+        parametros = {"archivo": ruta, "nombre": archivo.filename,
+                      "periodo_anio": periodo.anio, "periodo_mes": periodo.mes}
+    else:
+        abort(404)
+
+    t = trabajos.encolar(tipo, parametros, current_user.id)
+    if request.accept_mimetypes.best == "application/json":
+        return jsonify(t.a_dict()), 202, {"Location": url_for('main.trabajo_estado', trabajo_id=t.id)}
+    flash(f"Trabajo #{t.id} en cola; esta página se actualiza sola.", "success")
+    return redirect(url_for('main.trabajos_list'))
+
+
+def trabajo_propio_o_404(trabajo_id):
+    t = Trabajo.query.get_or_404(trabajo_id)
+    if current_user.rol != 'superusuario' and t.usuario_id != current_user.id:
+        abort(403)
+    return t
+
+
+@bp.route('/trabajos/<int:trabajo_id>.json')
+@login_required
+def trabajo_estado(trabajo_id):
+    resp = jsonify(trabajo_propio_o_404(trabajo_id).a_dict())
+    resp.headers["Cache-Control"] = "no-store"
+    return resp
+
+
+@bp.route('/trabajos/<int:trabajo_id>/descarga')
+@login_required
+def trabajo_descarga(trabajo_id):
+    t = trabajo_propio_o_404(trabajo_id)
+    if t.estado != "listo" or not t.archivo or not os.path.exists(t.archivo):
+        abort(404)
+    return send_file(t.archivo, as_attachment=True, download_name=t.nombre_descarga, max_age=0)
 
 
 @bp.route('/actas/<int:acta_id>')
 @login_required
 def ver_acta(acta_id):
-    a = Acta.query.get_or_404(acta_id)
+    # primero sólo dueño y marca de tiempo: si el navegador ya tiene esta versión, 304 sin cargar el acta
+    modelo, usuario_id, modificada = version_acta_o_404(acta_id)
     # solo dueño o superusuario
+    if current_user.rol != 'superusuario' and usuario_id != current_user.id:
+        abort(403)
+    etag = etag_de("acta", modelo.__table__.name, acta_id, modificada)
+    return respuesta_condicional(
+        etag, modificada, lambda: render_template('ver_acta.html', acta=db.session.get(modelo, acta_id))
+    )
+
+
+@bp.route('/actas/<int:acta_id>/firma')
+@login_required
+def acta_firma(acta_id):
+    a = acta_o_404(acta_id)
+    if current_user.rol != 'superusuario' and a.usuario_id != current_user.id:
+        abort(403)
+    if not a.firma_path:
+        abort(404)
+    try:
+        return enviar_firma(a.firma_path)
+    except FileNotFoundError:
+        abort(404)
+
+
+@bp.route('/actas/<int:acta_id>/pdf')
+@login_required
+def acta_pdf(acta_id):
+    a = acta_o_404(acta_id)
     if current_user.rol != 'superusuario' and a.usuario_id != current_user.id:
         abort(403)
-    return render_template('ver_acta.html', acta=a)
+    # Render una sola vez por versión del acta; las descargas siguientes salen del caché
+    ruta = obtener_pdf(a)
+    return send_file(ruta, mimetype="application/pdf",
+                     download_name=f"acta_{a.correlativo or a.id}.pdf", max_age=0)
 
 
 @bp.route('/registrar_acta', methods=['GET', 'POST'])
@@ -150,6 +477,7 @@ def registrar_acta():
 
     # ---- Tu WTForm ----
     form = RegistrarActaForm()
+    catalogos.cargar_choices(form)
 
     # GET: si el usuario tiene cesfam, preseleccionar en Establecimiento
     if request.method == 'GET':
@@ -196,16 +524,16 @@ def registrar_acta():
         email = form.email.data
 
         # Firma (opcional)
+        # Se normaliza (PNG acotado) y se guarda por hash: firmas iguales comparten archivo
         firma_file = request.files.get('firma')
-        firma_path = None
+        firma_path = firma_hash = None
         if firma_file and getattr(firma_file, "filename", ""):
             ext = firma_file.filename.rsplit('.', 1)[-1].lower()
             if ext in {"png", "jpg", "jpeg", "webp"}:
-                fname = secure_filename(f"{datetime.utcnow().strftime('%Y%m%d%H%M%S')}_{firma_file.filename}")
-                destino = os.path.join(current_app.root_path, 'static', 'uploads', 'firmas', fname)
-                os.makedirs(os.path.dirname(destino), exist_ok=True)
-                firma_file.save(destino)
-                firma_path = os.path.join('static', 'uploads', 'firmas', fname).replace('\\', '/')
+                try:
+                    firma_path, firma_hash = guardar_firma(firma_file)
+                except ValueError as e:
+                    flash(str(e), "warning")
             else:
                 flash("Formato de firma no permitido. Usa png/jpg/jpeg/webp.", "warning")
 
@@ -237,6 +565,8 @@ def registrar_acta():
             usuario_id=current_user.id, cesfam=cesfam_final,
 
             firma_path=firma_path,
+            firma_tipo='imagen' if firma_path else None,
+            firma_hash=firma_hash,
 
             nombre_encargado=form.nombre_encargado.data,
             cargo_encargado=form.cargo_encargado.data,
@@ -247,10 +577,15 @@ def registrar_acta():
 
             estado='borrador'
         )
+        # Contratos que se cruzan (mismo RUT o mismo titular reemplazado): se avisa, no se bloquea
+        avisos = Acta.avisos_traslape(rut, rut_rep, f_inicio, f_termino)
+
         db.session.add(acta)
         db.session.commit()
 
         flash(f"Acta registrada para el período {periodo_mes:02d}/{periodo_anio}.", "success")
+        for aviso in avisos:
+            flash(aviso, "warning")
         return redirect(url_for('main.registrar_envio_fisico', acta_id=acta.id))
 
     # Si falla la validación, mostrar errores
@@ -260,12 +595,43 @@ def registrar_acta():
                 flash(f"Error en {campo}: {e}", "danger")
 
     # GET o validación fallida
+    catalogos.reducir_choices(form)
     return render_template('registrar_acta.html',
                            periodo_label=periodo_label,
                            usuario=current_user,
                            form=form)
 
 
+@bp.route('/actas/importar', methods=['GET', 'POST'])
+@login_required
+def importar_actas_view():
+    require_superuser()
+    if request.method == 'GET':
+        return render_template('importar_actas.html', insertadas=None, reporte=[], advertencias=[])
+
+    archivo = request.files.get('archivo')
+    if not archivo or not getattr(archivo, "filename", ""):
+        flash("Selecciona una planilla (.xlsx o .csv).", "warning")
+        return redirect(url_for('main.importar_actas_view'))
+
+    periodo, _pasa_siguiente = PeriodoRemunerativo.periodo_vigente_para_fecha(date.today())
+    if not periodo:
+        flash("No existe período remunerativo activo configurado.", "warning")
+        return redirect(url_for("main.periodos_list"))
+
+    try:
+        df = leer_planilla(archivo, archivo.filename)
+    except Exception as e:
+        flash(f"No se pudo leer la planilla: {e}", "danger")
+        return redirect(url_for('main.importar_actas_view'))
+
+    insertadas, reporte, advertencias = importar_actas(df, current_user, periodo.anio, periodo.mes)
+    flash(f"{insertadas} actas importadas para el período {periodo.mes:02d}/{periodo.anio}; "
+          f"{len(reporte)} filas con errores.", "success" if not reporte else "warning")
+    return render_template('importar_actas.html', insertadas=insertadas, reporte=reporte,
+                           advertencias=advertencias)
+
+
 @bp.route('/registrar_envio_fisico/<int:acta_id>', methods=['GET', 'POST'])
 @login_required
 def registrar_envio_fisico(acta_id):
@@ -279,7 +645,7 @@ def registrar_envio_fisico(acta_id):
         v = request.form.get('fecha_envio_fisico')
         if not v:
             flash('Debes seleccionar una fecha.', 'warning')
-            return render_template('registrar_envio_fisico.html', acta=acta)
+            return render_template('ingresar_envio_fisico.html', acta=acta)
         acta.fecha_envio_fisico = datetime.strptime(v, "%Y-%m-%d").date()
         acta.usuario_envio_fisico = current_user.id
         acta.estado = 'enviado'
@@ -287,4 +653,54 @@ def registrar_envio_fisico(acta_id):
         flash('Fecha de envío físico registrada.', 'success')
         return redirect(url_for('main.ver_acta', acta_id=acta.id))
 
-    return render_template('registrar_envio_fisico.html', acta=acta)
+    return render_template('ingresar_envio_fisico.html', acta=acta)
+
+
+MAX_ENVIO_MASIVO = 1000  # actas por selección explícita (ids)
+
+
+@bp.route('/actas/envio_fisico', methods=['POST'])
+@login_required
+def registrar_envio_fisico_masivo():
+    """
+    Envío físico de un lote (ej. la valija del courier) en un solo UPDATE:
+    - ids: las actas marcadas en el listado, o
+    - todas=1: todas las pendientes que calzan con los filtros del listado (query string).
+    Administrativos sólo pueden marcar actas propias (misma regla que registrar_envio_fisico).
+    """
+    volver = redirect(url_for('main.listar_actas', **request.args))
+    try:
+        fecha = datetime.strptime(request.form.get('fecha_envio_fisico', ''), "%Y-%m-%d").date()
+    except ValueError:
+        flash('Debes seleccionar una fecha de envío válida.', 'warning')
+        return volver
+
+    if request.form.get('todas') == '1':
+        q = Acta.query_filtrada(**filtros_actas_desde_request())
+    else:
+        try:
+            ids = sorted({int(x) for x in request.form.getlist('ids')})
+        except ValueError:
+            abort(400)
+        if not ids:
+            flash('No seleccionaste actas.', 'warning')
+            return volver
+        if len(ids) > MAX_ENVIO_MASIVO:
+            flash(f'Máximo {MAX_ENVIO_MASIVO} actas por envío; usa "todas las filtradas".', 'warning')
+            return volver
+        q = Acta.query.filter(Acta.id.in_(ids))
+    if current_user.rol != 'superusuario':
+        q = q.filter(Acta.usuario_id == current_user.id)
+    criterio = q.whereclause if q.whereclause is not None else db.true()
+
+    try:
+        n = Acta.registrar_envio_fisico_masivo(criterio, fecha, current_user.id)
+    except RuntimeError as e:
+        flash(str(e), 'danger')
+        return volver
+    db.session.commit()
+    if n:
+        flash(f'Envío físico registrado en {n} acta(s) con fecha {fecha:%d-%m-%Y}.', 'success')
+    else:
+        flash('No había actas pendientes de envío (propias) en la selección.', 'info')
+    return volver
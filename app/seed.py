@@ -0,0 +1,184 @@
+# app/seed.py
+import random
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+from werkzeug.security import generate_password_hash
+
+from . import db
+from .forms import (
+    TIPO_CONTRATO_CHOICES, ESTABLECIMIENTO_CHOICES, ESTADO_CIVIL_CHOICES,
+    NACIONALIDAD_CHOICES, SALUD_CHOICES, AFP_CHOICES,
+)
+from .importar import dv_rut
+from .models import (
+    Acta, PeriodoRemunerativo, Usuario, invalidar_cache_periodo, normalizar_rut, recalcular_resumen,
+)
+
+# Escalas con nombre para `flask seed --escala`
+ESCALAS = {"10k": 10_000, "100k": 100_000, "1M": 1_000_000}
+
+LOTE_SEED = 5000               # filas por INSERT
+USUARIOS_POR_CESFAM = 4
+MESES_HISTORIA = 24            # períodos hacia atrás desde el mes actual
+CLAVE_SEED = "seed1234"        # clave de todos los usuarios generados
+
+NOMBRES = ["Ana", "María", "José", "Juan", "Camila", "Valentina", "Francisca", "Pedro", "Luis", "Carlos",
+           "Constanza", "Javiera", "Felipe", "Matías", "Daniela", "Sofía", "Diego", "Catalina", "Jorge", "Paula"]
+APELLIDOS = ["González", "Muñoz", "Rojas", "Díaz", "Pérez", "Soto", "Contreras", "Silva", "Martínez",
+             "Sepúlveda", "Morales", "Rodríguez", "López", "Fuentes", "Hernández", "Torres", "Araya",
+             "Flores", "Espinoza", "Valenzuela", "Castillo", "Tapia", "Reyes", "Gutiérrez", "Castro"]
+CARGOS = ["TENS", "Enfermera/o", "Matrona/ón", "Médico", "Kinesiólogo/a", "Psicólogo/a",
+          "Nutricionista", "Odontólogo/a", "Administrativo/a", "Auxiliar de servicio", "Conductor/a"]
+CATEGORIAS = ["A", "B", "C", "D", "E", "F"]
+JORNADAS = ["44", "44", "44", "33", "22", "11"]
+COMUNAS = ["Coquimbo", "La Serena", "Ovalle", "Vicuña", "Andacollo", "Tongoy"]
+
+
+def _valores(choices):
+    return [v for (v, _l) in choices if v]
+
+
+def parsear_escala(texto: str) -> int:
+    """'10k' | '100k' | '1M' | número entero -> cantidad de actas."""
+    if texto in ESCALAS:
+        return ESCALAS[texto]
+    try:
+        n = int(texto.replace("_", ""))
+    except ValueError:
+        raise ValueError(f"Escala inválida: {texto!r} (usa {', '.join(ESCALAS)} o un número)")
+    if n < 0:
+        raise ValueError("La escala no puede ser negativa")
+    return n
+
+
+def _meses_atras(hoy: date, n: int):
+    """[(anio, mes)] desde hace n meses hasta el mes siguiente al actual, en orden."""
+    anio, mes = hoy.year, hoy.month
+    total = anio * 12 + (mes - 1)
+    return [divmod(t, 12) for t in range(total - n, total + 2)]
+
+
+def sembrar_usuarios():
+    """Un superusuario y USUARIOS_POR_CESFAM administrativos por CESFAM (omite los que ya existen)."""
+    # un solo hash para todos: set_password con scrypt por usuario haría el seed lento sin aportar nada
+    hash_clave = generate_password_hash(CLAVE_SEED)
+    existentes = set(db.session.scalars(db.select(Usuario.username)))
+    cesfams = _valores(ESTABLECIMIENTO_CHOICES)
+    nuevos = [("seed_super", cesfams[0], "superusuario")]
+    for i, cesfam in enumerate(cesfams):
+        for j in range(USUARIOS_POR_CESFAM):
+            nuevos.append((f"seed_{i:02d}_{j}", cesfam, "administrativo"))
+    db.session.add_all([
+        Usuario(username=u, cesfam=c, rol=r, password_hash=hash_clave, email=f"{u}@example.cl")
+        for (u, c, r) in nuevos if u not in existentes
+    ])
+    db.session.commit()
+    filas = db.session.execute(
+        db.select(Usuario.id, Usuario.cesfam).where(Usuario.username.like("seed\\_%", escape="\\"))
+    ).all()
+    por_cesfam = {}
+    for uid, cesfam in filas:
+        por_cesfam.setdefault(cesfam, []).append(uid)
+    return por_cesfam
+
+
+def sembrar_periodos(hoy: date):
+    """Períodos de los últimos MESES_HISTORIA meses (cerrados), el actual y el siguiente (abiertos)."""
+    existentes = set(db.session.execute(db.select(PeriodoRemunerativo.anio, PeriodoRemunerativo.mes)).all())
+    meses = _meses_atras(hoy, MESES_HISTORIA)
+    actual = (hoy.year, hoy.month - 1)
+    for anio, mes0 in meses:
+        if (anio, mes0 + 1) in existentes:
+            continue
+        inicio = date(anio, mes0 + 1, 1)
+        db.session.add(PeriodoRemunerativo(
+            anio=anio, mes=mes0 + 1, fecha_inicio=inicio, fecha_corte=inicio + timedelta(days=19),
+            estado="cerrado" if (anio, mes0) < actual else "abierto",
+        ))
+    db.session.commit()
+    invalidar_cache_periodo()
+    return [(anio, mes0 + 1) for anio, mes0 in meses]
+
+
+def _fila_acta(rnd, anio, mes, cesfam, usuario_id, correlativo, rut, rut_titular, hoy):
+    inicio_mes = date(anio, mes, 1)
+    inicio = inicio_mes + timedelta(days=rnd.randrange(28))
+    tipo = rnd.choice(_valores(TIPO_CONTRATO_CHOICES))
+    convenio = tipo.endswith("(Convenio)")
+    reemplazo = tipo.startswith("Reemplazo")
+    salud = rnd.choice(_valores(SALUD_CHOICES))
+    nombre = f"{rnd.choice(NOMBRES)} {rnd.choice(NOMBRES)}"
+    apellidos = f"{rnd.choice(APELLIDOS)} {rnd.choice(APELLIDOS)}"
+    # períodos pasados mayormente cerrados; el actual mayormente en borrador
+    pasado = (anio, mes) < (hoy.year, hoy.month)
+    estado = rnd.choices(("borrador", "enviado", "cerrado"), (1, 3, 6) if pasado else (6, 3, 1))[0]
+    creado = datetime(anio, mes, 1) + timedelta(seconds=rnd.randrange(27 * 86400))
+    return dict(
+        nombres=nombre, apellidos=apellidos, rut=rut, rut_normalizado=normalizar_rut(rut),
+        tipo_contrato=tipo,
+        rut_titular_reemplazo=rut_titular if reemplazo else None,
+        rut_titular_reemplazo_normalizado=normalizar_rut(rut_titular) if reemplazo else None,
+        nombre_titular_reemplazo=f"{rnd.choice(NOMBRES)} {rnd.choice(APELLIDOS)}" if reemplazo else None,
+        convenio="Convenio PRAPS" if convenio else None,
+        responsable="Encargado/a de convenio" if convenio else None,
+        salud=salud, plan_isapre="Plan Base" if salud == "ISAPRE" else None,
+        afp=rnd.choice(_valores(AFP_CHOICES)),
+        cargo=rnd.choice(CARGOS), jornada=rnd.choice(JORNADAS), lugar_trabajo=cesfam,
+        motivo="Licencia médica" if reemplazo else None,
+        observaciones=rnd.choice((None, None, None, "Sin observaciones", "Renovación")),
+        fecha_acta=inicio_mes, fecha_inicio_contratacion=inicio,
+        fecha_termino_contratacion=inicio + timedelta(days=rnd.choice((30, 60, 90, 180))),
+        periodo_anio=anio, periodo_mes=mes, creado_en=creado,
+        usuario_id=usuario_id, cesfam=cesfam,
+        nombre_encargado=f"{rnd.choice(NOMBRES)} {rnd.choice(APELLIDOS)}", cargo_encargado="Director/a",
+        correlativo=str(correlativo),
+        direccion=f"Calle {rnd.randint(1, 999)}, {rnd.choice(COMUNAS)}",
+        fecha_nacimiento=date(rnd.randint(1960, 2003), rnd.randint(1, 12), rnd.randint(1, 28)),
+        telefono=f"+569{rnd.randint(10000000, 99999999)}",
+        estado_civil=rnd.choice(_valores(ESTADO_CIVIL_CHOICES)),
+        nacionalidad="Chilena" if rnd.random() < 0.85 else rnd.choice(_valores(NACIONALIDAD_CHOICES)),
+        lugar_nacimiento=rnd.choice(COMUNAS),
+        email=f"{nombre.split()[0].lower()}.{rnd.randint(1, 9999)}@example.cl",
+        categoria=rnd.choice(CATEGORIAS),
+        estado=estado,
+    )
+
+
+def sembrar_actas(n, rnd, por_cesfam, periodos, hoy, progreso=None):
+    """Inserta n actas por lotes (INSERT multi-fila, sin objetos ORM) repartidas en períodos y CESFAM."""
+    cesfams = sorted(por_cesfam)
+    correlativos = dict.fromkeys(cesfams, 0)
+    insertadas = 0
+    while insertadas < n:
+        lote = min(LOTE_SEED, n - insertadas)
+        cuerpos = pd.Series([str(rnd.randint(5_000_000, 26_000_000)) for _ in range(2 * lote)])
+        ruts = (cuerpos + "-" + dv_rut(cuerpos)).tolist()
+        filas = []
+        for k in range(lote):
+            anio, mes = rnd.choice(periodos)
+            cesfam = rnd.choice(cesfams)
+            correlativos[cesfam] += 1
+            filas.append(_fila_acta(rnd, anio, mes, cesfam, rnd.choice(por_cesfam[cesfam]),
+                                    correlativos[cesfam], ruts[2 * k], ruts[2 * k + 1], hoy))
+        db.session.execute(db.insert(Acta), filas)
+        db.session.commit()
+        insertadas += lote
+        if progreso:
+            progreso(insertadas)
+    return insertadas
+
+
+def sembrar(n_actas: int, semilla: int = 0, hoy: date = None, progreso=None):
+    """
+    Llena la BD con datos sintéticos reproducibles (misma semilla => mismas filas).
+    Devuelve (usuarios, periodos, actas insertadas). Al final reconstruye resumen_actas.
+    """
+    rnd = random.Random(semilla)
+    hoy = hoy or date.today()
+    por_cesfam = sembrar_usuarios()
+    periodos = sembrar_periodos(hoy)
+    insertadas = sembrar_actas(n_actas, rnd, por_cesfam, periodos, hoy, progreso)
+    recalcular_resumen(db.session.connection())
+    db.session.commit()
+    return sum(len(v) for v in por_cesfam.values()), len(periodos), insertadas
@@ -0,0 +1,338 @@
+# app/trabajos.py
+import csv
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import zipfile
+from datetime import datetime, timedelta
+
+from flask import current_app
+
+from . import db
+from .models import Trabajo, Usuario
+
+log = logging.getLogger(__name__)
+
+MAX_INTENTOS = 2            # un trabajo interrumpido (worker caído) se reintenta una vez
+LOTE_PROGRESO = 50          # cada cuántos ítems se guarda el avance
+LATIDO_CADA = 30            # segundos entre latidos de un trabajo en ejecución
+RECUPERAR_CADA = 60         # segundos entre búsquedas de trabajos sin latido
+LIMPIEZA_CADA = 3600        # segundos entre limpiezas de resultados viejos
+
+
+class _Aviso:
+    """
+    encolar() despierta a los hilos worker de este proceso sin esperar el polling.
+    Cada hilo anota la generación antes de revisar la cola y espera a que cambie: un aviso
+    que llega mientras revisa no se pierde, y ningún hilo le borra el aviso a otro.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self.generacion = 0
+
+    def avisar(self):
+        with self._cond:
+            self.generacion += 1
+            self._cond.notify_all()
+
+    def esperar(self, desde: int, timeout: float) -> None:
+        with self._cond:
+            self._cond.wait_for(lambda: self.generacion != desde, timeout)
+
+
+_aviso = _Aviso()
+
+
+class ErrorTrabajo(Exception):
+    """Error esperado (datos del usuario): se guarda como mensaje, sin traceback en el log."""
+
+
+# =========================
+# Tipos de trabajo
+# =========================
+# Cada tipo recibe (trabajo, parámetros, avance) y devuelve (archivo, nombre_descarga, resultado, mensaje).
+# avance(hechos, total) guarda el progreso cada LOTE_PROGRESO ítems.
+def _ruta_salida(trabajo, extension):
+    carpeta = current_app.config["TRABAJOS_FOLDER"]
+    os.makedirs(carpeta, exist_ok=True)
+    return os.path.join(carpeta, f"trabajo_{trabajo.id}{extension}")
+
+
+def _nombre_periodo(prefijo, filtros, extension):
+    if filtros.get("periodo_anio") and filtros.get("periodo_mes"):
+        return f"{prefijo}_{filtros['periodo_anio']}_{filtros['periodo_mes']:02d}{extension}"
+    return f"{prefijo}{extension}"
+
+
+def _exportar_xlsx(trabajo, filtros, avance):
+    from .archivo import consultas_actas
+    from .exportar import escribir_xlsx, iterar_filas_export
+    ruta = _ruta_salida(trabajo, ".xlsx")
+    n = escribir_xlsx(iterar_filas_export(*consultas_actas(filtros)), ruta)
+    return ruta, _nombre_periodo("actas", filtros, ".xlsx"), {"filas": n}, f"{n} actas exportadas."
+
+
+def _exportar_csv(trabajo, filtros, avance):
+    from .archivo import consultas_actas
+    from .exportar import iterar_csv
+    ruta = _ruta_salida(trabajo, ".csv")
+    with open(ruta, "w", encoding="utf-8", newline="") as f:
+        for bloque in iterar_csv(*consultas_actas(filtros)):
+            f.write(bloque)
+    return ruta, _nombre_periodo("actas", filtros, ".csv"), None, "CSV generado."
+
+
+def _pdfs_periodo(trabajo, filtros, avance):
+    """ZIP con el PDF de cada acta del período (usa y llena el caché de PDFs)."""
+    from .archivo import consultas_actas
+    from .pdf import obtener_pdf
+    # primero los ids: obtener_pdf hace commit, lo que cerraría un cursor abierto sobre la query
+    lotes = []
+    for q in consultas_actas(filtros):
+        modelo = q.column_descriptions[0]["entity"]
+        ids = [i for (i,) in q.with_entities(modelo.id).order_by(modelo.id)]
+        lotes += [(modelo, ids[k:k + LOTE_PROGRESO]) for k in range(0, len(ids), LOTE_PROGRESO)]
+    total = sum(len(ids) for _m, ids in lotes)
+    ruta = _ruta_salida(trabajo, ".zip")
+    hechos = 0
+    # ZIP_STORED: los PDF ya vienen comprimidos
+    with zipfile.ZipFile(ruta, "w", zipfile.ZIP_STORED) as zf:
+        for modelo, ids in lotes:
+            for acta in modelo.query.filter(modelo.id.in_(ids)).order_by(modelo.id).all():
+                zf.write(obtener_pdf(acta), f"acta_{acta.correlativo or acta.id}_{acta.id}.pdf")
+                hechos += 1
+                avance(hechos, total)
+    return ruta, _nombre_periodo("actas_pdf", filtros, ".zip"), {"pdfs": hechos}, f"{hechos} PDF generados."
+
+
+def _importar(trabajo, params, avance):
+    from .importar import importar_actas, leer_planilla
+    entrada = params["archivo"]
+    try:
+        try:
+            df = leer_planilla(entrada, params["nombre"])
+        except Exception as e:
+            raise ErrorTrabajo(f"No se pudo leer la planilla: {e}")
+        usuario = db.session.get(Usuario, trabajo.usuario_id)
+        insertadas, reporte, advertencias = importar_actas(df, usuario, params["periodo_anio"], params["periodo_mes"])
+    finally:
+        os.remove(entrada)
+
+    ruta = nombre = None
+    if reporte or advertencias:
+        # filas rechazadas y advertencias como CSV descargable
+        ruta = _ruta_salida(trabajo, ".csv")
+        with open(ruta, "w", encoding="utf-8-sig", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["Fila", "RUT", "Tipo", "Detalle"])
+            for tipo, filas in (("error", reporte), ("advertencia", advertencias)):
+                for r in filas:
+                    rut = r["rut"] if isinstance(r["rut"], str) else ""
+                    w.writerow([r["fila"], rut, tipo, "; ".join(r["errores"])])
+        nombre = f"importacion_{trabajo.id}_reporte.csv"
+    resultado = {"insertadas": insertadas, "rechazadas": len(reporte), "advertencias": len(advertencias)}
+    return ruta, nombre, resultado, (f"{insertadas} actas importadas para el período "
+                                     f"{params['periodo_mes']:02d}/{params['periodo_anio']}; "
+                                     f"{len(reporte)} filas con errores.")
+
+
+TIPOS = {
+    "exportar_xlsx": _exportar_xlsx,
+    "exportar_csv": _exportar_csv,
+    "pdfs_periodo": _pdfs_periodo,
+    "importar": _importar,
+}
+
+
+# =========================
+# Cola
+# =========================
+def encolar(tipo: str, parametros: dict, usuario_id: int) -> Trabajo:
+    if tipo not in TIPOS:
+        raise KeyError(tipo)
+    t = Trabajo(tipo=tipo, parametros=json.dumps(parametros, default=str), usuario_id=usuario_id)
+    db.session.add(t)
+    db.session.commit()
+    _aviso.avisar()
+    return t
+
+
+def _id_worker():
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.current_thread().name}"[:80]
+
+
+def tomar_siguiente():
+    """
+    Reclama el pendiente más antiguo. El UPDATE ... WHERE estado='pendiente' es la compuerta:
+    si otro worker (hilo o proceso) lo tomó antes, rowcount es 0 y se prueba con el siguiente.
+    """
+    while True:
+        tid = db.session.scalar(
+            db.select(Trabajo.id).where(Trabajo.estado == "pendiente").order_by(Trabajo.id).limit(1)
+        )
+        if tid is None:
+            db.session.rollback()
+            return None
+        res = db.session.execute(
+            db.update(Trabajo)
+            .where(Trabajo.id == tid, Trabajo.estado == "pendiente")
+            .values(estado="ejecutando", iniciado_en=datetime.utcnow(), latido_en=datetime.utcnow(),
+                    worker=_id_worker(), intentos=Trabajo.intentos + 1)
+        )
+        db.session.commit()
+        if res.rowcount == 1:
+            return db.session.get(Trabajo, tid)
+
+
+def _guardar_avance(tid):
+    ultimo = {"n": 0}
+
+    def avance(hechos, total):
+        if hechos - ultimo["n"] < LOTE_PROGRESO and hechos != total:
+            return
+        ultimo["n"] = hechos
+        # UPDATE directo en su propia transacción: la del trabajo puede estar a medias
+        with db.engine.begin() as conn:
+            conn.execute(db.update(Trabajo).where(Trabajo.id == tid)
+                         .values(progreso=hechos, total=total, latido_en=datetime.utcnow()))
+
+    return avance
+
+
+def _latir(engine, tid, cada, terminado: threading.Event):
+    """Renueva latido_en cada `cada` segundos hasta que el trabajo termine (hilo aparte)."""
+    while not terminado.wait(cada):
+        try:
+            with engine.begin() as conn:
+                conn.execute(db.update(Trabajo).where(Trabajo.id == tid, Trabajo.estado == "ejecutando")
+                             .values(latido_en=datetime.utcnow()))
+        except Exception:
+            log.warning("No se pudo renovar el latido del trabajo %s", tid, exc_info=True)
+
+
+def ejecutar(trabajo: Trabajo) -> None:
+    """
+    Corre el trabajo ya reclamado y deja el estado final ('listo' o 'error').
+    Mientras corre, un hilo renueva latido_en: un trabajo sin latido reciente es de un worker
+    muerto (ver recuperar_interrumpidos), aunque lleve horas en ejecución.
+    """
+    tid = trabajo.id
+    terminado = threading.Event()
+    threading.Thread(target=_latir, name=f"latido-{tid}", daemon=True,
+                     args=(db.engine, tid, LATIDO_CADA, terminado)).start()
+    try:
+        archivo, nombre, resultado, mensaje = TIPOS[trabajo.tipo](
+            trabajo, json.loads(trabajo.parametros or "{}"), _guardar_avance(tid)
+        )
+        valores = dict(estado="listo", archivo=archivo, nombre_descarga=nombre, mensaje=mensaje,
+                       resultado=json.dumps(resultado) if resultado is not None else None)
+    except ErrorTrabajo as e:
+        valores = dict(estado="error", mensaje=str(e))
+    except Exception as e:
+        log.exception("Falló el trabajo %s (%s)", tid, trabajo.tipo)
+        valores = dict(estado="error", mensaje=f"Error interno: {e.__class__.__name__}")
+    finally:
+        terminado.set()
+    db.session.rollback()
+    db.session.execute(
+        db.update(Trabajo).where(Trabajo.id == tid).values(terminado_en=datetime.utcnow(), **valores)
+    )
+    db.session.commit()
+
+
+def recuperar_interrumpidos(timeout: int) -> int:
+    """
+    Trabajos 'ejecutando' sin latido hace más de `timeout` segundos (su worker murió): vuelven
+    a la cola si les quedan intentos; si no, quedan en error. Uno largo pero vivo no se toca.
+    """
+    limite = datetime.utcnow() - timedelta(seconds=timeout)
+    colgado = db.and_(Trabajo.estado == "ejecutando",
+                      db.func.coalesce(Trabajo.latido_en, Trabajo.iniciado_en) < limite)
+    n = db.session.execute(
+        db.update(Trabajo).where(colgado, Trabajo.intentos < MAX_INTENTOS).values(estado="pendiente")
+    ).rowcount
+    n += db.session.execute(
+        db.update(Trabajo).where(colgado).values(
+            estado="error", terminado_en=datetime.utcnow(), mensaje="Interrumpido (se agotaron los reintentos).")
+    ).rowcount
+    db.session.commit()
+    return n
+
+
+def limpiar_trabajos(dias: int) -> int:
+    """Borra los trabajos terminados hace más de `dias` días y sus archivos."""
+    limite = datetime.utcnow() - timedelta(days=dias)
+    viejos = Trabajo.query.filter(Trabajo.estado.in_(("listo", "error")), Trabajo.terminado_en < limite).all()
+    for t in viejos:
+        if t.archivo and os.path.exists(t.archivo):
+            os.remove(t.archivo)
+        db.session.delete(t)
+    db.session.commit()
+    return len(viejos)
+
+
+# =========================
+# Workers
+# =========================
+def bucle_worker(app, intervalo: float, detener: threading.Event = None, limpiar: bool = False):
+    """
+    Loop de un worker: toma trabajos hasta que no queden y espera `intervalo` (o un encolar local).
+    Con limpiar=True (un hilo por proceso) además recupera interrumpidos y borra resultados viejos
+    y PDFs cacheados sin uso.
+    """
+    proxima_recuperacion = proxima_limpieza = 0.0
+    while not (detener and detener.is_set()):
+        generacion = _aviso.generacion  # antes de revisar: un encolar durante la revisión no se pierde
+        try:
+            with app.app_context():
+                if limpiar and time.monotonic() >= proxima_recuperacion:
+                    proxima_recuperacion = time.monotonic() + RECUPERAR_CADA
+                    recuperar_interrumpidos(app.config["TRABAJOS_TIMEOUT"])
+                if limpiar and time.monotonic() >= proxima_limpieza:
+                    proxima_limpieza = time.monotonic() + LIMPIEZA_CADA
+                    limpiar_trabajos(app.config["TRABAJOS_RETENCION_DIAS"])
+                    from .pdf import limpiar_cache_pdf
+                    limpiar_cache_pdf(app.config["PDF_CACHE_DIAS"])
+                while True:
+                    t = tomar_siguiente()
+                    if t is None:
+                        break
+                    ejecutar(t)
+        except Exception:
+            log.exception("Error en el worker de trabajos")
+        _aviso.esperar(generacion, intervalo)
+
+
+class PoolTrabajos:
+    """
+    TRABAJOS_HILOS hilos daemon dentro del proceso de la app (se levantan con la primera request
+    de cada worker de gunicorn). Con TRABAJOS_HILOS=0 los trabajos los corre `flask trabajos worker`.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def asegurar(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            for i in range(self.app.config["TRABAJOS_HILOS"]):
+                threading.Thread(
+                    target=bucle_worker, name=f"trabajos-{i}", daemon=True,
+                    args=(self.app, self.app.config["TRABAJOS_INTERVALO"]), kwargs={"limpiar": i == 0},
+                ).start()
+
+
+def init_trabajos(app):
+    pool = app.extensions["trabajos"] = PoolTrabajos(app)
+    if app.config["TRABAJOS_HILOS"] > 0:
+        app.before_request(pool.asegurar)
@@ -0,0 +1,95 @@
+"""
+Benchmark de /login según el método/costo de hash de contraseñas.
+
+Mide, en un solo hilo (= un núcleo), cuántos logins por segundo atiende un worker
+con cada valor posible de PASSWORD_HASH_METHOD, para elegir el costo con datos.
+
+Uso:
+    python benchmarks/bench_login.py
+    python benchmarks/bench_login.py -n 50 -m scrypt -m scrypt:16384:8:1 -m pbkdf2:sha256:600000
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+METODOS_DEFECTO = [
+    "scrypt",                 # default de werkzeug (scrypt:32768:8:1)
+    "scrypt:16384:8:1",
+    "pbkdf2:sha256:1000000",  # default pbkdf2 de werkzeug
+    "pbkdf2:sha256:600000",
+    "pbkdf2:sha256:260000",
+]
+
+
+def medir(app, metodo, n):
+    from app import db
+    from app.models import Usuario
+
+    username = f"bench_{abs(hash(metodo))}"
+    with app.app_context():
+        app.config["PASSWORD_HASH_METHOD"] = metodo
+        u = Usuario(username=username, cesfam="BENCH", rol="administrativo")
+        u.set_password("clave-bench")
+        db.session.add(u)
+        db.session.commit()
+
+        # costo puro del hash (sin Flask ni BD)
+        t0 = time.perf_counter()
+        for _ in range(n):
+            u.check_password("clave-bench")
+        hash_ms = (time.perf_counter() - t0) * 1000 / n
+
+    client = app.test_client()
+    datos = {"username": username, "password": "clave-bench"}
+    client.post("/login", data=datos)  # calentamiento
+    tiempos = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        r = client.post("/login", data=datos)
+        tiempos.append(time.perf_counter() - t0)
+        assert r.status_code == 302, f"login falló con {metodo}: {r.status_code}"
+
+    return {
+        "metodo": metodo,
+        "hash_ms": hash_ms,
+        "login_p50_ms": statistics.median(tiempos) * 1000,
+        "logins_s_nucleo": n / sum(tiempos),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=20, help="logins por método (default 20)")
+    parser.add_argument("-m", "--metodo", action="append", help="método werkzeug a medir (repetible)")
+    args = parser.parse_args()
+
+    fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+
+    from app import create_app, db
+    app = create_app()
+    app.config["WTF_CSRF_ENABLED"] = False
+    with app.app_context():
+        db.create_all()
+
+    nucleos = os.cpu_count() or 1
+    print(f"{'método':<24}{'hash ms':>10}{'login p50 ms':>15}{'logins/s/núcleo':>18}{f'logins/s x{nucleos}':>16}")
+    try:
+        for metodo in args.metodo or METODOS_DEFECTO:
+            r = medir(app, metodo, args.n)
+            print(f"{r['metodo']:<24}{r['hash_ms']:>10.1f}{r['login_p50_ms']:>15.1f}"
+                  f"{r['logins_s_nucleo']:>18.1f}{r['logins_s_nucleo'] * nucleos:>16.1f}")
+    finally:
+        with app.app_context():
+            db.engine.dispose()
+        os.remove(db_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+Suite de benchmarks reproducible de las rutas principales.
+
+Crea una BD SQLite temporal, la llena con `app.seed.sembrar` (misma semilla => mismos datos)
+y recorre cada escenario con el test client de Flask. Por escenario reporta latencia p50/p95,
+queries por request y el pico de memoria Python (tracemalloc, en una pasada aparte para no
+inflar las latencias).
+
+Con --guardar escribe un JSON de línea base; con --comparar lo contrasta y termina con
+código 1 si algún p95 empeora más que --tolerancia o si aumentan las queries por request.
+
+Uso:
+    python benchmarks/bench_rutas.py
+    python benchmarks/bench_rutas.py --escala 100k -n 100 --guardar benchmarks/baseline.json
+    python benchmarks/bench_rutas.py --comparar benchmarks/baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def form_acta():
+    """POST válido de /registrar_acta (mismos campos que RegistrarActaForm)."""
+    return dict(
+        numero_correlativo="B-1", fecha_contratacion="2025-03-01", nombres="Bench", apellidos="Rutas",
+        rut="12.345.678-5", fecha_nacimiento="1990-04-15", direccion="Calle 1", telefono="+56911111111",
+        email="bench@example.cl", estado_civil="Soltero/a", nacionalidad="Chilena", lugar_nacimiento="Coquimbo",
+        tipo_contrato="Plazo Fijo", fecha_inicio="2025-03-01", fecha_termino="2025-06-30", jornada="44",
+        lugar_trabajo="CESFAM Tongoy", cargo="TENS", salud="FONASA", afp="AFP Modelo", categoria="C",
+        nombre_encargado="Jefatura", cargo_encargado="Director/a",
+    )
+
+
+def escenarios(app):
+    """[(nombre, función sin argumentos que hace una request/llamada y devuelve el status)]."""
+    from app.models import PeriodoRemunerativo, Usuario, invalidar_cache_periodo
+    from app.seed import CLAVE_SEED
+
+    with app.app_context():
+        admin = Usuario.query.filter_by(cesfam="CESFAM Tongoy", rol="administrativo").first().username
+
+    def cliente(username):
+        c = app.test_client()
+        r = c.post("/login", data={"username": username, "password": CLAVE_SEED})
+        assert r.status_code == 302, f"login de {username} falló: {r.status_code}"
+        return c
+
+    anonimo = app.test_client()
+    su = cliente("seed_super")
+    ad = cliente(admin)
+    hoy = date.today()
+    periodo = f"{hoy.year}-{hoy.month:02d}"
+
+    def periodo_vigente():
+        with app.app_context():
+            PeriodoRemunerativo.periodo_vigente_para_fecha(hoy)
+        return 200
+
+    def periodo_vigente_sin_cache():
+        with app.app_context():
+            invalidar_cache_periodo()
+            PeriodoRemunerativo.periodo_vigente_para_fecha(hoy)
+        return 200
+
+    etag_listado = {}
+
+    def listar_actas_304():
+        # revalidación con el ETag de la respuesta anterior (la primera llamada, de calentamiento, es 200)
+        r = su.get("/actas", headers={"If-None-Match": etag_listado.get("v", "")})
+        etag_listado["v"] = r.headers.get("ETag")
+        return r.status_code
+
+    return [
+        ("login_get", lambda: anonimo.get("/login").status_code),
+        ("login_post", lambda: anonimo.post("/login", data={"username": admin, "password": CLAVE_SEED}).status_code),
+        ("listar_actas", lambda: su.get("/actas").status_code),
+        ("listar_actas_periodo", lambda: su.get(f"/actas?periodo={periodo}&cesfam=CESFAM+Tongoy").status_code),
+        ("listar_actas_admin", lambda: ad.get("/actas").status_code),
+        ("listar_actas_304", listar_actas_304),
+        ("registrar_acta_get", lambda: ad.get("/registrar_acta").status_code),
+        ("registrar_acta_post", lambda: ad.post("/registrar_acta", data=form_acta()).status_code),
+        ("periodo_vigente", periodo_vigente),
+        ("periodo_vigente_sin_cache", periodo_vigente_sin_cache),
+    ]
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    k = (len(ordenados) - 1) * p / 100
+    i = int(k)
+    return ordenados[i] + (ordenados[min(i + 1, len(ordenados) - 1)] - ordenados[i]) * (k - i)
+
+
+def medir(app, nombre, fn, n):
+    from sqlalchemy import event
+    from app import db
+
+    contador = {"queries": 0}
+
+    def _contar(*_a):
+        contador["queries"] += 1
+
+    with app.app_context():
+        engine = db.engine
+    status = fn()  # calentamiento (plantillas compiladas, cachés)
+    assert status < 400, f"{nombre}: status {status}"
+
+    event.listen(engine, "before_cursor_execute", _contar)
+    tiempos = []
+    try:
+        for _ in range(n):
+            t0 = time.perf_counter()
+            fn()
+            tiempos.append(time.perf_counter() - t0)
+    finally:
+        event.remove(engine, "before_cursor_execute", _contar)
+
+    # pasada aparte para memoria: tracemalloc hace todo más lento
+    tracemalloc.start()
+    try:
+        for _ in range(min(n, 10)):
+            fn()
+        _actual, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "p50_ms": round(statistics.median(tiempos) * 1000, 3),
+        "p95_ms": round(percentil(tiempos, 95) * 1000, 3),
+        "queries_por_request": round(contador["queries"] / n, 2),
+        "pico_memoria_kib": round(pico / 1024, 1),
+    }
+
+
+def comparar(resultados, base, tolerancia):
+    """Imprime deltas contra la línea base; devuelve la lista de regresiones."""
+    regresiones = []
+    print(f"\nComparación con línea base (escala {base['escala']}, tolerancia p95 {tolerancia:.0%})")
+    print(f"{'escenario':<28}{'p95 base':>10}{'p95 ahora':>11}{'Δ p95':>9}{'q base':>8}{'q ahora':>9}")
+    for nombre, r in resultados.items():
+        b = base["escenarios"].get(nombre)
+        if b is None:
+            print(f"{nombre:<28}{'(nuevo)':>10}")
+            continue
+        delta = r["p95_ms"] / b["p95_ms"] - 1 if b["p95_ms"] else 0.0
+        marca = ""
+        if delta > tolerancia or r["queries_por_request"] > b["queries_por_request"]:
+            regresiones.append(nombre)
+            marca = "  <- regresión"
+        print(f"{nombre:<28}{b['p95_ms']:>10.2f}{r['p95_ms']:>11.2f}{delta:>+9.0%}"
+              f"{b['queries_por_request']:>8}{r['queries_por_request']:>9}{marca}")
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--escala", default="10k", help="actas sintéticas: 10k | 100k | 1M | número (default 10k)")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("-n", type=int, default=50, help="repeticiones por escenario (default 50)")
+    parser.add_argument("-e", "--escenario", action="append", help="sólo estos escenarios (repetible)")
+    parser.add_argument("--guardar", metavar="JSON", help="escribe los resultados como línea base")
+    parser.add_argument("--comparar", metavar="JSON", help="compara contra una línea base")
+    parser.add_argument("--tolerancia", type=float, default=0.2, help="empeoramiento de p95 aceptado (default 0.2)")
+    args = parser.parse_args()
+
+    fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ["TRABAJOS_HILOS"] = "0"  # sin workers en segundo plano sobre una BD que se borra al final
+
+    from app import create_app, db
+    from app.seed import parsear_escala, sembrar
+
+    app = create_app()
+    app.config["WTF_CSRF_ENABLED"] = False
+    app.config["SLOW_QUERY_MS"] = float("inf")  # el log de queries lentas ensucia la salida
+    try:
+        with app.app_context():
+            db.create_all()
+            t0 = time.perf_counter()
+            sembrar(parsear_escala(args.escala), args.semilla)
+            print(f"Seed {args.escala} (semilla {args.semilla}): {time.perf_counter() - t0:.1f} s")
+
+        resultados = {}
+        print(f"{'escenario':<28}{'p50 ms':>9}{'p95 ms':>9}{'queries':>9}{'pico KiB':>10}")
+        for nombre, fn in escenarios(app):
+            if args.escenario and nombre not in args.escenario:
+                continue
+            r = resultados[nombre] = medir(app, nombre, fn, args.n)
+            print(f"{nombre:<28}{r['p50_ms']:>9.2f}{r['p95_ms']:>9.2f}{r['queries_por_request']:>9}"
+                  f"{r['pico_memoria_kib']:>10.1f}")
+    finally:
+        with app.app_context():
+            app.extensions["auditoria"].vaciar()  # lo pendiente se escribe antes de borrar la BD
+            db.engine.dispose()
+        for sufijo in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + sufijo):
+                os.remove(db_path + sufijo)
+
+    if args.guardar:
+        with open(args.guardar, "w", encoding="utf-8") as f:
+            json.dump({
+                "escala": args.escala, "semilla": args.semilla, "n": args.n,
+                "python": platform.python_version(), "plataforma": platform.platform(),
+                "escenarios": resultados,
+            }, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"\nLínea base guardada en {args.guardar}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            base = json.load(f)
+        if comparar(resultados, base, args.tolerancia):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
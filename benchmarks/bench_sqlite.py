@@ -0,0 +1,133 @@
+"""
+Benchmark de carga mixta lectura/escritura sobre SQLite, con y sin el perfil de producción
+(WAL, busy_timeout, synchronous=NORMAL, mmap_size, cache_size; ver app/perfil_sqlite.py).
+
+Simula el cierre de mes: varios hilos listan actas (keyset, como listar_actas) mientras
+otros registran actas nuevas con un commit cada una. Reporta operaciones por segundo
+y cuántas fallaron con "database is locked".
+
+Uso:
+    python benchmarks/bench_sqlite.py
+    python benchmarks/bench_sqlite.py --hilos 16 --segundos 10 --escrituras 0.3 --filas 20000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def preparar(app, filas):
+    from app import db
+    from app.models import Acta, Usuario
+
+    with app.app_context():
+        db.create_all()
+        u = Usuario(username="bench", cesfam="CESFAM Tongoy", rol="administrativo", password_hash="x")
+        db.session.add(u)
+        db.session.commit()
+        base = datetime(2025, 1, 1)
+        db.session.execute(db.insert(Acta), [
+            dict(nombres=f"N{i}", apellidos="Bench", rut=f"{10000000 + i}-0", tipo_contrato="Plazo Fijo",
+                 periodo_anio=2025, periodo_mes=1 + i % 12, usuario_id=u.id, cesfam="CESFAM Tongoy",
+                 estado="borrador", creado_en=base + timedelta(seconds=i))
+            for i in range(filas)
+        ])
+        db.session.commit()
+        return u.id
+
+
+def trabajador(app, usuario_id, hasta, prob_escritura, resultados, lock):
+    from sqlalchemy.exc import OperationalError
+    from app import db
+    from app.models import Acta
+
+    lecturas = escrituras = bloqueos = 0
+    rnd = random.Random()
+    with app.app_context():
+        while time.perf_counter() < hasta:
+            try:
+                if rnd.random() < prob_escritura:
+                    db.session.add(Acta(
+                        nombres="Nuevo", apellidos="Bench", rut="12.345.678-5", tipo_contrato="Plazo Fijo",
+                        periodo_anio=2025, periodo_mes=rnd.randint(1, 12), usuario_id=usuario_id,
+                        cesfam="CESFAM Tongoy", estado="borrador",
+                        fecha_inicio_contratacion=date(2025, 3, 1), fecha_termino_contratacion=date(2025, 6, 30),
+                    ))
+                    db.session.commit()
+                    escrituras += 1
+                else:
+                    q = Acta.query_filtrada(cesfam="CESFAM Tongoy", periodo_anio=2025, periodo_mes=rnd.randint(1, 12))
+                    Acta.pagina_keyset(q, None, 50)
+                    db.session.rollback()  # cierra la transacción de lectura, como al final de una request
+                    lecturas += 1
+            except OperationalError as e:
+                db.session.rollback()
+                if "locked" not in str(e):
+                    raise
+                bloqueos += 1
+        db.session.remove()
+    with lock:
+        resultados["lecturas"] += lecturas
+        resultados["escrituras"] += escrituras
+        resultados["bloqueos"] += bloqueos
+
+
+def correr(nombre, pragmas, args):
+    fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    from app import create_app, db
+
+    app = create_app()
+    app.config["SQLITE_PRAGMAS"] = pragmas
+    usuario_id = preparar(app, args.filas)
+
+    resultados = {"lecturas": 0, "escrituras": 0, "bloqueos": 0}
+    lock = threading.Lock()
+    hasta = time.perf_counter() + args.segundos
+    hilos = [
+        threading.Thread(target=trabajador, args=(app, usuario_id, hasta, args.escrituras, resultados, lock))
+        for _ in range(args.hilos)
+    ]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+
+    with app.app_context():
+        app.extensions["auditoria"].vaciar()  # lo pendiente se escribe antes de borrar la BD
+        db.engine.dispose()
+    for sufijo in ("", "-wal", "-shm"):
+        if os.path.exists(db_path + sufijo):
+            os.remove(db_path + sufijo)
+
+    total = resultados["lecturas"] + resultados["escrituras"]
+    print(f"{nombre:<12}{resultados['lecturas'] / args.segundos:>12.0f}{resultados['escrituras'] / args.segundos:>14.0f}"
+          f"{total / args.segundos:>12.0f}{resultados['bloqueos']:>10}")
+
+
+def main():
+    from app.perfil_sqlite import PRAGMAS_DEFECTO
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hilos", type=int, default=8)
+    parser.add_argument("--segundos", type=float, default=5)
+    parser.add_argument("--escrituras", type=float, default=0.2, help="fracción de operaciones que escriben")
+    parser.add_argument("--filas", type=int, default=10000, help="actas precargadas")
+    args = parser.parse_args()
+
+    print(f"{args.hilos} hilos, {args.segundos:g} s, {args.escrituras:.0%} escrituras, {args.filas} actas precargadas")
+    print(f"{'perfil':<12}{'lecturas/s':>12}{'escrituras/s':>14}{'total/s':>12}{'locked':>10}")
+    # "antes": el comportamiento por defecto de SQLite/pysqlite (journal DELETE, synchronous FULL)
+    correr("sin perfil", {}, args)
+    correr("con perfil", dict(PRAGMAS_DEFECTO), args)
+
+
+if __name__ == "__main__":
+    main()
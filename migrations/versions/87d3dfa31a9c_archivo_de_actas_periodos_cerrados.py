@@ -0,0 +1,124 @@
+"""archivo de actas de periodos cerrados
+
+Revision ID: 87d3dfa31a9c
+Revises: a7c3e9f1d2b4
+Create Date: 2025-09-08 15:22:10.934417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '87d3dfa31a9c'
+down_revision = 'a7c3e9f1d2b4'
+branch_labels = None
+depends_on = None
+
+# Copia de app/busqueda.py:ddl_fts("actas_archivo") (la migración no debe depender del código vivo)
+_COLS = "nombres, apellidos, rut, correlativo, cargo, observaciones"
+_NEW = "new.nombres, new.apellidos, new.rut, new.correlativo, new.cargo, new.observaciones"
+_OLD = "old.nombres, old.apellidos, old.rut, old.correlativo, old.cargo, old.observaciones"
+
+
+def upgrade():
+    op.create_table('actas_archivo',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('nombres', sa.String(length=120), nullable=False),
+    sa.Column('apellidos', sa.String(length=120), nullable=False),
+    sa.Column('rut', sa.String(length=20), nullable=False),
+    sa.Column('rut_normalizado', sa.String(length=12), nullable=True),
+    sa.Column('tipo_contrato', sa.String(length=40), nullable=False),
+    sa.Column('rut_titular_reemplazo', sa.String(length=20), nullable=True),
+    sa.Column('rut_titular_reemplazo_normalizado', sa.String(length=12), nullable=True),
+    sa.Column('nombre_titular_reemplazo', sa.String(length=120), nullable=True),
+    sa.Column('convenio', sa.String(length=120), nullable=True),
+    sa.Column('responsable', sa.String(length=120), nullable=True),
+    sa.Column('salud', sa.String(length=20), nullable=True),
+    sa.Column('plan_isapre', sa.String(length=120), nullable=True),
+    sa.Column('afp', sa.String(length=60), nullable=True),
+    sa.Column('cargo', sa.String(length=120), nullable=True),
+    sa.Column('jornada', sa.String(length=120), nullable=True),
+    sa.Column('horario_jornada', sa.Text(), nullable=True),
+    sa.Column('lugar_trabajo', sa.String(length=120), nullable=True),
+    sa.Column('motivo', sa.String(length=200), nullable=True),
+    sa.Column('observaciones', sa.Text(), nullable=True),
+    sa.Column('fecha_acta', sa.Date(), nullable=True),
+    sa.Column('fecha_inicio_contratacion', sa.Date(), nullable=True),
+    sa.Column('fecha_termino_contratacion', sa.Date(), nullable=True),
+    sa.Column('periodo_anio', sa.Integer(), nullable=False),
+    sa.Column('periodo_mes', sa.Integer(), nullable=False),
+    sa.Column('creado_en', sa.DateTime(), nullable=False),
+    sa.Column('modificado_en', sa.DateTime(), nullable=True),
+    sa.Column('usuario_id', sa.Integer(), nullable=False),
+    sa.Column('cesfam', sa.String(length=120), nullable=False),
+    sa.Column('firma_path', sa.String(length=255), nullable=True),
+    sa.Column('nombre_encargado', sa.String(length=120), nullable=True),
+    sa.Column('cargo_encargado', sa.String(length=120), nullable=True),
+    sa.Column('fecha_envio_fisico', sa.Date(), nullable=True),
+    sa.Column('usuario_envio_fisico', sa.Integer(), nullable=True),
+    sa.Column('correlativo', sa.String(length=30), nullable=True),
+    sa.Column('direccion', sa.String(length=200), nullable=True),
+    sa.Column('fecha_nacimiento', sa.Date(), nullable=True),
+    sa.Column('telefono', sa.String(length=50), nullable=True),
+    sa.Column('estado_civil', sa.String(length=50), nullable=True),
+    sa.Column('nacionalidad', sa.String(length=80), nullable=True),
+    sa.Column('lugar_nacimiento', sa.String(length=120), nullable=True),
+    sa.Column('email', sa.String(length=120), nullable=True),
+    sa.Column('categoria', sa.String(length=80), nullable=True),
+    sa.Column('estado', sa.String(length=20), nullable=True),
+    sa.Column('firma_tipo', sa.String(length=20), nullable=True),
+    sa.Column('firmada_en', sa.DateTime(), nullable=True),
+    sa.Column('firma_hash', sa.String(length=64), nullable=True),
+    sa.Column('firma_cn', sa.String(length=120), nullable=True),
+    sa.Column('firma_serial', sa.String(length=120), nullable=True),
+    sa.Column('firma_p7s_path', sa.String(length=255), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_acta_archivo_creado_id', 'actas_archivo', ['creado_en', 'id'], unique=False)
+    op.create_index('ix_acta_archivo_periodo_cesfam', 'actas_archivo', ['periodo_anio', 'periodo_mes', 'cesfam'], unique=False)
+    op.create_index('ix_acta_archivo_rut_norm', 'actas_archivo', ['rut_normalizado'], unique=False)
+    op.create_index(op.f('ix_actas_archivo_correlativo'), 'actas_archivo', ['correlativo'], unique=False)
+    op.create_index(op.f('ix_actas_archivo_estado'), 'actas_archivo', ['estado'], unique=False)
+    op.create_index(op.f('ix_actas_archivo_rut'), 'actas_archivo', ['rut'], unique=False)
+
+    # add_column directo (sin batch): no recrea la tabla
+    op.add_column('periodos_remunerativos', sa.Column('archivado_en', sa.DateTime(), nullable=True))
+
+    # Búsqueda: índice FTS5 propio del archivo (sólo SQLite)
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    op.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS actas_archivo_fts USING fts5({_COLS}, content='actas_archivo', "
+        "content_rowid='id', tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute(
+        f"CREATE TRIGGER IF NOT EXISTS actas_archivo_fts_ai AFTER INSERT ON actas_archivo BEGIN "
+        f"INSERT INTO actas_archivo_fts(rowid, {_COLS}) VALUES (new.id, {_NEW}); END"
+    )
+    op.execute(
+        f"CREATE TRIGGER IF NOT EXISTS actas_archivo_fts_ad AFTER DELETE ON actas_archivo BEGIN "
+        f"INSERT INTO actas_archivo_fts(actas_archivo_fts, rowid, {_COLS}) VALUES ('delete', old.id, {_OLD}); END"
+    )
+    op.execute(
+        f"CREATE TRIGGER IF NOT EXISTS actas_archivo_fts_au AFTER UPDATE OF {_COLS} ON actas_archivo BEGIN "
+        f"INSERT INTO actas_archivo_fts(actas_archivo_fts, rowid, {_COLS}) VALUES ('delete', old.id, {_OLD}); "
+        f"INSERT INTO actas_archivo_fts(rowid, {_COLS}) VALUES (new.id, {_NEW}); END"
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS actas_archivo_fts_au")
+        op.execute("DROP TRIGGER IF EXISTS actas_archivo_fts_ad")
+        op.execute("DROP TRIGGER IF EXISTS actas_archivo_fts_ai")
+        op.execute("DROP TABLE IF EXISTS actas_archivo_fts")
+    # Ojo: las actas archivadas se pierden; desarchivar antes (flask desarchivar-periodo)
+    op.drop_column('periodos_remunerativos', 'archivado_en')
+    op.drop_index(op.f('ix_actas_archivo_rut'), table_name='actas_archivo')
+    op.drop_index(op.f('ix_actas_archivo_estado'), table_name='actas_archivo')
+    op.drop_index(op.f('ix_actas_archivo_correlativo'), table_name='actas_archivo')
+    op.drop_index('ix_acta_archivo_rut_norm', table_name='actas_archivo')
+    op.drop_index('ix_acta_archivo_periodo_cesfam', table_name='actas_archivo')
+    op.drop_index('ix_acta_archivo_creado_id', table_name='actas_archivo')
+    op.drop_table('actas_archivo')
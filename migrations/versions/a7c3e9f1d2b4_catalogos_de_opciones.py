@@ -0,0 +1,74 @@
+"""catalogos de opciones (establecimientos, afp, nacionalidades, tipos de contrato)
+
+Revision ID: a7c3e9f1d2b4
+Revises: f5d1b7a3e246
+Create Date: 2025-09-03 11:08:47.215930
+
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c3e9f1d2b4'
+down_revision = 'f5d1b7a3e246'
+branch_labels = None
+depends_on = None
+
+# copia de las listas de app/forms.py al momento de la migración (sin placeholder)
+CATALOGOS = {
+    'establecimientos': [
+        'CESFAM Santa Cecilia', 'CESFAM San Juan', 'CESFAM Sergio Aguilar', 'CESFAM Tierras Blancas',
+        'CESFAM Tongoy', 'CESFAM Pan de Azúcar', 'CESFAM El Sauce', 'CESFAM Lila Cortés Godoy',
+        'CECOSF Punta Mira', 'PSR Guanaqueros', 'Departamento de Salud Coquimbo',
+    ],
+    'afp': [
+        'AFP Capital', 'AFP Cuprum', 'AFP Habitat', 'AFP Modelo', 'AFP PlanVital', 'AFP Provida', 'AFP Uno',
+    ],
+    'nacionalidades': [
+        'Chilena', 'Peruana', 'Boliviana', 'Colombiana', 'Española', 'Argentina', 'Brasileña',
+        'Ecuatoriana', 'Venezolana', 'Uruguaya', 'Paraguaya',
+    ],
+    'tipos_contrato': [
+        'Plazo Fijo', 'Plazo Fijo (Convenio)', 'Reemplazo', 'Reemplazo (Convenio)',
+    ],
+}
+
+
+def upgrade():
+    catalogos = op.create_table(
+        'catalogos',
+        sa.Column('nombre', sa.String(length=40), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('actualizado_en', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('nombre')
+    )
+    opciones = op.create_table(
+        'catalogo_opciones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('catalogo', sa.String(length=40), nullable=False),
+        sa.Column('valor', sa.String(length=120), nullable=False),
+        sa.Column('etiqueta', sa.String(length=120), nullable=False),
+        sa.Column('orden', sa.Integer(), nullable=False),
+        sa.Column('activo', sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(['catalogo'], ['catalogos.nombre'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('catalogo', 'valor', name='uq_catalogo_valor')
+    )
+    op.create_index('ix_catalogo_opciones_catalogo_orden', 'catalogo_opciones', ['catalogo', 'orden'], unique=False)
+
+    ahora = datetime.utcnow()
+    op.bulk_insert(catalogos, [{'nombre': nombre, 'version': 1, 'actualizado_en': ahora} for nombre in CATALOGOS])
+    for nombre, valores in CATALOGOS.items():
+        op.bulk_insert(opciones, [
+            {'catalogo': nombre, 'valor': v, 'etiqueta': v, 'orden': (i + 1) * 10, 'activo': True}
+            for i, v in enumerate(valores)
+        ])
+
+
+def downgrade():
+    op.drop_index('ix_catalogo_opciones_catalogo_orden', table_name='catalogo_opciones')
+    op.drop_table('catalogo_opciones')
+    op.drop_table('catalogos')
@@ -0,0 +1,38 @@
+"""tabla de auditoria (cambios en actas, periodos y usuarios)
+
+Revision ID: b6e2d8f4a1c7
+Revises: 87d3dfa31a9c
+Create Date: 2025-09-10 11:04:37.218830
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6e2d8f4a1c7'
+down_revision = '87d3dfa31a9c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('auditoria',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('creado_en', sa.DateTime(), nullable=False),
+    sa.Column('usuario_id', sa.Integer(), nullable=True),
+    sa.Column('origen', sa.String(length=80), nullable=True),
+    sa.Column('tabla', sa.String(length=40), nullable=False),
+    sa.Column('registro_id', sa.Integer(), nullable=False),
+    sa.Column('accion', sa.String(length=10), nullable=False),
+    sa.Column('cambios', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_auditoria_creado_en', 'auditoria', ['creado_en'], unique=False)
+    op.create_index('ix_auditoria_tabla_registro', 'auditoria', ['tabla', 'registro_id', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_auditoria_tabla_registro', table_name='auditoria')
+    op.drop_index('ix_auditoria_creado_en', table_name='auditoria')
+    op.drop_table('auditoria')
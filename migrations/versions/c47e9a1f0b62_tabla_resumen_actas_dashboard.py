@@ -0,0 +1,39 @@
+"""tabla resumen_actas para dashboard
+
+Revision ID: c47e9a1f0b62
+Revises: b81c3e7d2a4f
+Create Date: 2025-08-21 16:40:03.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c47e9a1f0b62'
+down_revision = 'b81c3e7d2a4f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'resumen_actas',
+        sa.Column('periodo_anio', sa.Integer(), nullable=False),
+        sa.Column('periodo_mes', sa.Integer(), nullable=False),
+        sa.Column('cesfam', sa.String(length=120), nullable=False),
+        sa.Column('estado', sa.String(length=20), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('periodo_anio', 'periodo_mes', 'cesfam', 'estado')
+    )
+
+    # Backfill: conteo inicial desde actas (después lo mantienen los eventos de Acta)
+    op.execute(
+        "INSERT INTO resumen_actas (periodo_anio, periodo_mes, cesfam, estado, total) "
+        "SELECT periodo_anio, periodo_mes, cesfam, COALESCE(estado, 'borrador'), COUNT(*) "
+        "FROM actas GROUP BY periodo_anio, periodo_mes, cesfam, COALESCE(estado, 'borrador')"
+    )
+
+
+def downgrade():
+    op.drop_table('resumen_actas')
@@ -0,0 +1,47 @@
+"""tabla de trabajos en segundo plano (exports, pdfs, importaciones)
+
+Revision ID: c9f3a5e7b2d0
+Revises: b6e2d8f4a1c7
+Create Date: 2025-09-12 09:41:05.517204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c9f3a5e7b2d0'
+down_revision = 'b6e2d8f4a1c7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('trabajos',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('tipo', sa.String(length=30), nullable=False),
+    sa.Column('estado', sa.String(length=12), nullable=False),
+    sa.Column('parametros', sa.Text(), nullable=True),
+    sa.Column('usuario_id', sa.Integer(), nullable=False),
+    sa.Column('creado_en', sa.DateTime(), nullable=False),
+    sa.Column('iniciado_en', sa.DateTime(), nullable=True),
+    sa.Column('terminado_en', sa.DateTime(), nullable=True),
+    sa.Column('worker', sa.String(length=80), nullable=True),
+    sa.Column('intentos', sa.Integer(), nullable=False),
+    sa.Column('progreso', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=True),
+    sa.Column('mensaje', sa.Text(), nullable=True),
+    sa.Column('resultado', sa.Text(), nullable=True),
+    sa.Column('archivo', sa.String(length=255), nullable=True),
+    sa.Column('nombre_descarga', sa.String(length=120), nullable=True),
+    sa.ForeignKeyConstraint(['usuario_id'], ['usuarios.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_trabajos_estado_id', 'trabajos', ['estado', 'id'], unique=False)
+    op.create_index('ix_trabajos_usuario_id', 'trabajos', ['usuario_id', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_trabajos_usuario_id', table_name='trabajos')
+    op.drop_index('ix_trabajos_estado_id', table_name='trabajos')
+    op.drop_table('trabajos')
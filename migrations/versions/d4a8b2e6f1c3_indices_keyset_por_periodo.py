@@ -0,0 +1,35 @@
+"""indices keyset para listado filtrado por periodo
+
+Revision ID: d4a8b2e6f1c3
+Revises: c9f3a5e7b2d0
+Create Date: 2025-09-22 11:03:27.640918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a8b2e6f1c3'
+down_revision = 'c9f3a5e7b2d0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # create_index directo (sin batch): no toca la tabla ni los triggers de FTS de actas
+    op.create_index('ix_acta_periodo_creado_id', 'actas',
+                    ['periodo_anio', 'periodo_mes', 'creado_en', 'id'], unique=False)
+    op.create_index('ix_acta_cesfam_periodo_creado_id', 'actas',
+                    ['cesfam', 'periodo_anio', 'periodo_mes', 'creado_en', 'id'], unique=False)
+    op.create_index('ix_acta_archivo_periodo_creado_id', 'actas_archivo',
+                    ['periodo_anio', 'periodo_mes', 'creado_en', 'id'], unique=False)
+    op.create_index('ix_acta_archivo_cesfam_periodo_creado_id', 'actas_archivo',
+                    ['cesfam', 'periodo_anio', 'periodo_mes', 'creado_en', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_acta_archivo_cesfam_periodo_creado_id', table_name='actas_archivo')
+    op.drop_index('ix_acta_archivo_periodo_creado_id', table_name='actas_archivo')
+    op.drop_index('ix_acta_cesfam_periodo_creado_id', table_name='actas')
+    op.drop_index('ix_acta_periodo_creado_id', table_name='actas')
@@ -0,0 +1,54 @@
+"""indice FTS5 para busqueda de actas
+
+Revision ID: d93b5f27c1e8
+Revises: c47e9a1f0b62
+Create Date: 2025-08-24 11:05:47.550912
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd93b5f27c1e8'
+down_revision = 'c47e9a1f0b62'
+branch_labels = None
+depends_on = None
+
+# Copia de app/busqueda.py:ddl_fts("actas") (la migración no debe depender del código vivo)
+_COLS = "nombres, apellidos, rut, correlativo, cargo, observaciones"
+_NEW = "new.nombres, new.apellidos, new.rut, new.correlativo, new.cargo, new.observaciones"
+_OLD = "old.nombres, old.apellidos, old.rut, old.correlativo, old.cargo, old.observaciones"
+
+
+def upgrade():
+    # FTS5 sólo existe en SQLite; en otros motores la búsqueda usa ILIKE
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    op.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS actas_fts USING fts5({_COLS}, content='actas', "
+        "content_rowid='id', tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute(
+        f"CREATE TRIGGER IF NOT EXISTS actas_fts_ai AFTER INSERT ON actas BEGIN "
+        f"INSERT INTO actas_fts(rowid, {_COLS}) VALUES (new.id, {_NEW}); END"
+    )
+    op.execute(
+        f"CREATE TRIGGER IF NOT EXISTS actas_fts_ad AFTER DELETE ON actas BEGIN "
+        f"INSERT INTO actas_fts(actas_fts, rowid, {_COLS}) VALUES ('delete', old.id, {_OLD}); END"
+    )
+    op.execute(
+        f"CREATE TRIGGER IF NOT EXISTS actas_fts_au AFTER UPDATE OF {_COLS} ON actas BEGIN "
+        f"INSERT INTO actas_fts(actas_fts, rowid, {_COLS}) VALUES ('delete', old.id, {_OLD}); "
+        f"INSERT INTO actas_fts(rowid, {_COLS}) VALUES (new.id, {_NEW}); END"
+    )
+    # Indexar las actas existentes
+    op.execute("INSERT INTO actas_fts(actas_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    op.execute("DROP TRIGGER IF EXISTS actas_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS actas_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS actas_fts_ai")
+    op.execute("DROP TABLE IF EXISTS actas_fts")
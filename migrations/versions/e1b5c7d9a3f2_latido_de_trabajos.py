@@ -0,0 +1,25 @@
+"""latido de trabajos en ejecucion
+
+Revision ID: e1b5c7d9a3f2
+Revises: d4a8b2e6f1c3
+Create Date: 2025-09-23 16:20:48.113902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1b5c7d9a3f2'
+down_revision = 'd4a8b2e6f1c3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # add_column directo (sin batch): no recrea la tabla
+    op.add_column('trabajos', sa.Column('latido_en', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('trabajos', 'latido_en')
@@ -0,0 +1,81 @@
+"""rut normalizado (indexado) en actas
+
+Revision ID: e2a6c8d4f913
+Revises: d93b5f27c1e8
+Create Date: 2025-08-27 09:31:12.402688
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2a6c8d4f913'
+down_revision = 'd93b5f27c1e8'
+branch_labels = None
+depends_on = None
+
+LOTE = 1000  # filas por UPDATE en el backfill
+
+
+def _normalizar_rut(rut):
+    # copia de app.models.normalizar_rut (la migración no debe depender del código vivo)
+    if not rut:
+        return None
+    limpio = "".join(ch for ch in str(rut).upper() if ch.isdigit() or ch == "K").lstrip("0")
+    return limpio if len(limpio) >= 2 else None
+
+
+def upgrade():
+    # add_column/create_index directos (sin batch): en SQLite no recrean la tabla
+    # y así se conservan los triggers de actas_fts
+    op.add_column('actas', sa.Column('rut_normalizado', sa.String(length=12), nullable=True))
+    op.add_column('actas', sa.Column('rut_titular_reemplazo_normalizado', sa.String(length=12), nullable=True))
+
+    # Backfill por lotes de id: memoria acotada y UPDATEs de tamaño fijo. Todo corre dentro de la
+    # transacción de la migración (Alembic): si se corta, no queda nada a medias.
+    conn = op.get_bind()
+    actas = sa.table(
+        'actas',
+        sa.column('id', sa.Integer),
+        sa.column('rut', sa.String),
+        sa.column('rut_titular_reemplazo', sa.String),
+        sa.column('rut_normalizado', sa.String),
+        sa.column('rut_titular_reemplazo_normalizado', sa.String),
+    )
+    actualizar = (
+        actas.update()
+        .where(actas.c.id == sa.bindparam('_id'))
+        .values(
+            rut_normalizado=sa.bindparam('_rut'),
+            rut_titular_reemplazo_normalizado=sa.bindparam('_rut_titular'),
+        )
+    )
+    ultimo = 0
+    while True:
+        filas = conn.execute(
+            sa.select(actas.c.id, actas.c.rut, actas.c.rut_titular_reemplazo)
+            .where(actas.c.id > ultimo)
+            .order_by(actas.c.id)
+            .limit(LOTE)
+        ).fetchall()
+        if not filas:
+            break
+        conn.execute(actualizar, [
+            {'_id': f.id, '_rut': _normalizar_rut(f.rut), '_rut_titular': _normalizar_rut(f.rut_titular_reemplazo)}
+            for f in filas
+        ])
+        ultimo = filas[-1].id
+
+    # índices después del backfill (más rápido que mantenerlos fila a fila)
+    op.create_index(op.f('ix_actas_rut_normalizado'), 'actas', ['rut_normalizado'], unique=False)
+    op.create_index(op.f('ix_actas_rut_titular_reemplazo_normalizado'), 'actas',
+                    ['rut_titular_reemplazo_normalizado'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_actas_rut_titular_reemplazo_normalizado'), table_name='actas')
+    op.drop_index(op.f('ix_actas_rut_normalizado'), table_name='actas')
+    # DROP COLUMN nativo (SQLite >= 3.35), tampoco recrea la tabla
+    op.drop_column('actas', 'rut_titular_reemplazo_normalizado')
+    op.drop_column('actas', 'rut_normalizado')
@@ -0,0 +1,34 @@
+"""indices para deteccion de traslapes de contratos
+
+Revision ID: f5d1b7a3e246
+Revises: e2a6c8d4f913
+Create Date: 2025-08-29 15:22:09.817340
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5d1b7a3e246'
+down_revision = 'e2a6c8d4f913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Los compuestos empiezan por el RUT normalizado: reemplazan a los índices simples
+    op.create_index('ix_acta_rut_norm_termino', 'actas',
+                    ['rut_normalizado', 'fecha_termino_contratacion', 'fecha_inicio_contratacion'], unique=False)
+    op.create_index('ix_acta_rut_titular_norm_termino', 'actas',
+                    ['rut_titular_reemplazo_normalizado', 'fecha_termino_contratacion', 'fecha_inicio_contratacion'],
+                    unique=False)
+    op.drop_index(op.f('ix_actas_rut_normalizado'), table_name='actas')
+    op.drop_index(op.f('ix_actas_rut_titular_reemplazo_normalizado'), table_name='actas')
+
+
+def downgrade():
+    op.create_index(op.f('ix_actas_rut_titular_reemplazo_normalizado'), 'actas',
+                    ['rut_titular_reemplazo_normalizado'], unique=False)
+    op.create_index(op.f('ix_actas_rut_normalizado'), 'actas', ['rut_normalizado'], unique=False)
+    op.drop_index('ix_acta_rut_titular_norm_termino', table_name='actas')
+    op.drop_index('ix_acta_rut_norm_termino', table_name='actas')
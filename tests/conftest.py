@@ -0,0 +1,128 @@
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CLAVE = "clave-de-prueba"
+
+
+def crear_app_prueba(tmp_path, monkeypatch, replica=None):
+    """App sobre un SQLite temporal, sin hilos de trabajos (los tests los corren a mano)."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'actas.db'}")
+    if replica:
+        monkeypatch.setenv("DATABASE_URL_REPLICA", f"sqlite:///{replica}")
+    else:
+        monkeypatch.delenv("DATABASE_URL_REPLICA", raising=False)
+    monkeypatch.setenv("TRABAJOS_HILOS", "0")
+    monkeypatch.setenv("TRABAJOS_FOLDER", str(tmp_path / "trabajos"))
+    monkeypatch.setenv("PDF_CACHE_FOLDER", str(tmp_path / "pdf_cache"))
+    monkeypatch.setenv("JINJA_CACHE_FOLDER", str(tmp_path / "jinja_cache"))
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:1000")  # scrypt es lento a propósito
+
+    from app import create_app, db
+
+    app = create_app()
+    app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    with app.app_context():
+        # sólo el primario: la réplica es una copia (y db.metadatas guarda los binds de apps anteriores)
+        db.create_all(bind_key=None)
+    return app
+
+
+def cerrar_app_prueba(app):
+    from app import db
+
+    with app.app_context():
+        app.extensions["auditoria"].vaciar()
+        db.session.remove()
+        for engine in db.engines.values():
+            engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def _caches_limpios():
+    # cachés globales del proceso: los ids y fechas se repiten entre tests
+    from app.catalogos import invalidar_catalogos
+    from app.models import cache_usuarios, invalidar_cache_periodo
+
+    for limpiar in (cache_usuarios.clear, invalidar_cache_periodo, invalidar_catalogos):
+        limpiar()
+    yield
+    for limpiar in (cache_usuarios.clear, invalidar_cache_periodo, invalidar_catalogos):
+        limpiar()
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    app = crear_app_prueba(tmp_path, monkeypatch)
+    yield app
+    cerrar_app_prueba(app)
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def ctx(app):
+    with app.app_context():
+        yield
+
+
+@pytest.fixture
+def usuarios(app):
+    """{'su': id, 'ad': id, 'otro': id}: superusuario y dos administrativos de CESFAM distintos."""
+    from app import db
+    from app.models import Usuario
+
+    with app.app_context():
+        ids = {}
+        for username, rol, cesfam in (("su", "superusuario", "CESFAM Tongoy"),
+                                      ("ad", "administrativo", "CESFAM Tongoy"),
+                                      ("otro", "administrativo", "CESFAM Guanaqueros")):
+            u = Usuario(username=username, rol=rol, cesfam=cesfam)
+            u.set_password(CLAVE)
+            db.session.add(u)
+            db.session.flush()
+            ids[username] = u.id
+        db.session.commit()
+    return ids
+
+
+def login(client, username):
+    r = client.post("/login", data={"username": username, "password": CLAVE})
+    assert r.status_code == 302, r.status_code
+    return client
+
+
+@pytest.fixture
+def periodo_vigente(app):
+    from app import db
+    from app.models import PeriodoRemunerativo
+
+    hoy = date.today()
+    with app.app_context():
+        p = PeriodoRemunerativo(anio=hoy.year, mes=hoy.month, fecha_inicio=hoy.replace(day=1),
+                                fecha_corte=hoy + timedelta(days=20))
+        db.session.add(p)
+        db.session.commit()
+        return p.id
+
+
+def nueva_acta(usuario_id, i=0, **campos):
+    """Acta mínima válida; `i` varía RUT, fechas y creado_en."""
+    from app.models import Acta
+
+    datos = dict(
+        nombres=f"Nombre{i}", apellidos="Apellido", rut=f"{10000000 + i}-K", tipo_contrato="Plazo Fijo",
+        cesfam="CESFAM Tongoy", periodo_anio=2025, periodo_mes=1, estado="borrador", usuario_id=usuario_id,
+        creado_en=datetime(2025, 1, 1) + timedelta(minutes=i),
+        fecha_inicio_contratacion=date(2025, 1, 1) + timedelta(days=i),
+        fecha_termino_contratacion=date(2025, 3, 1) + timedelta(days=i),
+    )
+    datos.update(campos)
+    return Acta(**datos)
@@ -0,0 +1,115 @@
+from datetime import date
+
+import pytest
+
+from conftest import login, nueva_acta
+
+
+@pytest.fixture
+def periodos(app, usuarios):
+    """2025-01 cerrado con 5 actas (ids 1..5) y 2025-02 abierto con 2 (ids 6..7, las más recientes)."""
+    from app import db
+    from app.models import PeriodoRemunerativo
+
+    with app.app_context():
+        for mes, estado in ((1, "cerrado"), (2, "abierto")):
+            db.session.add(PeriodoRemunerativo(anio=2025, mes=mes, estado=estado, fecha_inicio=date(2025, mes, 1),
+                                               fecha_corte=date(2025, mes, 20)))
+        for i in range(7):
+            db.session.add(nueva_acta(usuarios["ad"], i, periodo_mes=1 if i < 5 else 2))
+        db.session.commit()
+
+
+def _resumen():
+    from app.models import ResumenActas
+
+    return {(r.periodo_mes, r.cesfam, r.estado): r.total for r in ResumenActas.query}
+
+
+def test_archivar_mueve_y_marca(app, ctx, periodos):
+    from app.archivo import archivar_periodo, modelo_periodo
+    from app.models import Acta, ActaArchivada, PeriodoRemunerativo
+
+    antes = _resumen()
+    assert archivar_periodo(2025, 1, lote=2) == 5
+    assert Acta.query.filter_by(periodo_mes=1).count() == 0
+    assert sorted(a.id for a in ActaArchivada.query) == [1, 2, 3, 4, 5]
+    assert Acta.query.count() == 2
+    assert PeriodoRemunerativo.query.filter_by(mes=1).one().archivado_en is not None
+    assert modelo_periodo(2025, 1) is ActaArchivada
+    assert _resumen() == antes  # el resumen cuenta ambas tablas
+
+
+def test_marca_antes_de_mover(app, ctx, periodos):
+    from app.archivo import archivar_periodo, modelo_periodo
+    from app.models import ActaArchivada
+
+    vistas = []
+
+    def progreso(movidas):
+        # entre lotes el listado del período ya lee del archivo, y ahí están las movidas
+        modelo = modelo_periodo(2025, 1)
+        vistas.append((modelo, modelo.query_filtrada(periodo_anio=2025, periodo_mes=1).count(), movidas))
+
+    archivar_periodo(2025, 1, lote=2, progreso=progreso)
+    assert vistas == [(ActaArchivada, 2, 2), (ActaArchivada, 4, 4), (ActaArchivada, 5, 5)]
+
+
+def test_desarchivar_devuelve_todo(app, ctx, periodos):
+    from app.archivo import archivar_periodo, desarchivar_periodo, modelo_periodo
+    from app.models import Acta, ActaArchivada, PeriodoRemunerativo
+
+    archivar_periodo(2025, 1)
+    assert desarchivar_periodo(2025, 1, lote=3) == 5
+    assert ActaArchivada.query.count() == 0 and Acta.query.count() == 7
+    assert PeriodoRemunerativo.query.filter_by(mes=1).one().archivado_en is None
+    assert modelo_periodo(2025, 1) is Acta
+
+
+def test_solo_periodos_cerrados(app, ctx, periodos):
+    from app.archivo import ErrorArchivo, archivar_periodo
+
+    with pytest.raises(ErrorArchivo, match="abierto"):
+        archivar_periodo(2025, 2)
+
+
+def test_sqlite_no_archiva_el_acta_mas_reciente(app, ctx, periodos):
+    from app import db
+    from app.archivo import ErrorArchivo, archivar_periodo
+    from app.models import Acta, PeriodoRemunerativo
+
+    db.session.get(PeriodoRemunerativo, 2).estado = "cerrado"
+    db.session.commit()
+    with pytest.raises(ErrorArchivo, match="más recientes"):
+        archivar_periodo(2025, 2)
+    assert Acta.query.count() == 7
+    assert PeriodoRemunerativo.query.filter_by(mes=2).one().archivado_en is None
+
+
+def test_sqlite_compara_con_el_id_mas_alto_del_archivo(app, ctx, periodos):
+    from app import db
+    from app.archivo import ErrorArchivo, archivar_periodo
+    from app.models import Acta, ActaArchivada
+
+    # archivo con un id más alto que todo lo vigente (p. ej. restaurado): la próxima acta
+    # tomaría ids que ya están archivados
+    acta = nueva_acta(Acta.query.first().usuario_id, 99, periodo_anio=2024)
+    db.session.add(ActaArchivada(id=100, **{c.key: getattr(acta, c.key)
+                                            for c in ActaArchivada.__table__.columns if c.key != "id"}))
+    db.session.commit()
+    with pytest.raises(ErrorArchivo, match="más recientes"):
+        archivar_periodo(2025, 1)
+    assert Acta.query.count() == 7
+
+
+def test_archivada_solo_lectura(app, client, usuarios, periodos):
+    from app.archivo import archivar_periodo
+
+    with app.app_context():
+        archivar_periodo(2025, 1)
+    login(client, "ad")
+    html = client.get("/actas/1").get_data(as_text=True)
+    assert "archivada, sólo lectura" in html
+    assert client.get("/registrar_envio_fisico/1").status_code == 404
+    html = client.get("/actas?periodo=2025-01").get_data(as_text=True)
+    assert 'name="ids"' not in html  # sin casillas para el envío masivo
@@ -0,0 +1,201 @@
+import json
+from datetime import date
+
+import pandas as pd
+from sqlalchemy.exc import OperationalError
+
+from conftest import nueva_acta
+
+
+def _auditoria(app, **filtros):
+    """Entradas de auditoría ya escritas (vacía antes la cola), con `cambios` decodificado."""
+    from app import db
+    from app.models import Auditoria
+
+    with app.app_context():
+        app.extensions["auditoria"].vaciar()
+        q = db.select(Auditoria).filter_by(**filtros).order_by(Auditoria.id)
+        return [
+            dict(tabla=a.tabla, registro_id=a.registro_id, accion=a.accion, origen=a.origen,
+                 cambios=json.loads(a.cambios))
+            for a in db.session.scalars(q)
+        ]
+
+
+def test_cambios_del_orm(app, usuarios):
+    from app import db
+    from app.models import Acta, Usuario
+
+    with app.app_context():
+        acta = nueva_acta(usuarios["su"])
+        db.session.add(acta)
+        db.session.commit()
+        assert acta.estado == "borrador"  # recarga tras el commit, como una request nueva
+        acta.estado = "enviado"
+        db.session.get(Usuario, usuarios["ad"]).set_password("otra")
+        db.session.commit()
+        acta_id = acta.id
+
+    entradas = _auditoria(app, tabla="actas", registro_id=acta_id)
+    assert [e["accion"] for e in entradas] == ["insert", "update"]
+    assert entradas[0]["cambios"]["rut"] == "10000000-K"
+    assert entradas[1]["cambios"] == {"estado": ["borrador", "enviado"]}
+
+    (clave,) = _auditoria(app, tabla="usuarios", registro_id=usuarios["ad"], accion="update")
+    assert clave["cambios"]["password_hash"] == ["***", "***"]
+
+
+def test_rollback_no_se_audita(app, usuarios):
+    from app import db
+
+    with app.app_context():
+        db.session.add(nueva_acta(usuarios["su"]))
+        db.session.flush()
+        db.session.rollback()
+    assert _auditoria(app, tabla="actas") == []
+
+
+def _planilla(n):
+    from app.catalogos import CAMPOS_FORM, valores
+    from app.importar import OBLIGATORIAS, OPCIONALES, OPCIONES, dv_rut
+
+    def primero(col):
+        if col in CAMPOS_FORM:
+            return valores(CAMPOS_FORM[col])[0]
+        return next(v for v, _e in OPCIONES[col] if v)
+
+    cuerpos = pd.Series([str(15000000 + i) for i in range(n)])
+    filas = []
+    for i, (cuerpo, dv) in enumerate(zip(cuerpos, dv_rut(cuerpos))):
+        filas.append({
+            "correlativo": str(i + 1), "fecha_acta": "2025-01-02", "nombres": f"Importada{i}",
+            "apellidos": "Planilla", "rut": f"{cuerpo}-{dv}", "fecha_nacimiento": "1990-05-01",
+            "direccion": "Calle 1", "telefono": "123", "email": "a@b.cl",
+            "estado_civil": primero("estado_civil"), "nacionalidad": primero("nacionalidad"),
+            "lugar_nacimiento": "La Serena", "tipo_contrato": primero("tipo_contrato"),
+            "fecha_inicio_contratacion": f"2025-0{1 + i % 9}-01", "fecha_termino_contratacion": f"2025-0{1 + i % 9}-20",
+            "jornada": "44", "lugar_trabajo": primero("lugar_trabajo"), "cargo": "TENS",
+            "salud": "FONASA", "afp": primero("afp"), "categoria": "C", "nombre_encargado": "Enc",
+            "cargo_encargado": "Jefe", "responsable": "Resp",
+        })
+    return pd.DataFrame(filas).reindex(columns=OBLIGATORIAS + OPCIONALES).astype(object)
+
+
+def test_importacion_masiva_se_audita(app, usuarios):
+    from app import db
+    from app.importar import importar_actas
+    from app.models import Acta, Usuario
+
+    with app.app_context():
+        insertadas, reporte, _avisos = importar_actas(_planilla(5), db.session.get(Usuario, usuarios["su"]), 2025, 1)
+        assert (insertadas, reporte) == (5, [])
+        ruts = dict(db.session.execute(db.select(Acta.id, Acta.rut)).all())
+
+    entradas = _auditoria(app, tabla="actas", accion="insert")
+    assert len(entradas) == 5
+    # cada entrada corresponde a su fila (RETURNING en orden de parámetros)
+    assert {e["registro_id"]: e["cambios"]["rut"] for e in entradas} == ruts
+    assert all(e["cambios"]["estado"] == "borrador" for e in entradas)
+
+
+def test_firma_hash_del_pdf_se_audita(app, usuarios):
+    from app import db
+    from app.models import Acta
+    from app.pdf import obtener_pdf
+
+    with app.app_context():
+        acta = nueva_acta(usuarios["su"])
+        db.session.add(acta)
+        db.session.commit()
+        obtener_pdf(acta)
+        digest = db.session.get(Acta, acta.id).firma_hash
+        acta_id = acta.id
+
+    (entrada,) = _auditoria(app, tabla="actas", registro_id=acta_id, accion="update")
+    assert entrada["cambios"] == {"firma_hash": [None, digest]}
+
+
+def test_archivar_y_desarchivar_se_auditan(app, usuarios):
+    from app import db
+    from app.archivo import archivar_periodo, desarchivar_periodo
+    from app.models import PeriodoRemunerativo
+
+    with app.app_context():
+        db.session.add(PeriodoRemunerativo(anio=2025, mes=1, fecha_inicio=date(2025, 1, 1),
+                                           fecha_corte=date(2025, 1, 20), estado="cerrado"))
+        db.session.add_all(nueva_acta(usuarios["su"], i) for i in range(3))
+        db.session.add(nueva_acta(usuarios["su"], 3, periodo_mes=2))  # la más reciente, en otro período
+        db.session.commit()
+        assert archivar_periodo(2025, 1, lote=2) == 3
+        assert desarchivar_periodo(2025, 1) == 3
+
+    entradas = _auditoria(app, tabla="actas", accion="update")
+    assert [e["cambios"] for e in entradas] == [{"archivada": [False, True]}] * 3 + [{"archivada": [True, False]}] * 3
+    assert sorted(e["registro_id"] for e in entradas[:3]) == sorted(e["registro_id"] for e in entradas[3:])
+
+
+class _EngineQueFalla:
+    """Engine que falla con OperationalError las primeras `fallas` veces (BD bloqueada)."""
+
+    def __init__(self, engine, fallas):
+        self.engine = engine
+        self.fallas = fallas
+        self.intentos = 0
+
+    def begin(self):
+        self.intentos += 1
+        if self.intentos <= self.fallas:
+            raise OperationalError("INSERT INTO auditoria", {}, Exception("database is locked"))
+        return self.engine.begin()
+
+
+def _entrada(i):
+    from datetime import datetime
+    return dict(creado_en=datetime.utcnow(), usuario_id=None, origen="test", tabla="actas",
+                registro_id=i, accion="update", cambios="{}")
+
+
+def test_escritura_se_reintenta_si_la_bd_falla(app):
+    from app import db
+    from app.auditoria import EscritorAuditoria
+
+    with app.app_context():
+        engine = _EngineQueFalla(db.engine, fallas=2)
+        escritor = EscritorAuditoria(engine, reintentos=3, espera=0)
+        assert escritor._escribir([_entrada(1), _entrada(2)]) is True
+        assert engine.intentos == 3
+    assert len(_auditoria(app, origen="test")) == 2
+
+
+def test_escritura_se_descarta_tras_los_reintentos(app, caplog):
+    from app import db
+    from app.auditoria import EscritorAuditoria
+
+    with app.app_context():
+        engine = _EngineQueFalla(db.engine, fallas=10)
+        escritor = EscritorAuditoria(engine, reintentos=3, espera=0)
+        assert escritor._escribir([_entrada(1)]) is False
+        assert engine.intentos == 3
+    assert "se descartan" in caplog.text
+    assert _auditoria(app, origen="test") == []
+
+
+def test_vaciar_detiene_el_hilo_y_escribe_todo(app):
+    from app import db
+    from app.auditoria import EscritorAuditoria
+
+    with app.app_context():
+        # intervalo largo: sin vaciar, el hilo seguiría esperando completar el lote
+        escritor = EscritorAuditoria(db.engine, lote=1000, intervalo=60)
+        escritor.encolar([_entrada(i) for i in range(10)])
+        hilo = escritor._hilo
+        escritor.vaciar(timeout=5)
+        assert not hilo.is_alive()
+        assert escritor._cola.empty()
+        assert len(_auditoria(app, origen="test")) == 10
+
+        # un encolar posterior vuelve a levantar el hilo
+        escritor.encolar([_entrada(10)])
+        assert escritor._hilo is not hilo and escritor._hilo.is_alive()
+        escritor.vaciar(timeout=5)
+    assert len(_auditoria(app, origen="test")) == 11
@@ -0,0 +1,59 @@
+import pytest
+
+from conftest import nueva_acta
+
+
+def _archivada(usuario_id, i, **campos):
+    from app.models import ActaArchivada
+
+    acta = nueva_acta(usuario_id, i, **campos)
+    return ActaArchivada(id=1000 + i, **{c.key: getattr(acta, c.key) for c in ActaArchivada.__table__.columns
+                                         if c.key != "id"})
+
+
+@pytest.fixture
+def actas(app, usuarios):
+    from app import db
+
+    with app.app_context():
+        db.session.add_all([
+            nueva_acta(usuarios["su"], 0, nombres="Ana María", apellidos="Pérez"),
+            nueva_acta(usuarios["su"], 1, nombres="Juan", apellidos="Soto", observaciones="Ana"),
+            nueva_acta(usuarios["su"], 2, nombres="Pedro", apellidos="Rojas", cesfam="CESFAM Guanaqueros",
+                       observaciones="100%_cubierto"),
+        ])
+        # en el archivo "Ana" pesa más (aparece en tres columnas), pero las vigentes van primero
+        db.session.add(_archivada(usuarios["su"], 3, nombres="Ana", apellidos="Ana", observaciones="Ana"))
+        db.session.commit()
+
+
+def test_prefijos_sin_acentos(app, ctx, actas):
+    from app.busqueda import buscar_actas
+
+    assert [a.apellidos for a in buscar_actas("ana per")] == ["Pérez"]
+
+
+def test_vigentes_antes_que_archivadas(app, ctx, actas):
+    from app.busqueda import buscar_actas
+
+    actas_ = buscar_actas("ana")
+    assert [getattr(a, "archivada", False) for a in actas_] == [False, False, True]
+    assert actas_[0].apellidos == "Pérez"  # dentro de cada fuente, por bm25
+    assert len(buscar_actas("ana", limite=2)) == 2
+
+
+def test_filtro_cesfam(app, ctx, actas):
+    from app.busqueda import buscar_actas
+
+    assert buscar_actas("pedro", cesfam="CESFAM Tongoy") == []
+    assert len(buscar_actas("pedro", cesfam="CESFAM Guanaqueros")) == 1
+
+
+def test_ilike_escapa_comodines(app, ctx, actas, monkeypatch):
+    from app import db
+    from app.busqueda import buscar_actas
+
+    monkeypatch.setattr(db.engine.dialect, "name", "postgresql")  # fuerza la rama sin FTS
+    assert [a.nombres for a in buscar_actas("0%_c")] == ["Pedro"]
+    assert buscar_actas("a_a") == []  # "_" no es comodín
+    assert buscar_actas("n%r") == []
@@ -0,0 +1,105 @@
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from conftest import login
+
+
+def _cambio_en_otro_worker(app, sql, **params):
+    """UPDATE/DELETE por fuera del ORM de este proceso: no dispara _invalidar_usuario."""
+    from app import db
+
+    with app.app_context(), db.engine.begin() as conn:
+        conn.execute(db.text(sql), params)
+
+
+@pytest.fixture
+def sentencias(app):
+    """Lista de las sentencias SQL ejecutadas mientras corre el test."""
+    from app import db
+
+    with app.app_context():
+        engine = db.engine
+    vistas = []
+
+    def _anotar(_conn, _cursor, sql, *_args):
+        vistas.append(sql)
+
+    event.listen(engine, "before_cursor_execute", _anotar)
+    yield vistas
+    event.remove(engine, "before_cursor_execute", _anotar)
+
+
+@pytest.fixture
+def ttl_corto():
+    from app.models import cache_usuarios
+
+    ttl = cache_usuarios.ttl
+    cache_usuarios.ttl = 0.2
+    yield 0.2
+    cache_usuarios.ttl = ttl
+
+
+def test_hit_sin_query(app, usuarios, sentencias):
+    from app.models import cache_usuarios, cargar_usuario
+
+    with app.app_context():
+        assert cargar_usuario(usuarios["su"]).username == "su"
+    sentencias.clear()
+    hits = cache_usuarios.hits
+    with app.app_context():
+        u = cargar_usuario(usuarios["su"])
+        assert (u.username, u.rol) == ("su", "superusuario")
+    assert cache_usuarios.hits == hits + 1
+    assert sentencias == []
+
+
+def test_cambio_en_este_worker_invalida_al_instante(app, usuarios):
+    from app import db
+    from app.models import Usuario, cargar_usuario
+
+    with app.app_context():
+        cargar_usuario(usuarios["su"])
+        db.session.get(Usuario, usuarios["su"]).rol = "administrativo"
+        db.session.commit()
+    with app.app_context():
+        assert cargar_usuario(usuarios["su"]).rol == "administrativo"
+
+
+def test_cambio_en_otro_worker_se_ve_al_vencer_el_ttl(app, usuarios, ttl_corto):
+    from app.models import cargar_usuario
+
+    with app.app_context():
+        cargar_usuario(usuarios["su"])
+    _cambio_en_otro_worker(app, "UPDATE usuarios SET rol = 'administrativo', actualizado_en = :t WHERE id = :id",
+                           t=datetime.utcnow(), id=usuarios["su"])
+    with app.app_context():
+        assert cargar_usuario(usuarios["su"]).rol == "superusuario"  # todavía el snapshot
+    time.sleep(ttl_corto)
+    with app.app_context():
+        assert cargar_usuario(usuarios["su"]).rol == "administrativo"
+
+
+def test_usuario_borrado_en_otro_worker(app, usuarios, ttl_corto):
+    from app.models import cargar_usuario
+
+    with app.app_context():
+        cargar_usuario(usuarios["ad"])
+    _cambio_en_otro_worker(app, "DELETE FROM usuarios WHERE id = :id", id=usuarios["ad"])
+    time.sleep(ttl_corto)
+    with app.app_context():
+        assert cargar_usuario(usuarios["ad"]) is None
+
+
+def test_rol_quitado_corta_acceso_en_la_siguiente_request(app, client, usuarios):
+    from app import db
+    from app.models import Usuario
+
+    login(client, "su")
+    assert client.get("/dashboard").status_code == 200
+    with app.app_context():
+        db.session.get(Usuario, usuarios["su"]).rol = "administrativo"
+        db.session.commit()
+    assert client.get("/dashboard").status_code == 403
@@ -0,0 +1,88 @@
+import time
+
+from conftest import login
+
+
+def test_sin_catalogo_en_bd_usa_defectos(app, ctx):
+    from app.catalogos import DEFECTOS, opciones, version
+
+    assert version("afp") == 0
+    assert opciones("afp") == [(v, e) for (v, e) in DEFECTOS["afp"] if v]
+
+
+def test_guardar_opcion_sube_version_y_copia_defectos(app, ctx):
+    from app import db
+    from app.catalogos import DEFECTOS, guardar_opcion, valores, version
+    from app.models import CatalogoOpcion
+
+    guardar_opcion("afp", "Nueva AFP")
+    db.session.commit()
+    assert version("afp") == 1
+    assert valores("afp") == [v for (v, _e) in DEFECTOS["afp"] if v] + ["Nueva AFP"]
+    assert CatalogoOpcion.query.filter_by(catalogo="afp").count() == len(valores("afp"))
+
+    guardar_opcion("afp", "Nueva AFP", activo=False)
+    db.session.commit()
+    assert version("afp") == 2
+    assert "Nueva AFP" not in valores("afp")
+    assert CatalogoOpcion.query.filter_by(catalogo="afp", valor="Nueva AFP").one().activo is False
+
+
+def test_rollback_no_toca_la_cache(app, ctx):
+    from app import db
+    from app.catalogos import _opciones, guardar_opcion, valores
+
+    antes = valores("afp")
+    guardar_opcion("afp", "Descartada")
+    db.session.rollback()
+    assert "afp" in _opciones  # sigue la lista cacheada
+    assert valores("afp") == antes
+
+
+def test_lectura_antes_del_commit_no_deja_cache_vieja(app, usuarios):
+    from app import db
+    from app.catalogos import guardar_opcion, valores
+
+    with app.app_context():
+        guardar_opcion("afp", "Nueva AFP")
+        # otra request del mismo worker lee mientras tanto: todavía ve (y cachea) lo confirmado
+        with app.app_context():
+            assert "Nueva AFP" not in valores("afp")
+        db.session.commit()
+    with app.app_context():
+        assert "Nueva AFP" in valores("afp")
+
+
+def test_cambio_en_otro_worker_se_ve_al_vencer_el_ttl(app, ctx, monkeypatch):
+    from app import db
+    from app.catalogos import _versiones, guardar_opcion, valores
+
+    monkeypatch.setattr(_versiones, "ttl", 0.2)
+    guardar_opcion("afp", "Nueva AFP")
+    db.session.commit()
+    assert "Nueva AFP" in valores("afp")
+    with db.engine.begin() as conn:  # otro worker: sin pasar por esta sesión
+        conn.execute(db.text("UPDATE catalogo_opciones SET activo = 0 WHERE valor = 'Nueva AFP'"))
+        conn.execute(db.text("UPDATE catalogos SET version = version + 1 WHERE nombre = 'afp'"))
+    assert "Nueva AFP" in valores("afp")
+    time.sleep(0.2)
+    assert "Nueva AFP" not in valores("afp")
+
+
+def test_json_versionado(app, client, usuarios):
+    from app import db
+    from app.catalogos import guardar_opcion
+
+    login(client, "ad")
+    r = client.get("/catalogos/afp.json")
+    assert r.json["version"] == 0 and r.headers["Cache-Control"] == "private, no-cache"
+    etag = r.headers["ETag"]
+    assert client.get("/catalogos/afp.json", headers={"If-None-Match": etag}).status_code == 304
+
+    with app.app_context():
+        guardar_opcion("afp", "Nueva AFP")
+        db.session.commit()
+    r = client.get("/catalogos/afp.json?v=1", headers={"If-None-Match": etag})
+    assert r.status_code == 200 and r.json["version"] == 1
+    assert "immutable" in r.headers["Cache-Control"]
+    assert {"valor": "Nueva AFP", "etiqueta": "Nueva AFP"} in r.json["opciones"]
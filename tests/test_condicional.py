@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+import pytest
+
+from conftest import login, nueva_acta
+
+
+@pytest.fixture
+def acta_id(app, usuarios):
+    from app import db
+
+    with app.app_context():
+        acta = nueva_acta(usuarios["ad"])
+        db.session.add(acta)
+        db.session.commit()
+        return acta.id
+
+
+def test_detalle_304_hasta_que_cambia(app, client, usuarios, acta_id):
+    from app import db
+    from app.models import Acta
+
+    login(client, "ad")
+    r = client.get(f"/actas/{acta_id}")
+    assert r.status_code == 200 and r.headers["ETag"]
+    etag = r.headers["ETag"]
+
+    assert client.get(f"/actas/{acta_id}", headers={"If-None-Match": etag}).status_code == 304
+    ultima = r.headers["Last-Modified"]
+    assert client.get(f"/actas/{acta_id}", headers={"If-Modified-Since": ultima}).status_code == 304
+
+    with app.app_context():
+        acta = db.session.get(Acta, acta_id)
+        acta.observaciones = "editada"
+        acta.modificado_en = acta.creado_en + timedelta(days=1)
+        db.session.commit()
+    r = client.get(f"/actas/{acta_id}", headers={"If-None-Match": etag})
+    assert r.status_code == 200 and r.headers["ETag"] != etag
+
+
+def test_listado_304_hasta_que_cambia(app, client, usuarios, acta_id):
+    from app import db
+
+    login(client, "su")
+    etag = client.get("/actas").headers["ETag"]
+    assert client.get("/actas", headers={"If-None-Match": etag}).status_code == 304
+
+    with app.app_context():
+        db.session.add(nueva_acta(usuarios["su"], 1))
+        db.session.commit()
+    assert client.get("/actas", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_etag_distinto_por_usuario(app, usuarios, acta_id):
+    etags = []
+    for username in ("su", "ad"):
+        client = login(app.test_client(), username)
+        etags.append(client.get(f"/actas/{acta_id}").headers["ETag"])
+    assert etags[0] != etags[1]
+
+
+def test_flash_pendiente_evita_el_304(app, client, usuarios, acta_id):
+    login(client, "ad")
+    etag = client.get(f"/actas/{acta_id}").headers["ETag"]
+    with client.session_transaction() as s:
+        s["_flashes"] = [("success", "Acta actualizada.")]
+
+    r = client.get(f"/actas/{acta_id}", headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert "Acta actualizada." in r.get_data(as_text=True)
+    # la página con el mensaje no queda como versión válida en el navegador
+    assert "ETag" not in r.headers and r.headers["Cache-Control"] == "no-store"
+
+    # el render consumió el mensaje: la siguiente visita vuelve a ser condicional
+    with client.session_transaction() as s:
+        assert not s.get("_flashes")
+    assert client.get(f"/actas/{acta_id}", headers={"If-None-Match": etag}).status_code == 304
@@ -0,0 +1,88 @@
+from datetime import date
+
+import pytest
+
+from conftest import login, nueva_acta
+
+
+@pytest.fixture
+def actas(app, usuarios):
+    """ids 1..4 de 'ad' (2 ya enviada, 3 cerrada), 5 de 'su', 6 de 'otro' en Guanaqueros."""
+    from app import db
+
+    with app.app_context():
+        db.session.add_all([
+            nueva_acta(usuarios["ad"], 0),
+            nueva_acta(usuarios["ad"], 1, estado="enviado", fecha_envio_fisico=date(2025, 1, 5)),
+            nueva_acta(usuarios["ad"], 2, estado="cerrado"),
+            nueva_acta(usuarios["ad"], 3),
+            nueva_acta(usuarios["su"], 4),
+            nueva_acta(usuarios["otro"], 5, cesfam="CESFAM Guanaqueros"),
+        ])
+        db.session.commit()
+
+
+def _resumen():
+    from app.models import ResumenActas
+
+    return {(r.cesfam, r.estado): r.total for r in ResumenActas.query if r.total}
+
+
+def _enviadas():
+    from app.models import Acta
+
+    return {a.id: (a.estado, a.fecha_envio_fisico, a.usuario_envio_fisico) for a in Acta.query if a.fecha_envio_fisico}
+
+
+def test_un_update_salta_enviadas_y_cerradas(app, ctx, usuarios, actas):
+    from app import db
+    from app.models import Acta
+
+    assert _resumen() == {("CESFAM Tongoy", "borrador"): 3, ("CESFAM Tongoy", "enviado"): 1,
+                          ("CESFAM Tongoy", "cerrado"): 1, ("CESFAM Guanaqueros", "borrador"): 1}
+    n = Acta.registrar_envio_fisico_masivo(Acta.cesfam == "CESFAM Tongoy", date(2025, 2, 1), usuarios["su"])
+    db.session.commit()
+    assert n == 3
+    assert _enviadas() == {
+        1: ("enviado", date(2025, 2, 1), usuarios["su"]),
+        2: ("enviado", date(2025, 1, 5), None),
+        4: ("enviado", date(2025, 2, 1), usuarios["su"]),
+        5: ("enviado", date(2025, 2, 1), usuarios["su"]),
+    }
+    assert db.session.get(Acta, 3).fecha_envio_fisico is None
+    assert _resumen() == {("CESFAM Tongoy", "enviado"): 4, ("CESFAM Tongoy", "cerrado"): 1,
+                          ("CESFAM Guanaqueros", "borrador"): 1}
+
+
+def test_nada_pendiente_no_escribe(app, ctx, usuarios, actas):
+    from app.models import Acta
+
+    antes = _resumen()
+    assert Acta.registrar_envio_fisico_masivo(Acta.id.in_([2, 3]), date(2025, 2, 1), usuarios["su"]) == 0
+    assert _resumen() == antes
+
+
+def test_ruta_administrativo_solo_propias(app, client, usuarios, actas):
+    login(client, "ad")
+    r = client.post("/actas/envio_fisico", data={"ids": ["1", "5", "6"], "fecha_envio_fisico": "2025-02-01"})
+    assert r.status_code == 302
+    with app.app_context():
+        assert set(_enviadas()) == {1, 2}
+        assert _resumen()[("CESFAM Tongoy", "enviado")] == 2
+
+
+def test_ruta_todas_las_filtradas(app, client, usuarios, actas):
+    login(client, "su")
+    r = client.post("/actas/envio_fisico?cesfam=CESFAM+Guanaqueros",
+                    data={"todas": "1", "fecha_envio_fisico": "2025-02-01"})
+    assert r.status_code == 302 and "cesfam=CESFAM" in r.headers["Location"]
+    with app.app_context():
+        assert set(_enviadas()) == {2, 6}
+        assert ("CESFAM Guanaqueros", "borrador") not in _resumen()
+
+
+def test_ruta_fecha_invalida(app, client, usuarios, actas):
+    login(client, "su")
+    client.post("/actas/envio_fisico", data={"ids": ["1"], "fecha_envio_fisico": "ayer"})
+    with app.app_context():
+        assert set(_enviadas()) == {2}
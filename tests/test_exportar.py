@@ -0,0 +1,38 @@
+from conftest import login, nueva_acta
+
+
+def _actas(app, usuario_id, n):
+    from app import db
+
+    with app.app_context():
+        db.session.add_all(nueva_acta(usuario_id, i) for i in range(n))
+        db.session.commit()
+
+
+def test_xlsx_chico_se_genera_en_la_request(app, client, usuarios):
+    _actas(app, usuarios["su"], 5)
+    login(client, "su")
+    r = client.get("/actas/exportar.xlsx?periodo=2025-01")
+    assert r.status_code == 200
+    assert r.mimetype == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    assert r.get_data()[:2] == b"PK"
+
+
+def test_xlsx_grande_va_a_la_cola(app, client, usuarios):
+    from app import db
+    from app.models import Trabajo
+    from app.trabajos import ejecutar, tomar_siguiente
+
+    app.config["EXPORT_XLSX_SINCRONO_MAX"] = 3
+    _actas(app, usuarios["su"], 5)
+    login(client, "su")
+    r = client.get("/actas/exportar.xlsx?periodo=2025-01")
+    assert r.status_code == 302 and r.headers["Location"].endswith("/trabajos")
+
+    with app.app_context():
+        t = db.session.scalars(db.select(Trabajo)).one()
+        assert (t.tipo, t.estado) == ("exportar_xlsx", "pendiente")
+        ejecutar(tomar_siguiente())
+        t = db.session.get(Trabajo, t.id)
+        assert t.estado == "listo", t.mensaje
+        assert t.nombre_descarga == "actas_2025_01.xlsx"
@@ -0,0 +1,62 @@
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+
+@pytest.mark.parametrize("nombre, mimetype", [
+    ("ab/abcdef.png", "image/png"),
+    ("ab/firma_antigua.jpg", "image/jpeg"),
+    ("ab/firma_antigua.gif", "image/gif"),
+    ("ab/sin_extension", "application/octet-stream"),
+])
+@pytest.mark.parametrize("front_proxy", ["", "nginx"])
+def test_enviar_firma_usa_el_tipo_del_archivo(app, tmp_path, nombre, mimetype, front_proxy):
+    from app.firmas import enviar_firma
+
+    app.config.update(UPLOAD_FOLDER=str(tmp_path), FRONT_PROXY=front_proxy)
+    (tmp_path / "ab").mkdir()
+    (tmp_path / nombre).write_bytes(b"contenido")
+    with app.test_request_context("/"):
+        resp = enviar_firma(f"static/uploads/firmas/{nombre}")
+        assert resp.mimetype == mimetype
+        if front_proxy == "nginx":
+            assert resp.headers["X-Accel-Redirect"].endswith(nombre)
+        resp.close()
+
+
+def test_enviar_firma_fuera_de_la_carpeta(app):
+    from app.firmas import enviar_firma
+
+    with app.test_request_context("/"), pytest.raises(FileNotFoundError):
+        enviar_firma("app/../config.py")
+
+
+
+def _png(ancho, alto):
+    out = BytesIO()
+    Image.new("L", (ancho, alto), 255).save(out, format="PNG")
+    out.seek(0)
+    return out
+
+
+def test_normalizar_acota_el_tamano():
+    from app.firmas import FIRMA_MAX_PX, normalizar
+
+    img = Image.open(BytesIO(normalizar(_png(4000, 1000))))
+    assert img.mode == "L" and img.width <= FIRMA_MAX_PX[0] and img.height <= FIRMA_MAX_PX[1]
+
+
+def test_normalizar_no_imagen():
+    from app.firmas import normalizar
+
+    with pytest.raises(ValueError, match="no es una imagen válida"):
+        normalizar(BytesIO(b"no es una imagen"))
+
+
+def test_normalizar_bomba_de_descompresion(monkeypatch):
+    from app.firmas import normalizar
+
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 100)  # 400 px > 2 x 100
+    with pytest.raises(ValueError, match="demasiado grande"):
+        normalizar(_png(20, 20))
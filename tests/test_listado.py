@@ -0,0 +1,102 @@
+import re
+
+import pytest
+
+from conftest import login, nueva_acta
+
+
+@pytest.fixture
+def actas(app, usuarios):
+    """90 actas: 3 períodos x 2 CESFAM, con creado_en repetido de a pares (prueba el desempate por id)."""
+    from app import db
+
+    with app.app_context():
+        for i in range(90):
+            db.session.add(nueva_acta(
+                usuarios["su"], i, periodo_mes=1 + i % 3,
+                cesfam="CESFAM Tongoy" if i % 2 else "CESFAM Guanaqueros",
+            ))
+        db.session.commit()
+
+
+def _ids_listados(client, url):
+    """Recorre todas las páginas del listado siguiendo el cursor; devuelve los ids en orden."""
+    ids = []
+    while url:
+        html = client.get(url).get_data(as_text=True)
+        ids += [int(x) for x in re.findall(r'name="ids" value="(\d+)"', html)]
+        m = re.search(r'href="([^"]*cursor=[^"]*)"', html)
+        url = m.group(1).replace("&amp;", "&") if m else None
+    return ids
+
+
+def test_paginas_keyset_sin_repetir_ni_perder(app, client, usuarios, actas):
+    from app.models import Acta
+
+    login(client, "su")
+    ids = _ids_listados(client, "/actas?por_pagina=7")
+    with app.app_context():
+        esperados = [a.id for a in Acta.query.order_by(Acta.creado_en.desc(), Acta.id.desc())]
+    assert ids == esperados
+
+
+def test_filtro_periodo_y_cesfam(app, client, usuarios, actas):
+    from app import db
+    from app.models import Acta
+
+    login(client, "su")
+    ids = _ids_listados(client, "/actas?por_pagina=4&periodo=2025-02&cesfam=CESFAM+Tongoy")
+    with app.app_context():
+        actas_ = [db.session.get(Acta, i) for i in ids]
+        assert len(ids) == 15
+        assert all((a.periodo_anio, a.periodo_mes, a.cesfam) == (2025, 2, "CESFAM Tongoy") for a in actas_)
+
+
+def test_administrativo_limitado_a_su_cesfam(app, client, usuarios, actas):
+    from app import db
+    from app.models import Acta
+
+    login(client, "otro")
+    ids = _ids_listados(client, "/actas?cesfam=CESFAM+Tongoy")
+    with app.app_context():
+        assert len(ids) == 45
+        assert {db.session.get(Acta, i).cesfam for i in ids} == {"CESFAM Guanaqueros"}
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    ("2025-03", (2025, 3)),
+    ("2025-12", (2025, 12)),
+    ("2025-13", None),
+    ("2025-00", None),
+    ("1999-05", None),
+    ("2025-ab", None),
+    ("abc", None),
+    ("", None),
+    (None, None),
+])
+def test_parsear_periodo(texto, esperado):
+    from app.routes import parsear_periodo
+
+    assert parsear_periodo(texto) == esperado
+
+
+def test_periodo_invalido_no_filtra(app, client, usuarios, actas):
+    login(client, "su")
+    html = client.get("/actas?por_pagina=200&periodo=2025-13").get_data(as_text=True)
+    assert "Período de filtro inválido" in html
+    assert len(re.findall(r'name="ids" value="\d+"', html)) == 90
+
+
+@pytest.mark.parametrize("filtros, indice", [
+    ({"periodo_anio": 2025, "periodo_mes": 2}, "ix_acta_periodo_creado_id"),
+    ({"cesfam": "CESFAM Tongoy", "periodo_anio": 2025, "periodo_mes": 2}, "ix_acta_cesfam_periodo_creado_id"),
+])
+def test_keyset_filtrado_usa_indice_sin_ordenar(app, ctx, actas, filtros, indice):
+    from app import db
+    from app.models import Acta
+
+    q = Acta.query_filtrada(**filtros).order_by(Acta.creado_en.desc(), Acta.id.desc()).limit(51)
+    sql = str(q.statement.compile(db.engine, compile_kwargs={"literal_binds": True}))
+    plan = " ".join(fila[-1] for fila in db.session.execute(db.text("EXPLAIN QUERY PLAN " + sql)))
+    assert indice in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,92 @@
+import re
+
+import pytest
+
+from conftest import nueva_acta
+
+
+def _lineas_pdf(contenido):
+    """Texto de cada línea dibujada (une los fragmentos `(...) Tj` de un PDF sin comprimir)."""
+    lineas = []
+    for fila in contenido.split(b"\n"):
+        partes = re.findall(rb"\(((?:[^()\\]|\\.)*)\) Tj", fila)
+        if partes:
+            lineas.append(re.sub(rb"\\([()\\])", rb"\1", b"".join(partes)).decode("latin-1"))
+    return lineas
+
+
+@pytest.fixture
+def sin_compresion(monkeypatch):
+    # PDF sin comprimir: el texto queda legible en los bytes
+    from reportlab import rl_config
+    monkeypatch.setattr(rl_config, "pageCompression", 0)
+
+
+def test_valores_con_marcado_se_escapan(app, ctx, usuarios, sin_compresion):
+    from app import db
+    from app.pdf import render_pdf
+
+    acta = nueva_acta(usuarios["su"], nombres="Ana <b>", apellidos="Soto & Cia", motivo="x > y",
+                      observaciones="<font size=40>grande</font>")
+    db.session.add(acta)
+    db.session.commit()
+
+    texto = "\n".join(_lineas_pdf(render_pdf(acta)))
+    for literal in ("Ana <b>", "Soto & Cia", "x > y", "<font size=40>grande</font>",
+                    "Sr. (a) Ana <b> Soto & Cia"):
+        assert literal in texto
+
+
+def test_fmt_escapa_y_formatea():
+    from datetime import date, datetime
+    from app.pdf import _fmt
+
+    assert _fmt("a<b>&c") == "a&lt;b&gt;&amp;c"
+    assert _fmt(None) == _fmt("") == "—"
+    assert _fmt(date(2025, 3, 1)) == "01-03-2025"
+    assert _fmt(datetime(2025, 3, 1, 9, 5)) == "01-03-2025 09:05"
+
+
+def test_obtener_pdf_cachea_y_registra_hash(app, ctx, usuarios):
+    import hashlib
+    from app import db
+    from app.models import Acta
+    from app.pdf import obtener_pdf
+
+    acta = nueva_acta(usuarios["su"], nombres="<script>")
+    db.session.add(acta)
+    db.session.commit()
+
+    ruta = obtener_pdf(acta)
+    assert obtener_pdf(acta) == ruta
+    with open(ruta, "rb") as f:
+        assert db.session.get(Acta, acta.id).firma_hash == hashlib.sha256(f.read()).hexdigest()
+
+
+def test_cache_sin_uso_se_limpia(app, ctx, usuarios):
+    import os
+    import time
+
+    from app import db
+    from app.pdf import RENOVAR_USO_CADA, limpiar_cache_pdf, obtener_pdf
+
+    viejo, nuevo = nueva_acta(usuarios["su"], 0), nueva_acta(usuarios["su"], 1)
+    db.session.add_all([viejo, nuevo])
+    db.session.commit()
+    ruta_vieja, ruta_nueva = obtener_pdf(viejo), obtener_pdf(nuevo)
+    hace_40_dias = time.time() - 40 * 86400
+    os.utime(ruta_vieja, (hace_40_dias, hace_40_dias))
+    os.utime(ruta_nueva, (hace_40_dias, hace_40_dias))
+
+    # servir un PDF renueva su último uso
+    assert obtener_pdf(nuevo) == ruta_nueva
+    assert time.time() - os.stat(ruta_nueva).st_mtime < RENOVAR_USO_CADA
+
+    assert limpiar_cache_pdf(30) == 1
+    assert not os.path.exists(ruta_vieja) and os.path.exists(ruta_nueva)
+    assert limpiar_cache_pdf(30) == 0
+
+
+def test_comando_limpiar_pdf(app, usuarios):
+    r = app.test_cli_runner().invoke(args=["limpiar-pdf", "--dias", "1"])
+    assert r.exit_code == 0 and "0 PDF borrados" in r.output
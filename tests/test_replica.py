@@ -0,0 +1,96 @@
+import re
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from conftest import cerrar_app_prueba, crear_app_prueba, login, nueva_acta
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """Primario y réplica en dos archivos SQLite; la réplica sólo ve lo copiado con `sincronizar`."""
+    app = crear_app_prueba(tmp_path, monkeypatch, replica=tmp_path / "replica.db")
+    yield app
+    cerrar_app_prueba(app)
+
+
+def sincronizar(app):
+    """Copia el primario a la réplica (API de backup de SQLite: incluye lo que esté en el WAL)."""
+    from app import db
+    from app.replica import BIND_REPLICA
+
+    with app.app_context():
+        primario = db.engines[None].url.database
+        replica = db.engines[BIND_REPLICA]
+        replica.dispose()
+        origen, destino = sqlite3.connect(primario), sqlite3.connect(replica.url.database)
+        with destino:
+            origen.backup(destino)
+        origen.close()
+        destino.close()
+
+
+def _agregar_actas(app, usuario_id, desde, n):
+    from app import db
+
+    with app.app_context():
+        db.session.add_all(nueva_acta(usuario_id, i) for i in range(desde, desde + n))
+        db.session.commit()
+
+
+def test_listado_lee_de_la_replica_y_detalle_del_primario(app, client, usuarios):
+    from app import db
+    from app.models import Acta
+
+    _agregar_actas(app, usuarios["su"], 0, 3)
+    sincronizar(app)
+    _agregar_actas(app, usuarios["su"], 3, 2)  # aún no llegan a la réplica
+
+    login(client, "su")
+    html = client.get("/actas").get_data(as_text=True)
+    assert len(re.findall(r'name="ids" value="\d+"', html)) == 3
+
+    with app.app_context():
+        nueva = db.session.scalar(db.select(Acta.id).order_by(Acta.id.desc()).limit(1))
+    assert client.get(f"/actas/{nueva}").status_code == 200
+
+    sincronizar(app)
+    html = client.get("/actas").get_data(as_text=True)
+    assert len(re.findall(r'name="ids" value="\d+"', html)) == 5
+
+
+def test_replica_no_acepta_escrituras(app, usuarios):
+    from app import db
+    from app.replica import BIND_REPLICA
+
+    sincronizar(app)
+    with app.app_context(), pytest.raises(OperationalError):
+        with db.engines[BIND_REPLICA].begin() as conn:
+            conn.execute(db.text("DELETE FROM usuarios"))
+
+
+def test_cache_de_periodo_separado_por_bind(app, usuarios):
+    from flask import g
+    from app import db
+    from app.models import PeriodoRemunerativo
+
+    sincronizar(app)  # la réplica queda sin períodos
+    hoy = date.today()
+    with app.app_context():
+        db.session.add(PeriodoRemunerativo(anio=hoy.year, mes=hoy.month, fecha_inicio=hoy.replace(day=1),
+                                           fecha_corte=hoy + timedelta(days=20)))
+        db.session.commit()
+
+    # primero el primario llena el caché; la réplica no debe recibir ese resultado
+    with app.test_request_context("/"):
+        periodo, _ = PeriodoRemunerativo.periodo_vigente_para_fecha(hoy)
+        assert (periodo.anio, periodo.mes) == (hoy.year, hoy.month)
+    with app.test_request_context("/"):
+        g.usar_replica = True
+        assert PeriodoRemunerativo.periodo_vigente_para_fecha(hoy) == (None, False)
+    # y lo leído de la réplica atrasada tampoco se sirve al primario
+    with app.test_request_context("/"):
+        periodo, _ = PeriodoRemunerativo.periodo_vigente_para_fecha(hoy)
+        assert periodo is not None
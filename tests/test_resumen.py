@@ -0,0 +1,80 @@
+import pytest
+
+from conftest import login, nueva_acta
+
+
+def _resumen():
+    from app.models import ResumenActas
+
+    return {(r.periodo_mes, r.cesfam, r.estado): r.total for r in ResumenActas.query if r.total}
+
+
+def _recalculado():
+    from app import db
+    from app.models import recalcular_resumen
+
+    recalcular_resumen(db.session.connection())
+    return _resumen()
+
+
+@pytest.fixture
+def actas(app, usuarios):
+    from app import db
+
+    with app.app_context():
+        db.session.add_all([
+            nueva_acta(usuarios["ad"], 0),
+            nueva_acta(usuarios["ad"], 1),
+            nueva_acta(usuarios["ad"], 2, estado="enviado"),
+            nueva_acta(usuarios["otro"], 3, cesfam="CESFAM Guanaqueros", periodo_mes=2),
+        ])
+        db.session.commit()
+
+
+def test_insert_suma(app, ctx, actas):
+    assert _resumen() == {(1, "CESFAM Tongoy", "borrador"): 2, (1, "CESFAM Tongoy", "enviado"): 1,
+                          (2, "CESFAM Guanaqueros", "borrador"): 1}
+
+
+def test_update_mueve_entre_filas(app, ctx, actas):
+    from app import db
+    from app.models import Acta
+
+    acta = db.session.get(Acta, 1)
+    acta.estado = "cerrado"
+    db.session.commit()
+    acta.cesfam, acta.periodo_mes = "CESFAM Guanaqueros", 2
+    db.session.commit()
+    db.session.get(Acta, 2).observaciones = "sin cambio de clave"
+    db.session.commit()
+    esperado = {(1, "CESFAM Tongoy", "borrador"): 1, (1, "CESFAM Tongoy", "enviado"): 1,
+                (2, "CESFAM Guanaqueros", "borrador"): 1, (2, "CESFAM Guanaqueros", "cerrado"): 1}
+    assert _resumen() == esperado
+    assert _recalculado() == esperado
+
+
+def test_delete_resta(app, ctx, actas):
+    from app import db
+    from app.models import Acta
+
+    db.session.delete(db.session.get(Acta, 3))
+    db.session.delete(db.session.get(Acta, 4))
+    db.session.commit()
+    assert _resumen() == {(1, "CESFAM Tongoy", "borrador"): 2}
+
+
+def test_rollback_no_cuenta(app, ctx, actas, usuarios):
+    from app import db
+
+    antes = _resumen()
+    db.session.add(nueva_acta(usuarios["ad"], 9))
+    db.session.flush()
+    db.session.rollback()
+    assert _resumen() == antes
+
+
+def test_dashboard_lee_el_resumen(app, client, usuarios, actas):
+    login(client, "su")
+    html = client.get("/dashboard?periodo=2025-01").get_data(as_text=True)
+    assert "CESFAM Tongoy" in html and "CESFAM Guanaqueros" not in html
+    assert "2025-01" in html
@@ -0,0 +1,73 @@
+import re
+
+import pytest
+
+from conftest import login, nueva_acta
+
+
+@pytest.mark.parametrize("rut, esperado", [
+    ("12.345.678-5", "123456785"),
+    ("12345678-5", "123456785"),
+    ("123456785", "123456785"),
+    (" 9.876.543-k ", "9876543K"),
+    ("0012345678-5", "123456785"),
+    ("-", None),
+    ("5", None),
+    ("", None),
+    (None, None),
+])
+def test_normalizar_rut(rut, esperado):
+    from app.models import normalizar_rut
+
+    assert normalizar_rut(rut) == esperado
+
+
+def test_validates_llena_las_columnas_normalizadas(app, ctx, usuarios):
+    from app import db
+    from app.models import Acta
+
+    acta = nueva_acta(usuarios["ad"], rut="12.345.678-5", rut_titular_reemplazo="9.876.543-k")
+    db.session.add(acta)
+    db.session.commit()
+    assert (acta.rut_normalizado, acta.rut_titular_reemplazo_normalizado) == ("123456785", "9876543K")
+    acta.rut = "11.111.111-1"
+    db.session.commit()
+    assert db.session.get(Acta, acta.id).rut_normalizado == "111111111"
+
+
+@pytest.fixture
+def ruts(app, usuarios):
+    from app import db
+
+    with app.app_context():
+        for i, rut in enumerate(["12.345.678-5", "12.345.679-3", "1.234.567-4", "22.345.678-9"]):
+            db.session.add(nueva_acta(usuarios["su"], i, rut=rut))
+        db.session.commit()
+
+
+@pytest.mark.parametrize("texto, esperados", [
+    ("12.345.678-5", ["12.345.678-5"]),   # con guion: igualdad
+    ("12345678-5", ["12.345.678-5"]),
+    ("12.345.67", ["12.345.678-5", "12.345.679-3", "1.234.567-4"]),  # sin guion: prefijo (sin puntos)
+    ("12.345.678", ["12.345.678-5"]),
+    ("1234", ["1.234.567-4", "12.345.678-5", "12.345.679-3"]),
+    ("1234567-4", ["1.234.567-4"]),
+    ("99", []),
+])
+def test_filtro_rut(app, ctx, ruts, texto, esperados):
+    from app.models import Acta
+
+    q = Acta.query.filter(Acta.filtro_rut(Acta.rut_normalizado, texto))
+    assert sorted(a.rut for a in q) == sorted(esperados)
+
+
+def test_filtro_rut_vacio(app, ctx):
+    from app.models import Acta
+
+    assert Acta.filtro_rut(Acta.rut_normalizado, "-") is None
+
+
+def test_listado_filtra_por_rut(app, client, usuarios, ruts):
+    login(client, "su")
+    html = client.get("/actas?rut=2234").get_data(as_text=True)
+    assert re.findall(r'name="ids" value="(\d+)"', html) == ["4"]
@@ -0,0 +1,146 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+
+def _trabajo(app, usuario_id, **campos):
+    from app import db
+    from app.models import Trabajo
+
+    with app.app_context():
+        t = Trabajo(tipo="exportar_csv", parametros="{}", usuario_id=usuario_id, **campos)
+        db.session.add(t)
+        db.session.commit()
+        return t.id
+
+
+def _estado(app, tid):
+    from app import db
+    from app.models import Trabajo
+
+    with app.app_context():
+        return db.session.get(Trabajo, tid)
+
+
+def test_tomar_siguiente_reclama_en_orden(app, usuarios):
+    from app.trabajos import tomar_siguiente
+
+    primero = _trabajo(app, usuarios["su"])
+    segundo = _trabajo(app, usuarios["su"])
+    with app.app_context():
+        t = tomar_siguiente()
+        assert (t.id, t.estado, t.intentos) == (primero, "ejecutando", 1)
+        assert t.latido_en is not None and t.worker
+        assert tomar_siguiente().id == segundo
+        assert tomar_siguiente() is None
+
+
+def test_un_trabajo_lo_reclama_un_solo_hilo(app, usuarios):
+    from app.trabajos import tomar_siguiente
+
+    tid = _trabajo(app, usuarios["su"])
+    barrera = threading.Barrier(4)
+    tomados = []
+
+    def reclamar():
+        with app.app_context():
+            barrera.wait()
+            t = tomar_siguiente()
+            if t is not None:
+                tomados.append(t.id)
+
+    hilos = [threading.Thread(target=reclamar) for _ in range(4)]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+    assert tomados == [tid]
+
+
+def test_recupera_solo_los_que_no_laten(app, usuarios):
+    from app.trabajos import MAX_INTENTOS, recuperar_interrumpidos
+
+    hace_horas = datetime.utcnow() - timedelta(hours=3)
+    vivo = _trabajo(app, usuarios["su"], estado="ejecutando", iniciado_en=hace_horas,
+                    latido_en=datetime.utcnow(), intentos=1)
+    muerto = _trabajo(app, usuarios["su"], estado="ejecutando", iniciado_en=hace_horas,
+                      latido_en=hace_horas, intentos=1)
+    agotado = _trabajo(app, usuarios["su"], estado="ejecutando", iniciado_en=hace_horas,
+                       latido_en=hace_horas, intentos=MAX_INTENTOS)
+
+    with app.app_context():
+        assert recuperar_interrumpidos(timeout=300) == 2
+    assert _estado(app, vivo).estado == "ejecutando"
+    assert _estado(app, muerto).estado == "pendiente"
+    assert _estado(app, agotado).estado == "error"
+
+
+def test_el_latido_se_renueva_mientras_corre(app, usuarios, monkeypatch):
+    from app import db, trabajos
+    from app.models import Trabajo
+
+    monkeypatch.setattr(trabajos, "LATIDO_CADA", 0.05)
+    latidos = []
+
+    def lento(trabajo, _params, _avance):
+        for _ in range(3):
+            with db.engine.connect() as conn:
+                latidos.append(conn.scalar(db.select(Trabajo.latido_en).where(Trabajo.id == trabajo.id)))
+            time.sleep(0.2)
+        return None, None, None, "ok"
+
+    monkeypatch.setitem(trabajos.TIPOS, "lento", lento)
+    with app.app_context():
+        trabajos.encolar("lento", {}, usuarios["su"])
+        t = trabajos.tomar_siguiente()
+        trabajos.ejecutar(t)
+        tid = t.id
+    assert latidos == sorted(latidos) and len(set(latidos)) == 3
+    assert _estado(app, tid).estado == "listo"
+
+
+def test_aviso_despierta_a_todos_y_no_se_pierde():
+    from app.trabajos import _Aviso
+
+    aviso = _Aviso()
+    desde = aviso.generacion
+    despiertos = []
+
+    def esperar():
+        inicio = time.monotonic()
+        aviso.esperar(desde, timeout=5)
+        despiertos.append(time.monotonic() - inicio)
+
+    hilos = [threading.Thread(target=esperar) for _ in range(3)]
+    for h in hilos:
+        h.start()
+    time.sleep(0.05)
+    aviso.avisar()
+    for h in hilos:
+        h.join()
+    assert len(despiertos) == 3 and max(despiertos) < 1
+
+    # un aviso que llegó antes de empezar a esperar (mientras se revisaba la cola) no se pierde
+    inicio = time.monotonic()
+    aviso.esperar(desde, timeout=5)
+    assert time.monotonic() - inicio < 1
+
+
+def test_worker_toma_lo_encolado_sin_esperar_el_intervalo(app, usuarios):
+    from app.trabajos import _aviso, bucle_worker, encolar
+
+    detener = threading.Event()
+    hilo = threading.Thread(target=bucle_worker, args=(app, 30, detener), daemon=True)
+    hilo.start()
+    time.sleep(0.2)  # el worker ya revisó la cola vacía y espera
+    with app.app_context():
+        tid = encolar("exportar_csv", {}, usuarios["su"]).id
+
+    limite = time.monotonic() + 10
+    while _estado(app, tid).estado != "listo" and time.monotonic() < limite:
+        time.sleep(0.05)
+    detener.set()
+    _aviso.avisar()
+    hilo.join(5)
+    assert _estado(app, tid).estado == "listo"
+    assert not hilo.is_alive()
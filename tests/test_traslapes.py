@@ -0,0 +1,82 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from conftest import nueva_acta
+
+
+@pytest.fixture
+def contratos(app, usuarios):
+    """Funcionario 12.345.678-5: marzo y mayo de 2025; y un reemplazo del titular 9.876.543-2 en abril."""
+    from app import db
+
+    with app.app_context():
+        db.session.add_all([
+            nueva_acta(usuarios["ad"], 0, rut="12.345.678-5", fecha_inicio_contratacion=date(2025, 3, 1),
+                       fecha_termino_contratacion=date(2025, 3, 31)),
+            nueva_acta(usuarios["ad"], 1, rut="12345678-5", fecha_inicio_contratacion=date(2025, 5, 1),
+                       fecha_termino_contratacion=date(2025, 5, 31)),
+            nueva_acta(usuarios["ad"], 2, rut="11.111.111-1", tipo_contrato="Reemplazo",
+                       rut_titular_reemplazo="9.876.543-2", fecha_inicio_contratacion=date(2025, 4, 1),
+                       fecha_termino_contratacion=date(2025, 4, 30)),
+            nueva_acta(usuarios["ad"], 3, rut="22.222.222-2", fecha_inicio_contratacion=date(2024, 1, 1),
+                       fecha_termino_contratacion=None),  # indefinido: se cruza con todo lo posterior
+        ])
+        db.session.commit()
+
+
+def _ids(actas):
+    return [a.id for a in actas]
+
+
+@pytest.mark.parametrize("inicio, termino, esperados", [
+    (date(2025, 3, 15), date(2025, 4, 15), [1]),
+    (date(2025, 3, 31), date(2025, 5, 1), [1, 2]),   # los bordes cuentan
+    (date(2025, 4, 1), date(2025, 4, 30), []),
+    (date(2025, 5, 15), None, [2]),                  # sin término: desde el inicio en adelante
+    (date(2025, 1, 1), date(2025, 2, 28), []),
+])
+def test_mismo_rut_por_fechas(app, ctx, contratos, inicio, termino, esperados):
+    from app.models import Acta
+
+    assert _ids(Acta.traslapes(Acta.rut_normalizado, "123456785", inicio, termino)) == esperados
+
+
+def test_excluir_la_propia_y_sin_datos(app, ctx, contratos):
+    from app.models import Acta
+
+    assert _ids(Acta.traslapes(Acta.rut_normalizado, "12.345.678-5", date(2025, 3, 10), date(2025, 3, 20),
+                               excluir_id=1)) == []
+    assert Acta.traslapes(Acta.rut_normalizado, None, date(2025, 3, 1), None) == []
+    assert Acta.traslapes(Acta.rut_normalizado, "12.345.678-5", None, None) == []
+
+
+def test_contrato_indefinido_se_cruza(app, ctx, contratos):
+    from app.models import Acta
+
+    assert _ids(Acta.traslapes(Acta.rut_normalizado, "22222222-2", date(2030, 1, 1), date(2030, 2, 1))) == [4]
+
+
+def test_avisos_funcionario_y_titular(app, ctx, contratos):
+    from app.models import Acta
+
+    avisos = Acta.avisos_traslape("12.345.678-5", "9876543-2", date(2025, 3, 20), date(2025, 4, 10))
+    assert len(avisos) == 2
+    assert "acta #1" in avisos[0]
+    assert avisos[1].startswith("El titular 9876543-2") and "acta #3" in avisos[1]
+
+
+def test_planilla_contra_si_misma_y_contra_la_bd(app, ctx, contratos):
+    from app.importar import advertencias_traslape
+
+    validas = pd.DataFrame({
+        "rut": ["5.555.555-5", "5555555-5", "12.345.678-5", "7.777.777-7"],
+        "rut_titular_reemplazo": [None, None, None, None],
+        "fecha_inicio_contratacion": [date(2025, 6, 1), date(2025, 6, 15), date(2025, 5, 20), date(2025, 6, 1)],
+        "fecha_termino_contratacion": [date(2025, 6, 30), date(2025, 7, 15), date(2025, 6, 10), date(2025, 6, 30)],
+    })
+    avisos = {a["fila"]: a["errores"] for a in advertencias_traslape(validas)}
+    assert set(avisos) == {3, 4}  # filas de Excel (encabezado = fila 1)
+    assert avisos[3] == ["Se cruza con otra fila de la planilla con el mismo RUT."]
+    assert "acta #2" in avisos[4][0]